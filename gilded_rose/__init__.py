@@ -2,6 +2,7 @@
 
 from gilded_rose.core import GildedRose
 from gilded_rose.models import Item
+from gilded_rose.validated import ValidatedItems
 
 __version__ = "0.1.0"
-__all__ = ["GildedRose", "Item"]
+__all__ = ["GildedRose", "Item", "ValidatedItems"]
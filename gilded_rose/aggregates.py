@@ -0,0 +1,145 @@
+"""Agregados del inventario mantenidos de forma incremental.
+
+InventoryAggregates lleva los totales que consultan los tableros (calidad por
+categoría, items vencidos, items en la calidad máxima y Backstage passes cuyo
+concierto ya pasó). GildedRose los actualiza item por item dentro de
+update_quality y al agregar o quitar items (ver GildedRose.enable_aggregates),
+de modo que leerlos cuesta O(1) en lugar de recorrer todo el inventario.
+
+Sulfuras suma a la calidad de su categoría y a la cantidad de items, pero no
+cuenta como vencido ni como item en la calidad máxima: su calidad de 80 y su
+sell_in no cambian nunca.
+"""
+
+from collections.abc import Callable, Iterable
+
+from gilded_rose.categories import ItemCategory, classify
+from gilded_rose.constants import MAX_QUALITY, MIN_SELL_IN
+from gilded_rose.models import Item
+
+
+class InventoryAggregates:
+    """Totales del inventario con lectura en O(1)."""
+
+    def __init__(self, items: Iterable[Item] = (), debug: bool = False) -> None:
+        """Calcula los totales iniciales.
+
+        Args:
+            items (Iterable[Item]): Items con los que se inicializan los totales.
+            debug (bool): Si es True, GildedRose compara los totales con un
+                recálculo completo luego de cada operación (ver verify).
+
+        """
+        self.debug = debug
+        self.reset(items)
+
+    def reset(self, items: Iterable[Item]) -> None:
+        """Recalcula los totales desde cero.
+
+        Args:
+            items (Iterable[Item]): Inventario completo.
+
+        """
+        self._item_count = 0
+        self._quality = dict.fromkeys(ItemCategory, 0)
+        self._expired = 0
+        self._at_max_quality = 0
+        self._worthless_backstage = 0
+        for item in items:
+            self.add(item)
+
+    @property
+    def item_count(self) -> int:
+        """Cantidad de items."""
+        return self._item_count
+
+    @property
+    def quality_by_category(self) -> dict[ItemCategory, int]:
+        """Suma de la calidad de los items de cada categoría."""
+        return dict(self._quality)
+
+    @property
+    def total_quality(self) -> int:
+        """Suma de la calidad de todos los items."""
+        return sum(self._quality.values())
+
+    @property
+    def expired(self) -> int:
+        """Items con sell_in negativo (sin contar Sulfuras)."""
+        return self._expired
+
+    @property
+    def at_max_quality(self) -> int:
+        """Items con calidad MAX_QUALITY o mayor (sin contar Sulfuras)."""
+        return self._at_max_quality
+
+    @property
+    def worthless_backstage_passes(self) -> int:
+        """Backstage passes cuyo concierto ya pasó."""
+        return self._worthless_backstage
+
+    def _apply(self, category: ItemCategory, item: Item, sign: int) -> None:
+        """Suma (sign=1) o resta (sign=-1) el aporte de un item a los totales."""
+        self._quality[category] += sign * item.quality
+        if category is ItemCategory.SULFURAS:
+            return
+        if item.sell_in < MIN_SELL_IN:
+            self._expired += sign
+            if category is ItemCategory.BACKSTAGE_PASSES:
+                self._worthless_backstage += sign
+        if item.quality >= MAX_QUALITY:
+            self._at_max_quality += sign
+
+    def add(self, item: Item) -> None:
+        """Suma el aporte de un item nuevo."""
+        self._item_count += 1
+        self._apply(classify(item.name), item, 1)
+
+    def remove(self, item: Item) -> None:
+        """Resta el aporte de un item que sale del inventario."""
+        self._item_count -= 1
+        self._apply(classify(item.name), item, -1)
+
+    def wrap_update(
+        self, category: ItemCategory, update: Callable[[Item], None]
+    ) -> Callable[[Item], None]:
+        """Envuelve la regla de una categoría para ajustar los totales al aplicarla.
+
+        Args:
+            category (ItemCategory): Categoría de los items que recibe update.
+            update (Callable): Regla de actualización de un item.
+
+        """
+        apply = self._apply
+
+        def tracked(item: Item) -> None:
+            apply(category, item, -1)
+            update(item)
+            apply(category, item, 1)
+
+        return tracked
+
+    def snapshot(self) -> dict[str, object]:
+        """Todos los totales en un diccionario."""
+        return {
+            "item_count": self.item_count,
+            "quality_by_category": self.quality_by_category,
+            "expired": self.expired,
+            "at_max_quality": self.at_max_quality,
+            "worthless_backstage_passes": self.worthless_backstage_passes,
+        }
+
+    def verify(self, items: Iterable[Item]) -> None:
+        """Compara los totales con un recálculo completo; lanza RuntimeError si difieren.
+
+        Args:
+            items (Iterable[Item]): Inventario completo.
+
+        """
+        expected = InventoryAggregates(items).snapshot()
+        actual = self.snapshot()
+        if actual != expected:
+            differences = {
+                key: (actual[key], expected[key]) for key in actual if actual[key] != expected[key]
+            }
+            raise RuntimeError(f"Agregados incrementales inconsistentes: {differences}")
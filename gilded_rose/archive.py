@@ -0,0 +1,415 @@
+"""Archivo comprimido de una simulación de varios días, con acceso a cualquier día.
+
+Los reportes día por día (como el de scripts/texttest_fixture.py) repiten el
+texto completo de cada item en cada día. El archivo guarda el día 0 completo y
+cada día siguiente como la diferencia con el anterior, columna por columna y
+comprimida por rachas (RLE): sell_in baja 1 en casi todos los items y la
+calidad cambia en unos pocos valores, así que un día suele ocupar unas pocas
+rachas en lugar de una fila por item.
+
+Estructura del archivo (little-endian):
+
+- Encabezado (HEADER): MAGIC, versión (uint16), reservado (uint16), cantidad
+  de items (uint32), cantidad de nombres (uint32) e intervalo entre días
+  completos (uint32).
+- Diccionario de nombres: longitud (uint32) y nombre en UTF-8, por nombre.
+- Columna de ids de nombre (uint32 por item).
+- Un bloque por día: tipo (FULL_FRAME o DELTA_FRAME, uint8) y dos columnas
+  RLE (sell_in y quality). Cada columna RLE es la cantidad de rachas (uint32),
+  los valores (int32) y los largos (uint32). Cada keyframe_interval días se
+  guarda un día completo, para acotar el costo de acceder a un día al azar;
+  también se guarda completo un día cuya diferencia no entra en int32.
+- Índice: la posición de cada bloque (uint64 por día) y el pie (FOOTER) con la
+  posición del índice, la cantidad de días y END_MAGIC.
+"""
+
+import mmap
+import operator
+import struct
+from array import array
+from collections.abc import Iterable, Iterator
+from itertools import chain, groupby, repeat
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, TextIO
+
+from gilded_rose.binary_store import INT32_MAX, INT32_MIN
+from gilded_rose.core import GildedRose
+from gilded_rose.models import Item
+from gilded_rose.validated import check_item_types
+
+MAGIC = b"GRAR"
+END_MAGIC = b"GRAE"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIII")
+FOOTER = struct.Struct("<QI4s")
+NAME_LENGTH = struct.Struct("<I")
+FRAME_KIND = struct.Struct("<B")
+RUN_COUNT = struct.Struct("<I")
+FULL_FRAME = 0
+DELTA_FRAME = 1
+VALUE_TYPECODE = "i"
+LENGTH_TYPECODE = "I"
+OFFSET_TYPECODE = "Q"
+DEFAULT_KEYFRAME_INTERVAL = 64
+
+DAY_HEADER = "-------- day %s --------"
+COLUMNS_HEADER = "name, sellIn, quality"
+BANNER = "OMGHAI!"
+
+
+def encode_runs(values: Iterable[int]) -> bytes:
+    """Comprime una columna de enteros en rachas (valor, largo).
+
+    Args:
+        values (Iterable[int]): Valores de la columna.
+
+    """
+    run_values = array(VALUE_TYPECODE)
+    run_lengths = array(LENGTH_TYPECODE)
+    for value, run in groupby(values):
+        run_values.append(value)
+        run_lengths.append(sum(1 for _ in run))
+    return RUN_COUNT.pack(len(run_values)) + run_values.tobytes() + run_lengths.tobytes()
+
+
+def decode_runs(buffer: bytes | mmap.mmap, offset: int = 0) -> tuple[array, int]:
+    """Expande una columna RLE; devuelve la columna y la posición siguiente.
+
+    Args:
+        buffer (bytes | mmap.mmap): Datos del archivo.
+        offset (int): Posición de la columna dentro de buffer.
+
+    """
+    (count,) = RUN_COUNT.unpack_from(buffer, offset)
+    offset += RUN_COUNT.size
+    run_values = array(VALUE_TYPECODE)
+    run_values.frombytes(buffer[offset : offset + count * run_values.itemsize])
+    offset += count * run_values.itemsize
+    run_lengths = array(LENGTH_TYPECODE)
+    run_lengths.frombytes(buffer[offset : offset + count * run_lengths.itemsize])
+    offset += count * run_lengths.itemsize
+    expanded = chain.from_iterable(map(repeat, run_values, run_lengths))
+    return array(VALUE_TYPECODE, expanded), offset
+
+
+def _difference(new: array, old: array) -> Iterator[int]:
+    return map(operator.sub, new, old)
+
+
+def _int32_columns(items: list[Item]) -> tuple[array, array]:
+    """Columnas (sell_in, quality); lanza ValueError si algún valor no entra en int32."""
+    try:
+        return (
+            array(VALUE_TYPECODE, (item.sell_in for item in items)),
+            array(VALUE_TYPECODE, (item.quality for item in items)),
+        )
+    except OverflowError:
+        for position, item in enumerate(items):
+            for field in ("sell_in", "quality"):
+                value = getattr(item, field)
+                if not INT32_MIN <= value <= INT32_MAX:
+                    raise ValueError(
+                        f"{field} del item {position} ({item.name!r}) "
+                        f"fuera del rango de int32: {value}"
+                    ) from None
+        raise
+
+
+def _apply(old: array, delta: array) -> array:
+    return array(VALUE_TYPECODE, map(operator.add, old, delta))
+
+
+class ArchiveWriter:
+    """Escribe un archivo de días, uno a la vez, sin guardar los días previos en memoria."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        items: Iterable[Item],
+        keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+    ) -> None:
+        """Crea el archivo y escribe el día 0 a partir de `items`.
+
+        Args:
+            path (str | Path): Archivo a crear.
+            items (Iterable[Item]): Estado del día 0; define el orden y los nombres.
+            keyframe_interval (int): Días entre días completos.
+
+        """
+        if keyframe_interval < 1:
+            raise ValueError("El intervalo entre días completos debe ser positivo")
+        items = list(items)
+        check_item_types(items)
+        self._interval = keyframe_interval
+        self._names = [item.name for item in items]
+        self._offsets = array(OFFSET_TYPECODE)
+        self._previous: tuple[array, array] | None = None
+        self._stream: BinaryIO | None = open(path, "wb")
+        try:
+            self._write_header()
+            self.append(items)
+        except BaseException:
+            self._stream.close()
+            raise
+
+    def _write_header(self) -> None:
+        name_ids: dict[str, int] = {}
+        ids = array(LENGTH_TYPECODE, (name_ids.setdefault(n, len(name_ids)) for n in self._names))
+        encoded = [name.encode("utf-8") for name in name_ids]
+        self._stream.write(
+            HEADER.pack(MAGIC, VERSION, 0, len(self._names), len(encoded), self._interval)
+        )
+        self._stream.write(b"".join(NAME_LENGTH.pack(len(name)) + name for name in encoded))
+        self._stream.write(ids.tobytes())
+
+    @property
+    def days(self) -> int:
+        """Cantidad de días escritos, contando el día 0."""
+        return len(self._offsets)
+
+    def append(self, items: Iterable[Item]) -> None:
+        """Agrega el estado del día siguiente.
+
+        Args:
+            items (Iterable[Item]): Items en el mismo orden y con los mismos nombres
+                que el día 0.
+
+        """
+        if self._stream is None:
+            raise ValueError("El archivo ya está cerrado")
+        items = list(items)
+        if [item.name for item in items] != self._names:
+            raise ValueError("Los items deben tener los mismos nombres y orden que el día 0")
+        sell_in, quality = _int32_columns(items)
+
+        self._offsets.append(self._stream.tell())
+        columns, kind = (sell_in, quality), FULL_FRAME
+        if self._previous is not None and (self.days - 1) % self._interval != 0:
+            previous_sell_in, previous_quality = self._previous
+            try:
+                columns = (
+                    array(VALUE_TYPECODE, _difference(sell_in, previous_sell_in)),
+                    array(VALUE_TYPECODE, _difference(quality, previous_quality)),
+                )
+                kind = DELTA_FRAME
+            except OverflowError:
+                pass  # la diferencia no entra en int32: se guarda el día completo
+        self._stream.write(FRAME_KIND.pack(kind))
+        for column in columns:
+            self._stream.write(encode_runs(column))
+        self._previous = (sell_in, quality)
+
+    def close(self) -> None:
+        """Escribe el índice de días y cierra el archivo. Puede llamarse más de una vez."""
+        if self._stream is None:
+            return
+        index_offset = self._stream.tell()
+        self._stream.write(self._offsets.tobytes())
+        self._stream.write(FOOTER.pack(index_offset, self.days, END_MAGIC))
+        self._stream.close()
+        self._stream = None
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def record_simulation(
+    path: str | Path,
+    items: Iterable[Item],
+    days: int,
+    keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+) -> None:
+    """Simula `days` días con GildedRose y guarda los días 0..days en un archivo.
+
+    Args:
+        path (str | Path): Archivo a crear.
+        items (Iterable[Item]): Inventario inicial; no se modifica.
+        days (int): Último día a guardar.
+        keyframe_interval (int): Días entre días completos.
+
+    """
+    items = [Item(item.name, item.sell_in, item.quality) for item in items]
+    gilded_rose = GildedRose(items, track_settled=True)
+    with ArchiveWriter(path, items, keyframe_interval) as writer:
+        for _ in range(days):
+            gilded_rose.update_quality()
+            writer.append(gilded_rose.items)
+
+
+class SnapshotArchive:
+    """Lector de un archivo de días con acceso a cualquier día y render en streaming.
+
+    El archivo se accede con mmap: sólo se leen los bloques de los días pedidos.
+    Debe cerrarse con close() (o usarse como context manager).
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Lee el encabezado, los nombres y el índice de días.
+
+        Args:
+            path (str | Path): Archivo a leer.
+
+        """
+        with open(path, "rb") as stream:
+            size = stream.seek(0, 2)
+            if size < HEADER.size + FOOTER.size:
+                raise ValueError("El archivo es demasiado corto para ser un archivo de días")
+            self._data = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._load_metadata()
+        except BaseException:
+            self.close()
+            raise
+
+    def _load_metadata(self) -> None:
+        data = self._data
+        magic, version, _, count, name_count, interval = HEADER.unpack_from(data, 0)
+        index_offset, days, end_magic = FOOTER.unpack_from(data, len(data) - FOOTER.size)
+        if magic != MAGIC or end_magic != END_MAGIC:
+            raise ValueError("El archivo no es un archivo de días (¿quedó sin cerrar?)")
+        if version != VERSION:
+            raise ValueError(f"Versión no soportada: {version}")
+
+        offset = HEADER.size
+        names = []
+        for _ in range(name_count):
+            (length,) = NAME_LENGTH.unpack_from(data, offset)
+            offset += NAME_LENGTH.size
+            names.append(data[offset : offset + length].decode("utf-8"))
+            offset += length
+        ids = array(LENGTH_TYPECODE)
+        ids.frombytes(data[offset : offset + count * ids.itemsize])
+        self._names = [names[name_id] for name_id in ids]
+        self._interval = interval
+        self._offsets = array(OFFSET_TYPECODE)
+        self._offsets.frombytes(data[index_offset : index_offset + days * self._offsets.itemsize])
+
+    @property
+    def days(self) -> int:
+        """Cantidad de días guardados, contando el día 0."""
+        return len(self._offsets)
+
+    @property
+    def names(self) -> list[str]:
+        """Nombres de los items, en el orden original."""
+        return list(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def nbytes(self) -> int:
+        """Tamaño del archivo en bytes."""
+        return len(self._data)
+
+    def close(self) -> None:
+        """Libera el mmap. Puede llamarse más de una vez."""
+        if not self._data.closed:
+            self._data.close()
+
+    def __enter__(self) -> "SnapshotArchive":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _frame(self, day: int) -> tuple[int, array, array]:
+        """Tipo y columnas (valores o diferencias) del bloque de `day`."""
+        offset = self._offsets[day]
+        (kind,) = FRAME_KIND.unpack_from(self._data, offset)
+        sell_in, offset = decode_runs(self._data, offset + FRAME_KIND.size)
+        quality, _ = decode_runs(self._data, offset)
+        return kind, sell_in, quality
+
+    def _check_day(self, day: int) -> None:
+        if not 0 <= day < self.days:
+            raise ValueError(f"El día {day} está fuera del archivo (0..{self.days - 1})")
+
+    def iter_days(
+        self, start: int = 0, stop: int | None = None
+    ) -> Iterator[tuple[int, array, array]]:
+        """Recorre los días de start a stop (incluido) como (día, sell_in, quality).
+
+        Parte del día completo más cercano anterior a start y aplica las
+        diferencias de a un día, sin cargar más de un día en memoria.
+
+        Args:
+            start (int): Primer día.
+            stop (int | None): Último día; por defecto, el último guardado.
+
+        """
+        stop = self.days - 1 if stop is None else stop
+        self._check_day(start)
+        self._check_day(stop)
+        if stop < start:
+            raise ValueError("El último día no puede ser anterior al primero")
+        sell_in = quality = array(VALUE_TYPECODE)
+        for day in range(start - start % self._interval, stop + 1):
+            kind, sell_in_column, quality_column = self._frame(day)
+            if kind == FULL_FRAME:
+                sell_in, quality = sell_in_column, quality_column
+            else:
+                sell_in = _apply(sell_in, sell_in_column)
+                quality = _apply(quality, quality_column)
+            if day >= start:
+                yield day, sell_in, quality
+
+    def columns_at(self, day: int) -> tuple[array, array]:
+        """Columnas (sell_in, quality) de un día, en a lo sumo keyframe_interval pasos.
+
+        Args:
+            day (int): Día a leer.
+
+        """
+        _, sell_in, quality = next(self.iter_days(day, day))
+        return sell_in, quality
+
+    def items_at(self, day: int) -> list[Item]:
+        """Estado de un día como Item nuevos.
+
+        Args:
+            day (int): Día a leer.
+
+        """
+        sell_in, quality = self.columns_at(day)
+        return [Item(*row) for row in zip(self._names, sell_in, quality, strict=True)]
+
+    def render(
+        self, out: TextIO, start: int = 0, stop: int | None = None, banner: bool = True
+    ) -> None:
+        """Escribe los días como el reporte de scripts/texttest_fixture.py, día por día.
+
+        Args:
+            out (TextIO): Destino del texto.
+            start (int): Primer día.
+            stop (int | None): Último día; por defecto, el último guardado.
+            banner (bool): Si es True, comienza con la línea BANNER como el fixture.
+
+        """
+        if banner:
+            out.write(BANNER + "\n")
+        for day, sell_in, quality in self.iter_days(start, stop):
+            if day > start:
+                out.write("\n")
+            lines = [DAY_HEADER % day, COLUMNS_HEADER]
+            lines.extend(
+                f"{name}, {row_sell_in}, {row_quality}"
+                for name, row_sell_in, row_quality in zip(
+                    self._names, sell_in, quality, strict=True
+                )
+            )
+            lines.append("")
+            out.write("\n".join(lines))
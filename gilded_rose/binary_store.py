@@ -0,0 +1,206 @@
+"""Formato binario de inventario y motor que lo actualiza en el lugar con mmap.
+
+Estructura del archivo (little-endian):
+
+- Encabezado de HEADER_SIZE bytes: MAGIC, versión (uint16), reservado (uint16),
+  cantidad de items (uint64), cantidad de nombres (uint32) y tamaño en bytes
+  del diccionario de nombres (uint32).
+- Diccionario de nombres: por cada nombre distinto, su longitud en bytes
+  (uint32) seguida del nombre en UTF-8. Se rellena hasta múltiplo de 8 bytes.
+- Tres columnas int32 de longitud igual a la cantidad de items: id de nombre,
+  sell_in y quality.
+
+MappedInventory sólo lee el encabezado y el diccionario al abrir el archivo; las
+columnas se acceden a través del mmap, de modo que abrir es casi instantáneo y
+un día de actualización escribe sólo las páginas que cambian.
+"""
+
+import mmap
+import struct
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+from types import TracebackType
+
+from gilded_rose.compact import update_columns
+from gilded_rose.models import Item
+from gilded_rose.validated import check_item_types
+
+MAGIC = b"GRIB"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQII")
+HEADER_SIZE = HEADER.size
+NAME_LENGTH = struct.Struct("<I")
+COLUMN_TYPECODE = "i"
+COLUMN_ITEMSIZE = 4
+INT32_MIN, INT32_MAX = -(2**31), 2**31 - 1
+ALIGNMENT = 8
+
+
+def _padded(size: int) -> int:
+    return -(-size // ALIGNMENT) * ALIGNMENT
+
+
+def _check_int32(value: int, field: str) -> None:
+    if not INT32_MIN <= value <= INT32_MAX:
+        raise ValueError(f"{field} fuera del rango de int32: {value}")
+
+
+def encode_items(items: Iterable[Item]) -> bytes:
+    """Codifica una lista de Item en el formato binario.
+
+    Args:
+        items (Iterable[Item]): Items a codificar.
+
+    """
+    items = list(items)
+    check_item_types(items)
+    name_ids: dict[str, int] = {}
+    columns = [[], [], []]
+    for item in items:
+        _check_int32(item.sell_in, "sell_in")
+        _check_int32(item.quality, "quality")
+        columns[0].append(name_ids.setdefault(item.name, len(name_ids)))
+        columns[1].append(item.sell_in)
+        columns[2].append(item.quality)
+
+    names = b"".join(
+        NAME_LENGTH.pack(len(encoded)) + encoded
+        for encoded in (name.encode("utf-8") for name in name_ids)
+    )
+    padding = b"\0" * (_padded(len(names)) - len(names))
+    header = HEADER.pack(MAGIC, VERSION, 0, len(items), len(name_ids), len(names))
+    column_format = f"<{len(items)}i"
+    return b"".join(
+        [header, names, padding, *(struct.pack(column_format, *column) for column in columns)]
+    )
+
+
+def write_items(items: Iterable[Item], path: str | Path) -> None:
+    """Escribe una lista de Item en un archivo binario.
+
+    Args:
+        items (Iterable[Item]): Items a escribir.
+        path (str | Path): Archivo de destino.
+
+    """
+    Path(path).write_bytes(encode_items(items))
+
+
+def read_items(path: str | Path) -> list[Item]:
+    """Lee un archivo binario completo como una lista de Item nuevos.
+
+    Args:
+        path (str | Path): Archivo a leer.
+
+    """
+    with MappedInventory(path, writable=False) as inventory:
+        return inventory.to_items()
+
+
+class MappedInventory:
+    """Inventario binario abierto con mmap y actualizado en el lugar."""
+
+    def __init__(self, path: str | Path, writable: bool = True) -> None:
+        """Abre el archivo y lee el encabezado y el diccionario de nombres.
+
+        Args:
+            path (str | Path): Archivo en el formato binario.
+            writable (bool): Si es False el archivo se abre de sólo lectura.
+
+        """
+        if sys.byteorder != "little":
+            raise RuntimeError("MappedInventory requiere una plataforma little-endian")
+        # El mapeo sigue siendo válido después de cerrar el archivo.
+        with open(path, "r+b" if writable else "rb") as stream:
+            access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+            self._mmap = mmap.mmap(stream.fileno(), 0, access=access)
+        try:
+            self._names, columns_offset = self._read_header()
+        except Exception:
+            self._mmap.close()
+            raise
+        self._writable = writable
+        view = memoryview(self._mmap)
+        size = self._count * COLUMN_ITEMSIZE
+        self.name_ids, self.sell_in, self.quality = (
+            view[start : start + size].cast(COLUMN_TYPECODE)
+            for start in (columns_offset, columns_offset + size, columns_offset + 2 * size)
+        )
+        view.release()
+
+    def _read_header(self) -> tuple[list[str], int]:
+        """Valida el encabezado y decodifica el diccionario de nombres."""
+        if len(self._mmap) < HEADER_SIZE:
+            raise ValueError("Archivo demasiado corto para ser un inventario binario")
+        magic, version, _, count, name_count, names_size = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ValueError("El archivo no es un inventario binario")
+        if version != VERSION:
+            raise ValueError(f"Versión de formato no soportada: {version}")
+        columns_offset = HEADER_SIZE + _padded(names_size)
+        if len(self._mmap) != columns_offset + 3 * count * COLUMN_ITEMSIZE:
+            raise ValueError("El tamaño del archivo no coincide con el encabezado")
+
+        names = []
+        offset = HEADER_SIZE
+        for _ in range(name_count):
+            (length,) = NAME_LENGTH.unpack_from(self._mmap, offset)
+            offset += NAME_LENGTH.size
+            names.append(self._mmap[offset : offset + length].decode("utf-8"))
+            offset += length
+        self._count = count
+        return names, columns_offset
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Diccionario de nombres del archivo."""
+        return tuple(self._names)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Item:
+        """Copia de la fila `index` como un Item nuevo."""
+        return Item(self._names[self.name_ids[index]], self.sell_in[index], self.quality[index])
+
+    def to_items(self) -> list[Item]:
+        """Copia todas las filas a una lista de Item nuevos."""
+        names = self._names
+        return [
+            Item(names[name_id], sell_in, quality)
+            for name_id, sell_in, quality in zip(
+                self.name_ids.tolist(), self.sell_in.tolist(), self.quality.tolist(), strict=True
+            )
+        ]
+
+    def update_quality(self) -> None:
+        """Aplica un día de las reglas directamente sobre el archivo mapeado."""
+        if not self._writable:
+            raise ValueError("El inventario se abrió como sólo lectura")
+        update_columns(self._names, self.name_ids, self.sell_in, self.quality)
+
+    def flush(self) -> None:
+        """Fuerza la escritura de las páginas modificadas al archivo."""
+        if self._writable:
+            self._mmap.flush()
+
+    def close(self) -> None:
+        """Libera las vistas y el mmap."""
+        if self._mmap.closed:
+            return
+        for column in (self.name_ids, self.sell_in, self.quality):
+            column.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "MappedInventory":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.flush()
+        self.close()
@@ -0,0 +1,41 @@
+"""Clasificación de items según la regla de actualización que les corresponde."""
+
+from enum import IntEnum
+from functools import lru_cache
+
+from gilded_rose.constants import AGED_BRIE, BACKSTAGE_PASSES, CONJURED_PREFIX, SULFURAS
+
+CLASSIFY_CACHE_SIZE = 4096
+
+
+class ItemCategory(IntEnum):
+    """Categorías de items con reglas de actualización propias."""
+
+    NORMAL = 0
+    AGED_BRIE = 1
+    BACKSTAGE_PASSES = 2
+    SULFURAS = 3
+    CONJURED = 4
+
+
+@lru_cache(maxsize=CLASSIFY_CACHE_SIZE)
+def classify(name: str) -> ItemCategory:
+    """Devuelve la categoría de un item a partir de su nombre.
+
+    El resultado se memoriza por nombre: un inventario grande con pocos nombres
+    distintos paga la clasificación una sola vez por nombre.
+    Precedencia: Sulfuras, Aged Brie, Backstage passes, conjurados, normales.
+
+    Args:
+        name (str): Nombre del item.
+
+    """
+    if name == SULFURAS:
+        return ItemCategory.SULFURAS
+    if name == AGED_BRIE:
+        return ItemCategory.AGED_BRIE
+    if name == BACKSTAGE_PASSES:
+        return ItemCategory.BACKSTAGE_PASSES
+    if name.lower().startswith(CONJURED_PREFIX):
+        return ItemCategory.CONJURED
+    return ItemCategory.NORMAL
@@ -0,0 +1,26 @@
+"""Registros compactos de los cambios producidos por un día de actualización."""
+
+from typing import NamedTuple
+
+
+class ItemChange(NamedTuple):
+    """Cambio de un item durante update_quality_with_changes.
+
+    Attributes:
+        index (int): Posición del item en la lista gestionada.
+        old_sell_in (int): sell_in antes del día.
+        new_sell_in (int): sell_in después del día.
+        old_quality (int): Calidad antes del día.
+        new_quality (int): Calidad después del día.
+        crossed_expiry (bool): True si el item venció en este día.
+        clamped (bool): True si la calidad quedó acotada en MIN_QUALITY o MAX_QUALITY.
+
+    """
+
+    index: int
+    old_sell_in: int
+    new_sell_in: int
+    old_quality: int
+    new_quality: int
+    crossed_expiry: bool
+    clamped: bool
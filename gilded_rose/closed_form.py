@@ -0,0 +1,149 @@
+"""Cálculo en forma cerrada del estado de un item luego de N días.
+
+Cada función devuelve exactamente el mismo resultado que aplicar N veces
+GildedRose.update_quality, pero en O(1) sin importar la cantidad de días.
+Se apoya en que los límites de calidad se aplican siempre en la dirección
+del cambio: encadenar max(MIN, q - a) es igual a max(MIN, q - suma), y lo
+mismo para min(MAX, q + a).
+"""
+
+from gilded_rose.categories import ItemCategory
+from gilded_rose.constants import NORMAL_SELL_IN_DECREMENT
+from gilded_rose.parameters import DEFAULT_PARAMETERS, RuleParameters
+
+
+def _days_before_expiry(sell_in: int, days: int) -> int:
+    """Cantidad de días, de los próximos `days`, en los que el item no vence.
+
+    El día k (k = 1..days) termina con sell_in - k, y vence si ese valor es negativo.
+
+    Args:
+        sell_in (int): Días de venta al inicio.
+        days (int): Cantidad de días a simular.
+
+    """
+    return min(days, max(sell_in, 0))
+
+
+def _overlap(low: int, high: int, start: int, end: int) -> int:
+    """Cantidad de enteros en común entre [low, high] y [start, end]."""
+    return max(0, min(high, end) - max(low, start) + 1)
+
+
+def _decreasing(
+    sell_in: int, quality: int, days: int, daily: int, expired: int, params: RuleParameters
+) -> tuple[int, int]:
+    """Envejecimiento estándar de un item que pierde calidad."""
+    fresh_days = _days_before_expiry(sell_in, days)
+    total = fresh_days * daily + (days - fresh_days) * (daily + expired)
+    return sell_in - days * NORMAL_SELL_IN_DECREMENT, max(params.min_quality, quality - total)
+
+
+def advance_normal(
+    sell_in: int, quality: int, days: int, params: RuleParameters = DEFAULT_PARAMETERS
+) -> tuple[int, int]:
+    """Estado de un item normal luego de `days` días."""
+    if days == 0:
+        return sell_in, quality
+    return _decreasing(
+        sell_in,
+        quality,
+        days,
+        params.normal_daily_decrement,
+        params.normal_expired_decrement,
+        params,
+    )
+
+
+def advance_conjured(
+    sell_in: int, quality: int, days: int, params: RuleParameters = DEFAULT_PARAMETERS
+) -> tuple[int, int]:
+    """Estado de un item conjurado luego de `days` días."""
+    if days == 0:
+        return sell_in, quality
+    return _decreasing(
+        sell_in,
+        quality,
+        days,
+        params.conjured_daily_decrement,
+        params.conjured_expired_decrement,
+        params,
+    )
+
+
+def advance_aged_brie(
+    sell_in: int, quality: int, days: int, params: RuleParameters = DEFAULT_PARAMETERS
+) -> tuple[int, int]:
+    """Estado de un Aged Brie luego de `days` días."""
+    if days == 0:
+        return sell_in, quality
+    fresh_days = _days_before_expiry(sell_in, days)
+    total = fresh_days * params.aged_brie_increment + (days - fresh_days) * (
+        params.aged_brie_increment + params.aged_brie_expired_increment
+    )
+    return sell_in - days * NORMAL_SELL_IN_DECREMENT, min(params.max_quality, quality + total)
+
+
+def advance_backstage_passes(
+    sell_in: int, quality: int, days: int, params: RuleParameters = DEFAULT_PARAMETERS
+) -> tuple[int, int]:
+    """Estado de un Backstage pass luego de `days` días.
+
+    Si el concierto ocurre dentro del período la calidad termina en
+    backstage_expired_quality. Si no, el incremento total se obtiene contando
+    cuántos de los sell_in recorridos caen en cada tramo de umbrales.
+    """
+    if days == 0:
+        return sell_in, quality
+    final_sell_in = sell_in - days * NORMAL_SELL_IN_DECREMENT
+    if final_sell_in < 0:
+        return final_sell_in, params.backstage_expired_quality
+
+    # sell_in al comienzo de cada día simulado: [final_sell_in + 1, sell_in]
+    low = final_sell_in + 1
+    first, second = params.backstage_first_threshold, params.backstage_second_threshold
+    far = _overlap(low, sell_in, first, sell_in)
+    medium = _overlap(low, sell_in, second, first - 1)
+    near = days - far - medium
+    total = (
+        far * params.backstage_far_increment
+        + medium * params.backstage_medium_increment
+        + near * params.backstage_near_increment
+    )
+    return final_sell_in, min(params.max_quality, quality + total)
+
+
+def advance_sulfuras(
+    sell_in: int, quality: int, days: int, params: RuleParameters = DEFAULT_PARAMETERS
+) -> tuple[int, int]:
+    """Sulfuras nunca cambia."""
+    return sell_in, quality
+
+
+ADVANCERS = {
+    ItemCategory.NORMAL: advance_normal,
+    ItemCategory.AGED_BRIE: advance_aged_brie,
+    ItemCategory.BACKSTAGE_PASSES: advance_backstage_passes,
+    ItemCategory.SULFURAS: advance_sulfuras,
+    ItemCategory.CONJURED: advance_conjured,
+}
+
+
+def advance_state(
+    category: ItemCategory,
+    sell_in: int,
+    quality: int,
+    days: int,
+    params: RuleParameters = DEFAULT_PARAMETERS,
+) -> tuple[int, int]:
+    """Devuelve (sell_in, quality) de un item de `category` luego de `days` días.
+
+    Args:
+        category (ItemCategory): Categoría del item.
+        sell_in (int): Días de venta actuales.
+        quality (int): Calidad actual.
+        days (int): Cantidad de días a avanzar (no negativa).
+        params (RuleParameters): Parámetros de las reglas; por defecto los de constants.py.
+
+    """
+    return ADVANCERS[category](sell_in, quality, days, params)
@@ -0,0 +1,197 @@
+"""Inventario columnar con actualización vectorizada (requiere NumPy).
+
+Las filas se guardan ordenadas por categoría, de modo que cada categoría ocupa
+un rango contiguo de las columnas y las reglas se aplican sobre vistas, sin
+copiar datos. El orden original de los items se conserva en una permutación.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from gilded_rose.categories import ItemCategory, classify
+from gilded_rose.constants import (
+    AGED_BRIE_EXPIRED_INCREMENT,
+    AGED_BRIE_INCREMENT,
+    BACKSTAGE_EXPIRED_QUALITY,
+    BACKSTAGE_FAR_INCREMENT,
+    BACKSTAGE_FIRST_THRESHOLD,
+    BACKSTAGE_MEDIUM_INCREMENT,
+    BACKSTAGE_NEAR_INCREMENT,
+    BACKSTAGE_SECOND_THRESHOLD,
+    CONJURED_DAILY_DECREMENT,
+    CONJURED_EXPIRED_DECREMENT,
+    MAX_QUALITY,
+    MIN_QUALITY,
+    MIN_SELL_IN,
+    NORMAL_DAILY_DECREMENT,
+    NORMAL_EXPIRED_DECREMENT,
+    NORMAL_SELL_IN_DECREMENT,
+)
+from gilded_rose.models import Item
+
+INT_DTYPE = np.int64
+CATEGORY_DTYPE = np.int8
+
+
+class ColumnarInventory:
+    """Inventario almacenado en columnas de enteros.
+
+    Aplica las mismas reglas que GildedRose.update_quality, pero sobre todas
+    las filas de una categoría a la vez.
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        sell_in: Sequence[int],
+        quality: Sequence[int],
+    ) -> None:
+        """Construye el inventario a partir de columnas.
+
+        Args:
+            names (Sequence[str]): Nombre de cada fila.
+            sell_in (Sequence[int]): Días de venta de cada fila.
+            quality (Sequence[int]): Calidad de cada fila.
+
+        """
+        if not len(names) == len(sell_in) == len(quality):
+            raise ValueError("Las columnas deben tener la misma longitud")
+
+        categories = np.fromiter(
+            (classify(name) for name in names), dtype=CATEGORY_DTYPE, count=len(names)
+        )
+        self._order = np.argsort(categories, kind="stable")
+        self.categories = categories[self._order]
+        self.names = np.asarray(names, dtype=object)[self._order]
+        self.sell_in = np.asarray(sell_in, dtype=INT_DTYPE)[self._order]
+        self.quality = np.asarray(quality, dtype=INT_DTYPE)[self._order]
+        self._slices = self._category_slices(self.categories)
+
+    @classmethod
+    def from_items(cls, items: Sequence[Item]) -> "ColumnarInventory":
+        """Construye el inventario a partir de una lista de Item.
+
+        Args:
+            items (Sequence[Item]): Items a cargar.
+
+        """
+        return cls(
+            [item.name for item in items],
+            [item.sell_in for item in items],
+            [item.quality for item in items],
+        )
+
+    @staticmethod
+    def _category_slices(categories: np.ndarray) -> dict[ItemCategory, slice]:
+        """Calcula el rango contiguo que ocupa cada categoría en las columnas ordenadas."""
+        bounds = np.searchsorted(categories, np.arange(len(ItemCategory) + 1))
+        return {
+            category: slice(int(bounds[category]), int(bounds[category + 1]))
+            for category in ItemCategory
+        }
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def to_items(self) -> list[Item]:
+        """Exporta el inventario como una lista nueva de Item, en el orden original."""
+        items: list[Item | None] = [None] * len(self)
+        for row, position in enumerate(self._order.tolist()):
+            items[position] = Item(self.names[row], int(self.sell_in[row]), int(self.quality[row]))
+        return items  # type: ignore[return-value]
+
+    def sync_items(self, items: Sequence[Item]) -> None:
+        """Copia sell_in y quality a una lista de Item existente, en el orden original.
+
+        Args:
+            items (Sequence[Item]): Items desde los que se cargó el inventario.
+
+        """
+        if len(items) != len(self):
+            raise ValueError("La cantidad de items no coincide con el inventario")
+        sell_in = self.sell_in.tolist()
+        quality = self.quality.tolist()
+        for row, position in enumerate(self._order.tolist()):
+            item = items[position]
+            item.sell_in = sell_in[row]
+            item.quality = quality[row]
+
+    def use_buffers(self, sell_in: np.ndarray, quality: np.ndarray) -> None:
+        """Copia las columnas a los arrays dados y pasa a trabajar sobre ellos.
+
+        Permite alojar las columnas en memoria externa, p.ej. compartida entre procesos.
+
+        Args:
+            sell_in (np.ndarray): Destino de la columna sell_in.
+            quality (np.ndarray): Destino de la columna quality.
+
+        """
+        sell_in[:] = self.sell_in
+        quality[:] = self.quality
+        self.sell_in = sell_in
+        self.quality = quality
+
+    def category_slices(self) -> dict[ItemCategory, slice]:
+        """Rango de filas que ocupa cada categoría."""
+        return dict(self._slices)
+
+    def update_quality(self) -> None:
+        """Actualiza todas las filas un día, según las reglas de GildedRose."""
+        for category, rows in self._slices.items():
+            update_rows(category, self.sell_in[rows], self.quality[rows])
+
+
+def update_rows(category: ItemCategory, sell_in: np.ndarray, quality: np.ndarray) -> None:
+    """Aplica un día de la regla de `category` sobre columnas, modificándolas en el lugar.
+
+    Args:
+        category (ItemCategory): Categoría de todas las filas.
+        sell_in (np.ndarray): Columna sell_in (o una vista de ella).
+        quality (np.ndarray): Columna quality (o una vista de ella).
+
+    """
+    if category == ItemCategory.NORMAL:
+        _update_decreasing(sell_in, quality, NORMAL_DAILY_DECREMENT, NORMAL_EXPIRED_DECREMENT)
+    elif category == ItemCategory.CONJURED:
+        _update_decreasing(sell_in, quality, CONJURED_DAILY_DECREMENT, CONJURED_EXPIRED_DECREMENT)
+    elif category == ItemCategory.AGED_BRIE:
+        _update_aged_brie(sell_in, quality)
+    elif category == ItemCategory.BACKSTAGE_PASSES:
+        _update_backstage_passes(sell_in, quality)
+
+
+def _update_decreasing(sell_in: np.ndarray, quality: np.ndarray, daily: int, expired: int) -> None:
+    """Items que pierden calidad: normales y conjurados.
+
+    Encadenar max(MIN_QUALITY, q - a) equivale a restar todo y acotar una
+    sola vez, así que el ajuste diario y el de vencimiento se suman antes
+    de aplicar el límite.
+    """
+    sell_in -= NORMAL_SELL_IN_DECREMENT
+    quality -= daily + expired * (sell_in < MIN_SELL_IN)
+    np.maximum(quality, MIN_QUALITY, out=quality)
+
+
+def _update_aged_brie(sell_in: np.ndarray, quality: np.ndarray) -> None:
+    """Aged Brie gana calidad, el doble luego de vencer."""
+    sell_in -= NORMAL_SELL_IN_DECREMENT
+    quality += AGED_BRIE_INCREMENT + AGED_BRIE_EXPIRED_INCREMENT * (sell_in < MIN_SELL_IN)
+    np.minimum(quality, MAX_QUALITY, out=quality)
+
+
+def _update_backstage_passes(sell_in: np.ndarray, quality: np.ndarray) -> None:
+    """Backstage passes ganan calidad por tramos y caen a 0 tras el concierto."""
+    increment = np.where(
+        sell_in < BACKSTAGE_SECOND_THRESHOLD,
+        BACKSTAGE_NEAR_INCREMENT,
+        np.where(
+            sell_in < BACKSTAGE_FIRST_THRESHOLD,
+            BACKSTAGE_MEDIUM_INCREMENT,
+            BACKSTAGE_FAR_INCREMENT,
+        ),
+    )
+    quality += increment
+    np.minimum(quality, MAX_QUALITY, out=quality)
+    sell_in -= NORMAL_SELL_IN_DECREMENT
+    quality[sell_in < MIN_SELL_IN] = BACKSTAGE_EXPIRED_QUALITY
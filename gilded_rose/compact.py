@@ -0,0 +1,235 @@
+"""Almacén compacto de items sobre arreglos, con vistas compatibles con Item.
+
+Cada Item tiene su propio __dict__ y guarda el nombre como un string aparte,
+lo que cuesta unos 100 bytes por item (más el string del nombre si no está
+compartido). CompactInventory guarda sell_in y quality en arreglos de enteros
+de 64 bits y el nombre como el id de una tabla de nombres internados: unos 20
+bytes por item, unas cinco veces menos.
+
+Para el código existente se ofrecen vistas (ItemView) que heredan de Item, con
+los mismos atributos y __repr__, y que leen y escriben directamente en los
+arreglos. GildedRose las acepta como cualquier otro Item. Una vista no es más
+liviana que un Item (hereda su __dict__), así que sirven para accesos puntuales
+o transitorios: materializar las vistas de todo el inventario cuesta lo mismo
+que una lista de Item. Para trabajar sobre el inventario completo hay que usar
+CompactInventory.update_quality, que opera sobre los arreglos.
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator, MutableSequence, Sequence
+
+from gilded_rose.categories import classify
+from gilded_rose.constants import MAX_QUALITY, MIN_QUALITY
+from gilded_rose.models import Item
+from gilded_rose.rule_tables import DEFAULT_RULES, CompiledRule, compile_rules
+from gilded_rose.validated import check_item_types
+
+NAME_ID_TYPECODE = "I"
+INT_TYPECODE = "q"
+
+_COMPILED_RULES = compile_rules(DEFAULT_RULES)
+
+
+class ItemView(Item):
+    """Vista de un item dentro de un CompactInventory.
+
+    No llama a Item.__init__: los atributos son propiedades que leen y escriben
+    la fila correspondiente del almacén.
+    """
+
+    def __init__(self, store: "CompactInventory", index: int) -> None:
+        """Crea la vista de una fila.
+
+        Args:
+            store (CompactInventory): Almacén que contiene el item.
+            index (int): Fila del item en el almacén.
+
+        """
+        self._store = store
+        self._index = index
+
+    @property
+    def name(self) -> str:
+        store = self._store
+        return store._names[store._name_ids[self._index]]
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._store._name_ids[self._index] = self._store._intern(value)
+
+    @property
+    def sell_in(self) -> int:
+        return self._store._sell_in[self._index]
+
+    @sell_in.setter
+    def sell_in(self, value: int) -> None:
+        self._store._sell_in[self._index] = value
+
+    @property
+    def quality(self) -> int:
+        return self._store._quality[self._index]
+
+    @quality.setter
+    def quality(self, value: int) -> None:
+        self._store._quality[self._index] = value
+
+
+class CompactInventory:
+    """Inventario con columnas de enteros y nombres internados."""
+
+    def __init__(self) -> None:
+        """Crea un inventario vacío."""
+        self._name_ids = array(NAME_ID_TYPECODE)
+        self._sell_in = array(INT_TYPECODE)
+        self._quality = array(INT_TYPECODE)
+        self._names: list[str] = []
+        self._name_index: dict[str, int] = {}
+
+    @classmethod
+    def from_items(cls, items: Iterable[Item]) -> "CompactInventory":
+        """Copia una secuencia de Item al almacén compacto.
+
+        Args:
+            items (Iterable[Item]): Items a copiar.
+
+        """
+        items = list(items)
+        check_item_types(items)
+        inventory = cls()
+        for item in items:
+            inventory.append(item.name, item.sell_in, item.quality)
+        return inventory
+
+    def _intern(self, name: str) -> int:
+        """Devuelve el id del nombre, agregándolo a la tabla si es nuevo."""
+        name_id = self._name_index.get(name)
+        if name_id is None:
+            name_id = len(self._names)
+            self._names.append(name)
+            self._name_index[name] = name_id
+        return name_id
+
+    def append(self, name: str, sell_in: int, quality: int) -> ItemView:
+        """Agrega un item y devuelve su vista.
+
+        Args:
+            name (str): Nombre del item.
+            sell_in (int): Días de venta.
+            quality (int): Calidad.
+
+        """
+        self._sell_in.append(sell_in)
+        self._quality.append(quality)
+        self._name_ids.append(self._intern(name))
+        return ItemView(self, len(self._name_ids) - 1)
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Tabla de nombres distintos, en orden de aparición."""
+        return tuple(self._names)
+
+    def __len__(self) -> int:
+        return len(self._name_ids)
+
+    def __getitem__(self, index: int) -> ItemView:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Índice fuera de rango")
+        return ItemView(self, index)
+
+    def __iter__(self) -> Iterator[ItemView]:
+        return map(ItemView, [self] * len(self), range(len(self)))
+
+    def views(self) -> list[ItemView]:
+        """Lista de vistas de todos los items, p.ej. para construir un GildedRose.
+
+        Ocupa tanta memoria como una lista de Item; para avanzar días sobre todo
+        el inventario conviene update_quality.
+        """
+        return list(self)
+
+    def to_items(self) -> list[Item]:
+        """Copia el contenido a instancias independientes de Item."""
+        names = self._names
+        return [
+            Item(names[name_id], sell_in, quality)
+            for name_id, sell_in, quality in zip(
+                self._name_ids, self._sell_in, self._quality, strict=True
+            )
+        ]
+
+    def columns(self, start: int = 0, stop: int | None = None) -> tuple[array, array]:
+        """Copia de las columnas (sell_in, quality) de las filas [start, stop).
+
+        Args:
+            start (int): Primera fila.
+            stop (int | None): Fila siguiente a la última; por defecto, hasta el final.
+
+        """
+        return self._sell_in[start:stop], self._quality[start:stop]
+
+    def nbytes(self) -> int:
+        """Bytes ocupados por las columnas (sin contar la tabla de nombres)."""
+        return sum(
+            column.itemsize * len(column)
+            for column in (self._name_ids, self._sell_in, self._quality)
+        )
+
+    def update_quality(self, start: int = 0, stop: int | None = None) -> None:
+        """Actualiza los items un día trabajando directamente sobre los arreglos.
+
+        Usa las tablas de transición de rule_tables; la regla de cada nombre se
+        resuelve una sola vez por nombre distinto.
+
+        Args:
+            start (int): Primera fila a actualizar.
+            stop (int | None): Fila siguiente a la última; por defecto, hasta el final.
+
+        """
+        update_columns(self._names, self._name_ids, self._sell_in, self._quality, start, stop)
+
+
+def update_columns(
+    names: Sequence[str],
+    name_ids: MutableSequence[int],
+    sell_in_column: MutableSequence[int],
+    quality_column: MutableSequence[int],
+    start: int = 0,
+    stop: int | None = None,
+) -> None:
+    """Aplica un día de las reglas sobre columnas de enteros, en el lugar.
+
+    Sirve para cualquier secuencia indexable de enteros (array, memoryview).
+
+    Args:
+        names (Sequence[str]): Tabla de nombres; name_ids indexa esta tabla.
+        name_ids (MutableSequence[int]): Id de nombre de cada fila.
+        sell_in_column (MutableSequence[int]): sell_in de cada fila.
+        quality_column (MutableSequence[int]): Calidad de cada fila.
+        start (int): Primera fila a actualizar.
+        stop (int | None): Fila siguiente a la última; por defecto, hasta el final.
+
+    """
+    plans = [_plan(_COMPILED_RULES[classify(name)]) for name in names]
+    for index, name_id in enumerate(name_ids[start:stop], start):
+        plan = plans[name_id]
+        if plan is None:
+            continue
+        table, low, high, width, step, rule = plan
+        sell_in = sell_in_column[index]
+        quality = quality_column[index]
+        if MIN_QUALITY <= quality <= MAX_QUALITY:
+            row = (high if sell_in > high else low if sell_in < low else sell_in) - low
+            quality_column[index] = table[row * width + quality - MIN_QUALITY]
+        else:
+            quality_column[index] = rule.step(sell_in, quality)[1]
+        sell_in_column[index] = sell_in - step
+
+
+def _plan(compiled: CompiledRule) -> tuple | None:
+    """Datos de una regla compilada listos para el bucle; None si la regla es estática."""
+    rule = compiled.rule
+    if rule.is_static:
+        return None
+    return compiled.table, compiled.low, compiled.high, compiled.width, rule.sell_in_step, rule
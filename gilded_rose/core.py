@@ -1,9 +1,13 @@
 """Clase principal GildedRose."""
 
 from collections.abc import Callable
+from operator import attrgetter
 
+from gilded_rose.aggregates import InventoryAggregates
+from gilded_rose.categories import ItemCategory, classify
+from gilded_rose.changes import ItemChange
+from gilded_rose.closed_form import ADVANCERS
 from gilded_rose.constants import (
-    AGED_BRIE,
     AGED_BRIE_EXPIRED_INCREMENT,
     AGED_BRIE_INCREMENT,
     BACKSTAGE_EXPIRED_QUALITY,
@@ -11,20 +15,40 @@ from gilded_rose.constants import (
     BACKSTAGE_FIRST_THRESHOLD,
     BACKSTAGE_MEDIUM_INCREMENT,
     BACKSTAGE_NEAR_INCREMENT,
-    BACKSTAGE_PASSES,
     BACKSTAGE_SECOND_THRESHOLD,
     CONJURED_DAILY_DECREMENT,
     CONJURED_EXPIRED_DECREMENT,
-    CONJURED_PREFIX,
     MAX_QUALITY,
     MIN_QUALITY,
     MIN_SELL_IN,
     NORMAL_DAILY_DECREMENT,
     NORMAL_EXPIRED_DECREMENT,
     NORMAL_SELL_IN_DECREMENT,
-    SULFURAS,
 )
+from gilded_rose.instrumentation import Instrumentation
 from gilded_rose.models import Item
+from gilded_rose.validated import ValidatedItems, check_item_types
+
+# Puntos fijos: una vez que se cumplen, el item sólo vuelve a cambiar su sell_in.
+_SETTLED_CHECKS: dict[ItemCategory, Callable[[Item], bool]] = {
+    ItemCategory.NORMAL: lambda item: item.quality == MIN_QUALITY,
+    ItemCategory.CONJURED: lambda item: item.quality == MIN_QUALITY,
+    ItemCategory.AGED_BRIE: lambda item: item.quality == MAX_QUALITY,
+    ItemCategory.BACKSTAGE_PASSES: lambda item: (
+        item.sell_in < MIN_SELL_IN and item.quality == BACKSTAGE_EXPIRED_QUALITY
+    ),
+}
+
+
+def _item_advancer(
+    advance: Callable[[int, int, int], tuple[int, int]], days: int
+) -> Callable[[Item], None]:
+    """Regla que avanza un item `days` días con la forma cerrada `advance`."""
+
+    def step(item: Item) -> None:
+        item.sell_in, item.quality = advance(item.sell_in, item.quality, days)
+
+    return step
 
 
 class GildedRose:
@@ -32,28 +56,192 @@ class GildedRose:
     Actualiza la calidad y días de venta de los items, según reglas específicas.
     """
 
-    def __init__(self, items: list[Item]) -> None:
+    def __init__(
+        self, items: list[Item], track_settled: bool = False, trusted: bool = False
+    ) -> None:
         """Inicializa la lista de items para el sistema.
 
         Args:
             items (list): Lista de items a gestionar.
+            track_settled (bool): Si es True, los items que llegaron a un punto
+                fijo salen del recorrido diario y su sell_in se materializa
+                recién al leer `items` (ver settled_count).
+            trusted (bool): Si es True, no se valida el tipo de los items. Usar sólo
+                con listas construidas por el propio sistema (ver ValidatedItems).
 
         """
-        self._validate_items(items)
+        if trusted:
+            self._validate_not_empty(items)
+        else:
+            self._validate_items(items)
+        self._track_settled = track_settled
+        self._day = 0
+        self._settled: list[Item] = []
+        self._settled_day = 0
+        self._pending_settled: list[tuple[Item, int]] = []
+        self._instrumentation: Instrumentation | None = None
+        self._aggregates: InventoryAggregates | None = None
+        self._updaters: dict[ItemCategory, Callable[[Item], None]] = {
+            ItemCategory.NORMAL: self._update_normal_items,
+            ItemCategory.AGED_BRIE: self._update_aged_brie,
+            ItemCategory.BACKSTAGE_PASSES: self._update_backstage_passes,
+            ItemCategory.CONJURED: self._update_conjured_items,
+        }
         self.items = items
 
+    @property
+    def items(self) -> list[Item]:
+        """Lista de items gestionados, con el sell_in de los items asentados al día."""
+        self._materialize_settled()
+        return self._items
+
+    @items.setter
+    def items(self, items: list[Item]) -> None:
+        """Reemplaza la lista de items y reconstruye el índice por categoría."""
+        self._materialize_settled()
+        self._items = items
+        self.refresh_index()
+
+    @property
+    def settled_count(self) -> int:
+        """Cantidad de items asentados, que ya no se recorren en update_quality."""
+        return len(self._settled) + len(self._pending_settled)
+
+    def refresh_index(self) -> None:
+        """Reconstruye el índice de items por categoría.
+
+        Debe llamarse si se agregan items a la lista por fuera de add_items,
+        o si se cambia el nombre o los valores de algún item.
+        """
+        self._materialize_settled()
+        self._settled = []
+        self._groups = {category: [] for category in ItemCategory}
+        self._positions: dict[ItemCategory, list[int]] = {category: [] for category in ItemCategory}
+        self._index_items(self._items, 0)
+        if self._aggregates is not None:
+            self._aggregates.reset(self._items)
+
+    def _index_items(self, items: list[Item], start: int) -> None:
+        """Agrega items al índice, separando los asentados si corresponde.
+
+        Sin track_settled también guarda la posición de cada item en la lista,
+        en paralelo a su grupo, para update_quality_with_changes.
+
+        Args:
+            items (list): Items a indexar.
+            start (int): Posición del primero de ellos en la lista de items.
+
+        """
+        for position, item in enumerate(items, start):
+            category = classify(item.name)
+            is_settled = _SETTLED_CHECKS.get(category)
+            if self._track_settled and is_settled is not None and is_settled(item):
+                self._settled.append(item)
+            else:
+                self._groups[category].append(item)
+                if not self._track_settled:
+                    self._positions[category].append(position)
+
+    def add_items(self, items: list[Item]) -> None:
+        """Agrega items al inventario manteniendo el índice por categoría.
+
+        Args:
+            items (list): Items a agregar.
+
+        """
+        if not isinstance(self._items, ValidatedItems):
+            self._validate_item_types(items)
+        self._materialize_settled()
+        start = len(self._items)
+        self._items.extend(items)  # una ValidatedItems valida al agregar
+        self._index_items(items, start)
+        if self._aggregates is not None:
+            for item in items:
+                self._aggregates.add(item)
+            self._check_aggregates()
+
+    def remove_items(self, items: list[Item]) -> None:
+        """Quita items del inventario manteniendo el índice por categoría.
+
+        Los items se identifican por identidad, no por igualdad de valores.
+
+        Args:
+            items (list): Items a quitar; deben pertenecer al inventario.
+
+        """
+        self._materialize_settled()
+        targets = {id(item): item for item in items}
+        kept = [item for item in self._items if id(item) not in targets]
+        if len(self._items) - len(kept) != len(targets):
+            raise ValueError("Algunos items a quitar no pertenecen al inventario")
+        self._items[:] = kept
+        for category, group in self._groups.items():
+            self._groups[category] = [item for item in group if id(item) not in targets]
+        self._settled = [item for item in self._settled if id(item) not in targets]
+        if not self._track_settled:
+            positions = {id(item): position for position, item in enumerate(kept)}
+            self._positions = {
+                category: [positions[id(item)] for item in group]
+                for category, group in self._groups.items()
+            }
+        if self._aggregates is not None:
+            for item in targets.values():
+                self._aggregates.remove(item)
+            self._check_aggregates()
+
+    @classmethod
+    def from_columns(
+        cls,
+        names: list[str],
+        sell_in: list[int],
+        quality: list[int],
+        track_settled: bool = False,
+    ) -> "GildedRose":
+        """Construye el sistema a partir de columnas de datos, sin validar item por item.
+
+        Args:
+            names (list): Nombre de cada item.
+            sell_in (list): Días de venta de cada item.
+            quality (list): Calidad de cada item.
+            track_settled (bool): Ver __init__.
+
+        """
+        return cls(ValidatedItems.from_columns(names, sell_in, quality), track_settled)
+
     @staticmethod
     def _validate_items(items: list[Item]) -> None:
         """Valida que los items sean instancias de Item.
 
+        Una ValidatedItems ya fue validada al ingresar y no se vuelve a recorrer.
+
+        Args:
+            items (list): Lista de items a validar.
+
+        """
+        GildedRose._validate_not_empty(items)
+        if not isinstance(items, ValidatedItems):
+            GildedRose._validate_item_types(items)
+
+    @staticmethod
+    def _validate_not_empty(items: list[Item]) -> None:
+        """Valida que la lista de items no esté vacía.
+
         Args:
             items (list): Lista de items a validar.
 
         """
         if not items:
             raise ValueError("Los items no pueden ser vacíos")
-        if not all(isinstance(item, Item) for item in items):
-            raise TypeError("Los items deben ser instancias de Item")
+
+    @staticmethod
+    def _validate_item_types(items: list[Item]) -> None:
+        """Valida que todos los elementos sean instancias de Item.
+
+        Args:
+            items (list): Lista de items a validar.
+
+        """
+        check_item_types(items)
 
     @staticmethod
     def _decrease_quality_safe(item: Item, amount: int) -> None:
@@ -85,16 +273,6 @@ class GildedRose:
         """
         item.sell_in -= NORMAL_SELL_IN_DECREMENT
 
-    @staticmethod
-    def _is_conjured(item: Item) -> bool:
-        """Verifica si un item es conjurado por su nombre.
-
-        Args:
-            item (Item): Item a verificar.
-
-        """
-        return item.name.lower().startswith(CONJURED_PREFIX)
-
     def update_quality(self) -> None:
         """Actualiza la calidad y días de venta de los items, según reglas específicas.
 
@@ -104,28 +282,260 @@ class GildedRose:
         - Sulfuras: item legendario, no cambia
         - Backstage passes: calidad aumenta, pero cae a 0 después del concierto
         - La calidad nunca es negativa ni mayor a MAX_QUALITY
+
+        Los items se recorren por categoría usando el índice precalculado, de
+        modo que la regla de cada grupo se resuelve una sola vez por día.
         """
-        for item in self.items:
-            self._update_single_item(item)
+        if self._instrumentation is not None or self._track_settled or self._aggregates is not None:
+            self._update_with_options()
+            return
+        for category, update in self._updaters.items():
+            for item in self._groups[category]:
+                update(item)
+
+    def _update_with_options(self) -> None:
+        """Variante de update_quality con asentados, instrumentación y/o agregados.
+
+        Se mantiene fuera del camino principal para que las opciones desactivadas
+        no agreguen costo por item.
+        """
+        if self._track_settled:
+            self._day += 1
+        updaters = self._tracked_updaters()
+        instrumentation = self._instrumentation
+        if instrumentation is None:
+            if self._track_settled:
+                for category, update in updaters.items():
+                    self._update_active_group(category, update)
+            else:
+                for category, update in updaters.items():
+                    for item in self._groups[category]:
+                        update(item)
+            self._check_aggregates()
+            return
+
+        instrumentation.begin_tick(
+            {category: len(items) for category, items in self._groups.items()}
+        )
+        # Los métodos de ajuste se buscan en la instancia, así que alcanza con
+        # sombrearlos mientras dura el día instrumentado.
+        self._decrease_quality_safe = instrumentation.wrap_decrease(
+            GildedRose._decrease_quality_safe
+        )
+        self._increase_quality_safe = instrumentation.wrap_increase(
+            GildedRose._increase_quality_safe
+        )
+        try:
+            for category, update in updaters.items():
+                with instrumentation.measure(category):
+                    counting_update = instrumentation.wrap_update(update)
+                    if self._track_settled:
+                        self._update_active_group(category, counting_update)
+                    else:
+                        for item in self._groups[category]:
+                            counting_update(item)
+        finally:
+            del self._decrease_quality_safe
+            del self._increase_quality_safe
+        instrumentation.end_tick()
+        self._check_aggregates()
+
+    def _tracked_updaters(self) -> dict[ItemCategory, Callable[[Item], None]]:
+        """Reglas por categoría, envueltas para mantener los agregados si están activos."""
+        if self._aggregates is None:
+            return self._updaters
+        return {
+            category: self._aggregates.wrap_update(category, update)
+            for category, update in self._updaters.items()
+        }
+
+    def _update_active_group(self, category: ItemCategory, update: Callable[[Item], None]) -> None:
+        """Actualiza los items activos de una categoría y aparta los que se asientan.
+
+        Los items asentados no se recorren: basta con avanzar el contador de días
+        y ajustar su sell_in cuando se leen (ver _materialize_settled).
+        """
+        is_settled = _SETTLED_CHECKS[category]
+        active = []
+        for item in self._groups[category]:
+            update(item)
+            if is_settled(item):
+                self._pending_settled.append((item, self._day))
+            else:
+                active.append(item)
+        self._groups[category] = active
+
+    def update_quality_with_changes(self, quality_only: bool = False) -> list[ItemChange]:
+        """Actualiza un día, igual que update_quality, y devuelve sólo lo que cambió.
+
+        Los registros se arman comparando cada item con sus propios valores
+        previos, sin copiar la lista, y se devuelven ordenados por posición.
+        Recorre el mismo índice por categoría que update_quality, así que los
+        items agregados por fuera de add_items requieren refresh_index.
+        Sulfuras nunca genera registros.
 
-    def _update_single_item(self, item: Item) -> None:
-        """Actualiza la calidad y días de venta de un item específico.
+        Args:
+            quality_only (bool): Si es True sólo se informan los items cuya
+                calidad cambió (sell_in cambia a diario en casi todos).
+
+        """
+        if self._instrumentation is not None or self._track_settled:
+            raise ValueError(
+                "El registro de cambios no admite instrumentación ni seguimiento de asentados"
+            )
+        clamped = False
+
+        def decrease(item: Item, amount: int) -> None:
+            nonlocal clamped
+            if item.quality - amount < MIN_QUALITY:
+                clamped = True
+            item.quality = max(MIN_QUALITY, item.quality - amount)
+
+        def increase(item: Item, amount: int) -> None:
+            nonlocal clamped
+            if item.quality + amount > MAX_QUALITY:
+                clamped = True
+            item.quality = min(MAX_QUALITY, item.quality + amount)
+
+        changes: list[ItemChange] = []
+        updaters = self._tracked_updaters()
+        # Igual que en la instrumentación: se sombrean los ajustes de la instancia.
+        self._decrease_quality_safe = decrease
+        self._increase_quality_safe = increase
+        try:
+            for category, update in updaters.items():
+                positions = self._positions[category]
+                for index, item in zip(positions, self._groups[category], strict=True):
+                    old_sell_in, old_quality = item.sell_in, item.quality
+                    clamped = False
+                    update(item)
+                    if quality_only and item.quality == old_quality:
+                        continue
+                    changes.append(
+                        ItemChange(
+                            index,
+                            old_sell_in,
+                            item.sell_in,
+                            old_quality,
+                            item.quality,
+                            old_sell_in >= MIN_SELL_IN > item.sell_in,
+                            clamped,
+                        )
+                    )
+        finally:
+            del self._decrease_quality_safe
+            del self._increase_quality_safe
+        changes.sort(key=attrgetter("index"))
+        self._check_aggregates()
+        return changes
+
+    @property
+    def instrumentation(self) -> Instrumentation | None:
+        """Instrumentación activa, o None si está desactivada."""
+        return self._instrumentation
+
+    def enable_instrumentation(
+        self, instrumentation: Instrumentation | None = None
+    ) -> Instrumentation:
+        """Activa la recolección de métricas en update_quality.
 
         Args:
-            item (Item): Item a actualizar.
+            instrumentation (Instrumentation | None): Instancia a usar; si no se
+                indica se crea una nueva.
+
+        """
+        self._instrumentation = instrumentation or Instrumentation()
+        return self._instrumentation
+
+    def disable_instrumentation(self) -> None:
+        """Desactiva la recolección de métricas."""
+        self._instrumentation = None
+
+    @property
+    def aggregates(self) -> InventoryAggregates | None:
+        """Agregados incrementales activos, o None si están desactivados."""
+        return self._aggregates
+
+    def enable_aggregates(self, debug: bool = False) -> InventoryAggregates:
+        """Activa el mantenimiento incremental de agregados (ver aggregates.py).
+
+        Los agregados se corrigen en update_quality, advance, add_items y
+        remove_items. Si los items se modifican por fuera de esas operaciones
+        hay que llamar a refresh_index, que también los recalcula; si no, los
+        totales quedan desfasados (con debug=True la siguiente operación lanza
+        RuntimeError).
+
+        Args:
+            debug (bool): Si es True, cada operación compara los agregados con un
+                recálculo completo y lanza RuntimeError si difieren.
+
+        """
+        if self._track_settled:
+            raise ValueError("Los agregados incrementales no admiten seguimiento de asentados")
+        self._aggregates = InventoryAggregates(self._items, debug=debug)
+        return self._aggregates
+
+    def disable_aggregates(self) -> None:
+        """Desactiva el mantenimiento de agregados."""
+        self._aggregates = None
+
+    def _check_aggregates(self) -> None:
+        """En modo debug, compara los agregados con un recálculo completo."""
+        if self._aggregates is not None and self._aggregates.debug:
+            self._aggregates.verify(self._items)
+
+    def _materialize_settled(self) -> None:
+        """Lleva el sell_in de los items asentados al día actual."""
+        if self._settled_day == self._day and not self._pending_settled:
+            return
+        lag = (self._day - self._settled_day) * NORMAL_SELL_IN_DECREMENT
+        for item in self._settled:
+            item.sell_in -= lag
+        for item, day in self._pending_settled:
+            item.sell_in -= (self._day - day) * NORMAL_SELL_IN_DECREMENT
+            self._settled.append(item)
+        self._pending_settled = []
+        self._settled_day = self._day
+
+    def advance(self, days: int) -> None:
+        """Avanza el inventario `days` días de una sola vez.
+
+        Equivale a llamar `days` veces a update_quality, pero calcula el estado
+        final de cada item en forma cerrada, con costo O(items) sin importar
+        la cantidad de días.
+
+        Args:
+            days (int): Cantidad de días a avanzar.
 
         """
-        match item.name:
-            case _ if item.name == SULFURAS:
-                return
-            case _ if item.name == AGED_BRIE:
-                self._update_aged_brie(item)
-            case _ if item.name == BACKSTAGE_PASSES:
-                self._update_backstage_passes(item)
-            case _ if self._is_conjured(item):
-                self._update_conjured_items(item)
-            case _:
-                self._update_normal_items(item)
+        if days < 0:
+            raise ValueError("Los días a avanzar no pueden ser negativos")
+        aggregates = self._aggregates
+        for category, items in self._groups.items():
+            advance = ADVANCERS[category]
+            if aggregates is None:
+                for item in items:
+                    item.sell_in, item.quality = advance(item.sell_in, item.quality, days)
+            else:
+                # Los agregados se ajustan item por item en la misma pasada.
+                tracked = aggregates.wrap_update(category, _item_advancer(advance, days))
+                for item in items:
+                    tracked(item)
+        if self._track_settled:
+            self._day += days
+            self._settle_groups()
+        self._check_aggregates()
+
+    def _settle_groups(self) -> None:
+        """Aparta de los grupos activos los items que llegaron a un punto fijo."""
+        for category, is_settled in _SETTLED_CHECKS.items():
+            active = []
+            for item in self._groups[category]:
+                if is_settled(item):
+                    self._pending_settled.append((item, self._day))
+                else:
+                    active.append(item)
+            self._groups[category] = active
 
     def _apply_standard_aging(
         self,
@@ -0,0 +1,388 @@
+"""Servicio de larga duración que mantiene un inventario residente en memoria.
+
+InventoryDaemon atiende pedidos JSON de una línea (un objeto por línea) sobre un
+socket Unix o sobre stdin/stdout, y responde también con una línea JSON por
+pedido. Evita pagar el arranque del intérprete y la carga del inventario en
+cada ejecución.
+
+Pedidos (el campo "id" es opcional y se devuelve tal cual en la respuesta):
+
+- {"op": "tick", "days": N}: avanza N días (forma cerrada, ver GildedRose.advance).
+- {"op": "query", "name": ..., "category": ..., "expired": ..., "offset": 0, "limit": 100}:
+  items que cumplen todos los filtros indicados, con su posición.
+- {"op": "add", "items": [{"name": ..., "sell_in": ..., "quality": ...}, ...]}
+- {"op": "remove", "indices": [...]} o {"op": "remove", "name": ...}: las
+  posiciones de los items restantes se compactan.
+- {"op": "snapshot", "path": ...}: guarda el inventario en CSV o JSONL según
+  la extensión (ver streaming.py).
+- {"op": "stats"}: día actual, cantidad de items y latencia por operación.
+
+Los pedidos se procesan apenas llegan, sin esperar la respuesta del anterior
+(pipelining): las lecturas (query, snapshot, stats) corren en paralelo entre sí
+y las escrituras (tick, add, remove) son exclusivas. El acceso se concede en el
+orden de llegada, así que una lectura enviada después de un tick ve su efecto.
+Como las respuestas pueden salir en otro orden, cada una lleva el "id" de su
+pedido y la latencia medida desde que se recibió la línea.
+"""
+
+import asyncio
+import json
+import sys
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from gilded_rose.categories import ItemCategory, classify
+from gilded_rose.core import GildedRose
+from gilded_rose.models import Item
+from gilded_rose.streaming import detect_format, write_items
+
+DEFAULT_QUERY_LIMIT = 100
+READ_OPERATIONS = frozenset({"query", "snapshot", "stats"})
+
+
+class ReadWriteLock:
+    """Lock de asyncio con muchos lectores o un escritor, concedido en orden de llegada."""
+
+    def __init__(self) -> None:
+        self._readers = 0
+        self._writer = False
+        self._waiters: deque[tuple[bool, asyncio.Future]] = deque()
+
+    def _can_grant(self, write: bool) -> bool:
+        if write:
+            return not self._writer and self._readers == 0
+        return not self._writer
+
+    def _grant(self, write: bool) -> None:
+        if write:
+            self._writer = True
+        else:
+            self._readers += 1
+
+    def _wake(self) -> None:
+        """Concede el lock a los primeros de la fila que sean compatibles."""
+        while self._waiters:
+            write, future = self._waiters[0]
+            if future.done():
+                self._waiters.popleft()
+                continue
+            if not self._can_grant(write):
+                return
+            self._waiters.popleft()
+            self._grant(write)
+            future.set_result(None)
+
+    async def _acquire(self, write: bool) -> None:
+        if not self._waiters and self._can_grant(write):
+            self._grant(write)
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((write, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release(write)
+            raise
+
+    def _release(self, write: bool) -> None:
+        if write:
+            self._writer = False
+        else:
+            self._readers -= 1
+        self._wake()
+
+    @asynccontextmanager
+    async def reading(self) -> AsyncIterator[None]:
+        """Sección de lectura, compartida con otros lectores."""
+        await self._acquire(write=False)
+        try:
+            yield
+        finally:
+            self._release(write=False)
+
+    @asynccontextmanager
+    async def writing(self) -> AsyncIterator[None]:
+        """Sección de escritura, exclusiva."""
+        await self._acquire(write=True)
+        try:
+            yield
+        finally:
+            self._release(write=True)
+
+
+@dataclass
+class LatencyStats:
+    """Latencias acumuladas de una operación, en segundos."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def as_dict(self) -> dict[str, float]:
+        mean = self.total / self.count if self.count else 0.0
+        return {"count": self.count, "mean_ms": mean * 1e3, "max_ms": self.max * 1e3}
+
+
+class RequestError(ValueError):
+    """Pedido inválido; se informa al cliente sin cortar la conexión."""
+
+
+def _item_record(index: int, item: Item) -> dict[str, Any]:
+    return {"index": index, "name": item.name, "sell_in": item.sell_in, "quality": item.quality}
+
+
+def _checked_int(value: Any, field: str, minimum: int | None = 0) -> int:
+    """Valida un entero de un pedido; rechaza booleanos, otros tipos y valores menores a minimum."""
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise RequestError(f"{field!r} debe ser un entero")
+    if minimum is not None and value < minimum:
+        raise RequestError(f"{field!r} debe ser un entero mayor o igual a {minimum}")
+    return value
+
+
+def _non_negative_int(request: dict, key: str, default: int) -> int:
+    """Campo entero no negativo de un pedido; rechaza booleanos y otros tipos."""
+    return _checked_int(request.get(key, default), key)
+
+
+def _parse_items(records: Any) -> list[Item]:
+    if not isinstance(records, list):
+        raise RequestError("'items' debe ser una lista")
+    items = []
+    for position, record in enumerate(records):
+        if not isinstance(record, dict):
+            raise RequestError(f"Item inválido en la posición {position}: debe ser un objeto")
+        try:
+            name = record["name"]
+            sell_in = _checked_int(record["sell_in"], "sell_in", minimum=None)
+            quality = _checked_int(record["quality"], "quality")
+        except KeyError as error:
+            raise RequestError(f"Item inválido en la posición {position}: falta {error}") from error
+        except RequestError as error:
+            raise RequestError(f"Item inválido en la posición {position}: {error}") from error
+        if not isinstance(name, str):
+            raise RequestError(f"Item inválido en la posición {position}: 'name' debe ser texto")
+        items.append(Item(name, sell_in, quality))
+    return items
+
+
+def _parse_indices(indices: Any, size: int) -> set[int]:
+    if not isinstance(indices, list):
+        raise RequestError("'indices' debe ser una lista")
+    for index in indices:
+        _checked_int(index, "indices")
+        if index >= size:
+            raise RequestError(f"Índice fuera de rango: {index} (hay {size} items)")
+    return set(indices)
+
+
+class InventoryDaemon:
+    """Inventario residente que atiende pedidos JSON de una línea."""
+
+    def __init__(self, gilded_rose: GildedRose) -> None:
+        """Toma el control del motor; no debe modificarse por fuera del daemon.
+
+        Args:
+            gilded_rose (GildedRose): Motor con el inventario inicial.
+
+        """
+        self._engine = gilded_rose
+        self._day = 0
+        self._lock = ReadWriteLock()
+        self._latencies: dict[str, LatencyStats] = {}
+        self._handlers: dict[str, Callable[[dict], Any]] = {
+            "tick": self._tick,
+            "query": self._query,
+            "add": self._add,
+            "remove": self._remove,
+            "snapshot": self._snapshot,
+            "stats": self._stats,
+        }
+
+    @property
+    def day(self) -> int:
+        """Días avanzados desde que arrancó el daemon."""
+        return self._day
+
+    async def handle(self, request: dict, received_at: float | None = None) -> dict:
+        """Procesa un pedido y devuelve la respuesta, con su latencia.
+
+        Args:
+            request (dict): Pedido ya decodificado.
+            received_at (float | None): time.perf_counter() al recibirlo; por defecto, ahora.
+
+        """
+        received_at = time.perf_counter() if received_at is None else received_at
+        op = request.get("op")
+        known = isinstance(op, str) and op in self._handlers
+        response: dict[str, Any] = {"id": request.get("id")}
+        try:
+            if not known:
+                raise RequestError(f"Operación desconocida: {op!r}")
+            section = self._lock.reading if op in READ_OPERATIONS else self._lock.writing
+            async with section():
+                result = self._handlers[op](request)
+                if isinstance(result, Awaitable):
+                    result = await result
+            response.update(ok=True, result=result)
+        except (OSError, TypeError, ValueError) as error:
+            response.update(ok=False, error=str(error))
+        except Exception as error:
+            # Un fallo inesperado se informa al cliente sin cortar la conexión.
+            response.update(ok=False, error=f"Error interno: {type(error).__name__}: {error}")
+        latency = time.perf_counter() - received_at
+        if known:
+            self._latencies.setdefault(op, LatencyStats()).record(latency)
+        response["latency_ms"] = latency * 1e3
+        return response
+
+    async def handle_line(self, line: str | bytes, received_at: float | None = None) -> dict:
+        """Decodifica una línea JSON y la procesa con handle."""
+        received_at = time.perf_counter() if received_at is None else received_at
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as error:
+            return {"id": None, "ok": False, "error": f"JSON inválido: {error}"}
+        if not isinstance(request, dict):
+            return {"id": None, "ok": False, "error": "El pedido debe ser un objeto JSON"}
+        return await self.handle(request, received_at)
+
+    async def serve_stream(
+        self, reader: asyncio.StreamReader, write_line: Callable[[str], Awaitable[None]]
+    ) -> None:
+        """Atiende pedidos de un stream hasta EOF, sin esperar una respuesta para leer la siguiente.
+
+        Args:
+            reader (asyncio.StreamReader): Origen de los pedidos, uno por línea.
+            write_line (Callable): Corrutina que envía una línea de respuesta.
+
+        """
+        pending: set[asyncio.Task] = set()
+
+        async def respond(line: bytes, received_at: float) -> None:
+            response = await self.handle_line(line, received_at)
+            await write_line(json.dumps(response, ensure_ascii=False))
+
+        while line := await reader.readline():
+            if not line.strip():
+                continue
+            # Cada pedido es una tarea: se encola en el lock en el orden de llegada.
+            task = asyncio.create_task(respond(line, time.perf_counter()))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        if pending:
+            await asyncio.gather(*pending)
+
+    async def _serve_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        async def write_line(line: str) -> None:
+            writer.write(line.encode() + b"\n")
+            await writer.drain()
+
+        try:
+            await self.serve_stream(reader, write_line)
+        finally:
+            writer.close()
+
+    async def start_unix_server(self, path: str | Path) -> asyncio.AbstractServer:
+        """Escucha en un socket Unix; cada conexión puede enviar pedidos en paralelo.
+
+        Args:
+            path (str | Path): Ruta del socket.
+
+        """
+        return await asyncio.start_unix_server(self._serve_connection, path=str(path))
+
+    async def serve_stdio(self) -> None:
+        """Atiende pedidos de stdin y responde por stdout hasta EOF."""
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+
+        async def write_line(line: str) -> None:
+            sys.stdout.write(line + "\n")
+            sys.stdout.flush()
+
+        await self.serve_stream(reader, write_line)
+
+    def _tick(self, request: dict) -> dict:
+        days = _non_negative_int(request, "days", 1)
+        self._engine.advance(days)
+        self._day += days
+        return {"day": self._day}
+
+    def _query(self, request: dict) -> dict:
+        name = request.get("name")
+        category = request.get("category")
+        expired = request.get("expired")
+        offset = _non_negative_int(request, "offset", 0)
+        limit = _non_negative_int(request, "limit", DEFAULT_QUERY_LIMIT)
+        if category is not None:
+            try:
+                category = ItemCategory[str(category).upper()]
+            except KeyError as error:
+                raise RequestError(f"Categoría desconocida: {category!r}") from error
+        matches = [
+            (index, item)
+            for index, item in enumerate(self._engine.items)
+            if (name is None or item.name == name)
+            and (category is None or classify(item.name) is category)
+            and (expired is None or (item.sell_in < 0) == expired)
+        ]
+        page = matches[offset : offset + limit]
+        return {"total": len(matches), "items": [_item_record(i, item) for i, item in page]}
+
+    def _add(self, request: dict) -> dict:
+        items = _parse_items(request.get("items"))
+        self._engine.add_items(items)
+        return {"added": len(items), "size": len(self._engine.items)}
+
+    def _remove(self, request: dict) -> dict:
+        items = self._engine.items
+        if "indices" in request:
+            indices = _parse_indices(request["indices"], len(items))
+            remaining = [item for index, item in enumerate(items) if index not in indices]
+        elif "name" in request:
+            remaining = [item for item in items if item.name != request["name"]]
+        else:
+            raise RequestError("remove requiere 'indices' o 'name'")
+        removed = len(items) - len(remaining)
+        self._engine.items = type(items)(remaining) if removed else items
+        return {"removed": removed, "size": len(remaining)}
+
+    async def _snapshot(self, request: dict) -> dict:
+        path = request.get("path")
+        if not path:
+            raise RequestError("snapshot requiere 'path'")
+        try:
+            fmt = detect_format(path)
+        except ValueError as error:
+            raise RequestError(str(error)) from error
+        items = [Item(item.name, item.sell_in, item.quality) for item in self._engine.items]
+
+        def write() -> None:
+            with open(path, "w", encoding="utf-8", newline="") as stream:
+                write_items(items, stream, fmt)
+
+        # La escritura corre en un hilo para no frenar a otros lectores.
+        await asyncio.to_thread(write)
+        return {"path": str(path), "items": len(items), "day": self._day}
+
+    def _stats(self, request: dict) -> dict:
+        return {
+            "day": self._day,
+            "size": len(self._engine.items),
+            "latency": {op: stats.as_dict() for op, stats in self._latencies.items()},
+        }
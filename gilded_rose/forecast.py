@@ -0,0 +1,243 @@
+"""Pronóstico de la calidad de cada item como trayectoria lineal por tramos.
+
+La calidad acumulada de un item cambia con pendiente constante entre puntos de
+quiebre conocidos de antemano: el vencimiento y, para los Backstage passes, los
+umbrales de 10 y 5 días y el concierto. Los límites de calidad se aplican en la
+dirección del cambio, así que el valor de cada día es el acumulado acotado (ver
+closed_form). Una Trajectory guarda esos tramos ya acotados y responde consultas
+sobre cualquier día sin simular día por día ni materializar la serie.
+"""
+
+from bisect import bisect_right
+from collections.abc import Iterable
+from functools import cached_property
+from typing import NamedTuple
+
+from gilded_rose.categories import ItemCategory, classify
+from gilded_rose.constants import (
+    AGED_BRIE_EXPIRED_INCREMENT,
+    AGED_BRIE_INCREMENT,
+    BACKSTAGE_EXPIRED_QUALITY,
+    BACKSTAGE_FAR_INCREMENT,
+    BACKSTAGE_FIRST_THRESHOLD,
+    BACKSTAGE_MEDIUM_INCREMENT,
+    BACKSTAGE_NEAR_INCREMENT,
+    BACKSTAGE_SECOND_THRESHOLD,
+    CONJURED_DAILY_DECREMENT,
+    CONJURED_EXPIRED_DECREMENT,
+    MAX_QUALITY,
+    MIN_QUALITY,
+    NORMAL_DAILY_DECREMENT,
+    NORMAL_EXPIRED_DECREMENT,
+    NORMAL_SELL_IN_DECREMENT,
+)
+from gilded_rose.models import Item
+
+
+class Segment(NamedTuple):
+    """Tramo de una trayectoria: quality + slope * (día - start) para start <= día < end.
+
+    Attributes:
+        start (int): Primer día del tramo.
+        end (int | None): Día siguiente al último; None si el tramo no termina.
+        quality (int): Calidad en el día start.
+        slope (int): Cambio de calidad por día dentro del tramo.
+
+    """
+
+    start: int
+    end: int | None
+    quality: int
+    slope: int
+
+    def value_at(self, day: int) -> int:
+        return self.quality + self.slope * (day - self.start)
+
+
+def _aging_pieces(sell_in: int, fresh_slope: int, expired_slope: int) -> list[tuple[int, int]]:
+    """Tramos (día de inicio, pendiente) de un item que envejece de forma estándar."""
+    return [(0, fresh_slope), (max(sell_in, 0), expired_slope)]
+
+
+def _raw_pieces(category: ItemCategory, sell_in: int) -> tuple[list[tuple[int, int]], int | None]:
+    """Tramos de la calidad sin acotar y día en que la calidad pasa a ser fija, si existe.
+
+    El tramo (día, pendiente) vale desde ese día hasta el inicio del siguiente.
+    """
+    if category is ItemCategory.NORMAL:
+        daily, expired = -NORMAL_DAILY_DECREMENT, -NORMAL_EXPIRED_DECREMENT
+        return _aging_pieces(sell_in, daily, daily + expired), None
+    if category is ItemCategory.CONJURED:
+        daily, expired = -CONJURED_DAILY_DECREMENT, -CONJURED_EXPIRED_DECREMENT
+        return _aging_pieces(sell_in, daily, daily + expired), None
+    if category is ItemCategory.AGED_BRIE:
+        daily, expired = AGED_BRIE_INCREMENT, AGED_BRIE_EXPIRED_INCREMENT
+        return _aging_pieces(sell_in, daily, daily + expired), None
+    if category is ItemCategory.BACKSTAGE_PASSES:
+        # El día k usa el sell_in previo, sell_in - k + 1, para elegir el tramo.
+        pieces = [
+            (0, BACKSTAGE_FAR_INCREMENT),
+            (max(0, sell_in - BACKSTAGE_FIRST_THRESHOLD + 1), BACKSTAGE_MEDIUM_INCREMENT),
+            (max(0, sell_in - BACKSTAGE_SECOND_THRESHOLD + 1), BACKSTAGE_NEAR_INCREMENT),
+        ]
+        return pieces, max(sell_in, 0) + 1
+    return [(0, 0)], None
+
+
+def _clamp_piece(start: int, end: int | None, raw: int, slope: int) -> list[Segment]:
+    """Acota un tramo lineal en el límite hacia el que avanza."""
+    if slope > 0:
+        if raw >= MAX_QUALITY:
+            return [Segment(start, end, MAX_QUALITY, 0)]
+        hit = start - (raw - MAX_QUALITY) // slope
+        limit = MAX_QUALITY
+    elif slope < 0:
+        if raw <= MIN_QUALITY:
+            return [Segment(start, end, MIN_QUALITY, 0)]
+        hit = start + (raw - MIN_QUALITY + -slope - 1) // -slope
+        limit = MIN_QUALITY
+    else:
+        return [Segment(start, end, raw, 0)]
+    if end is not None and hit >= end:
+        return [Segment(start, end, raw, slope)]
+    return [Segment(start, hit, raw, slope), Segment(hit, end, limit, 0)]
+
+
+def _build_segments(category: ItemCategory, sell_in: int, quality: int) -> tuple[Segment, ...]:
+    """Construye los tramos acotados de una trayectoria a partir del día 0."""
+    pieces, fixed_day = _raw_pieces(category, sell_in)
+    bounds = [start for start, _ in pieces[1:]] + [fixed_day]
+    segments: list[Segment] = []
+    raw = quality
+    for (start, slope), end in zip(pieces, bounds, strict=True):
+        # El acotado rige desde el día 1: el día 0 es el valor actual tal cual.
+        first = max(start, 1)
+        first_raw = raw + slope * (first - start)
+        if end is None or first < end:
+            segments.extend(_clamp_piece(first, end, first_raw, slope))
+        if end is not None:
+            raw += slope * (end - start)
+    if fixed_day is not None:
+        segments.append(Segment(fixed_day, None, BACKSTAGE_EXPIRED_QUALITY, 0))
+
+    head = segments[0]
+    if head.quality - head.slope == quality:
+        segments[0] = Segment(0, head.end, quality, head.slope)
+    else:
+        segments.insert(0, Segment(0, 1, quality, 0))
+    return tuple(_merge(segments))
+
+
+def _merge(segments: list[Segment]) -> list[Segment]:
+    """Une tramos consecutivos que forman una misma recta."""
+    merged = [segments[0]]
+    for segment in segments[1:]:
+        last = merged[-1]
+        if segment.slope == last.slope and last.value_at(segment.start) == segment.quality:
+            merged[-1] = Segment(last.start, segment.end, last.quality, last.slope)
+        else:
+            merged.append(segment)
+    return merged
+
+
+class Trajectory:
+    """Trayectoria perezosa de un item: los tramos se calculan en la primera consulta.
+
+    El día 0 es el estado actual; el día d es el estado luego de d llamadas a
+    GildedRose.update_quality.
+    """
+
+    def __init__(self, category: ItemCategory, sell_in: int, quality: int) -> None:
+        """Guarda el estado inicial del item.
+
+        Args:
+            category (ItemCategory): Categoría del item.
+            sell_in (int): Días de venta actuales.
+            quality (int): Calidad actual.
+
+        """
+        self.category = category
+        self.sell_in = sell_in
+        self.quality = quality
+
+    @classmethod
+    def from_item(cls, item: Item) -> "Trajectory":
+        """Trayectoria de un Item a partir de su estado actual.
+
+        Args:
+            item (Item): Item a pronosticar.
+
+        """
+        return cls(classify(item.name), item.sell_in, item.quality)
+
+    @cached_property
+    def segments(self) -> tuple[Segment, ...]:
+        """Tramos lineales de la trayectoria, ordenados por día."""
+        return _build_segments(self.category, self.sell_in, self.quality)
+
+    @cached_property
+    def _starts(self) -> list[int]:
+        return [segment.start for segment in self.segments]
+
+    @staticmethod
+    def _check_day(day: int) -> None:
+        if day < 0:
+            raise ValueError("El día no puede ser negativo")
+
+    def sell_in_at(self, day: int) -> int:
+        """sell_in luego de `day` días."""
+        self._check_day(day)
+        if self.category is ItemCategory.SULFURAS:
+            return self.sell_in
+        return self.sell_in - day * NORMAL_SELL_IN_DECREMENT
+
+    def quality_at(self, day: int) -> int:
+        """Calidad luego de `day` días, en O(log tramos)."""
+        self._check_day(day)
+        return self.segments[bisect_right(self._starts, day) - 1].value_at(day)
+
+    def first_day_at(self, quality: int) -> int | None:
+        """Primer día en que la calidad vale exactamente `quality`, o None si nunca ocurre.
+
+        Args:
+            quality (int): Calidad buscada, p.ej. MIN_QUALITY o MAX_QUALITY.
+
+        """
+        for segment in self.segments:
+            if segment.slope == 0:
+                if segment.quality == quality:
+                    return segment.start
+                continue
+            steps, remainder = divmod(quality - segment.quality, segment.slope)
+            day = segment.start + steps
+            if remainder == 0 and steps >= 0 and (segment.end is None or day < segment.end):
+                return day
+        return None
+
+    def total_value(self, start: int, end: int) -> int:
+        """Suma de la calidad de los días start <= día < end.
+
+        Args:
+            start (int): Primer día de la ventana.
+            end (int): Día siguiente al último de la ventana.
+
+        """
+        self._check_day(start)
+        total = 0
+        for segment in self.segments:
+            low = max(start, segment.start)
+            high = end if segment.end is None else min(end, segment.end)
+            if low < high:
+                count = high - low
+                total += count * segment.value_at(low) + segment.slope * count * (count - 1) // 2
+        return total
+
+
+def forecast(items: Iterable[Item]) -> list[Trajectory]:
+    """Trayectorias perezosas de cada item, en el mismo orden.
+
+    Args:
+        items (Iterable[Item]): Items a pronosticar; no se modifican.
+
+    """
+    return [Trajectory.from_item(item) for item in items]
@@ -0,0 +1,181 @@
+"""Historia de días de un inventario con checkpoints, viaje en el tiempo y replay.
+
+InventoryHistory avanza un GildedRose y guarda:
+
+- Checkpoints completos cada `checkpoint_interval` días, en un CompactInventory.
+- Entre checkpoints, sólo los cambios de calidad de cada día (posición y valor
+  nuevo en dos arreglos compactos). sell_in no se guarda: salvo Sulfuras, todos
+  los items pierden exactamente NORMAL_SELL_IN_DECREMENT por día, así que se
+  deduce de los días transcurridos desde el checkpoint.
+
+La memoria crece con la cantidad de cambios de calidad (más un checkpoint por
+intervalo) y restaurar un día cuesta a lo sumo un intervalo de deltas.
+"""
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator
+
+from gilded_rose.categories import ItemCategory, classify
+from gilded_rose.changes import ItemChange
+from gilded_rose.compact import CompactInventory
+from gilded_rose.constants import NORMAL_SELL_IN_DECREMENT
+from gilded_rose.core import GildedRose
+from gilded_rose.models import Item
+
+DEFAULT_CHECKPOINT_INTERVAL = 30
+INDEX_TYPECODE = "Q"
+QUALITY_TYPECODE = "q"
+
+
+class InventoryHistory:
+    """Capa de historia alrededor de un GildedRose."""
+
+    def __init__(
+        self, gilded_rose: GildedRose, checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL
+    ) -> None:
+        """Toma el checkpoint del día 0.
+
+        Args:
+            gilded_rose (GildedRose): Motor a registrar; no debe usar
+                track_settled ni instrumentación (ver update_quality_with_changes).
+            checkpoint_interval (int): Días entre checkpoints completos.
+
+        """
+        if checkpoint_interval < 1:
+            raise ValueError("El intervalo de checkpoints debe ser positivo")
+        self._engine = gilded_rose
+        self._interval = checkpoint_interval
+        self._day = 0
+        self._checkpoint_days: list[int] = []
+        self._checkpoints: list[CompactInventory] = []
+        self._deltas: list[tuple[array, array]] = []
+        self._checkpoint()
+
+    @property
+    def day(self) -> int:
+        """Último día registrado."""
+        return self._day
+
+    @property
+    def checkpoint_days(self) -> tuple[int, ...]:
+        """Días con checkpoint completo."""
+        return tuple(self._checkpoint_days)
+
+    def _checkpoint(self) -> None:
+        """Guarda el estado actual como checkpoint del día actual."""
+        snapshot = CompactInventory.from_items(self._engine.items)
+        if self._checkpoint_days and self._checkpoint_days[-1] == self._day:
+            self._checkpoints[-1] = snapshot
+        else:
+            self._checkpoint_days.append(self._day)
+            self._checkpoints.append(snapshot)
+
+    def tick(self) -> list[ItemChange]:
+        """Avanza el motor un día y registra los cambios de calidad.
+
+        Devuelve los cambios de calidad del día.
+        """
+        changes = self._engine.update_quality_with_changes(quality_only=True)
+        self._deltas.append(
+            (
+                array(INDEX_TYPECODE, [change.index for change in changes]),
+                array(QUALITY_TYPECODE, [change.new_quality for change in changes]),
+            )
+        )
+        self._day += 1
+        if self._day % self._interval == 0:
+            self._checkpoint()
+        return changes
+
+    def add_items(self, items: list[Item]) -> None:
+        """Agrega items al motor y rehace el checkpoint del día actual.
+
+        Args:
+            items (list): Items a agregar.
+
+        """
+        self._engine.add_items(items)
+        self._checkpoint()
+
+    def nbytes(self) -> int:
+        """Bytes ocupados por checkpoints y deltas (sin las tablas de nombres)."""
+        deltas = sum(
+            indices.itemsize * len(indices) + qualities.itemsize * len(qualities)
+            for indices, qualities in self._deltas
+        )
+        return deltas + sum(checkpoint.nbytes() for checkpoint in self._checkpoints)
+
+    def _check_day(self, day: int) -> None:
+        if not 0 <= day <= self._day:
+            raise ValueError(f"El día {day} está fuera de la historia (0..{self._day})")
+
+    def _apply_delta(self, items: list[Item], day: int) -> None:
+        """Aplica a `items` los cambios de calidad registrados para `day`."""
+        indices, qualities = self._deltas[day - 1]
+        for index, quality in zip(indices, qualities, strict=True):
+            items[index].quality = quality
+
+    @staticmethod
+    def _age_sell_in(items: list[Item], days: int) -> None:
+        """Descuenta `days` días de sell_in a todos los items salvo Sulfuras."""
+        for item in items:
+            if classify(item.name) is not ItemCategory.SULFURAS:
+                item.sell_in -= days * NORMAL_SELL_IN_DECREMENT
+
+    def state_at(self, day: int) -> list[Item]:
+        """Estado del inventario en un día pasado, como Item nuevos.
+
+        Parte del checkpoint más cercano anterior y aplica a lo sumo
+        checkpoint_interval deltas.
+
+        Args:
+            day (int): Día a restaurar, entre 0 y day.
+
+        """
+        self._check_day(day)
+        position = bisect_right(self._checkpoint_days, day) - 1
+        checkpoint_day = self._checkpoint_days[position]
+        items = self._checkpoints[position].to_items()
+        for delta_day in range(checkpoint_day + 1, day + 1):
+            self._apply_delta(items, delta_day)
+        self._age_sell_in(items, day - checkpoint_day)
+        return items
+
+    def restore(self, day: int) -> GildedRose:
+        """Motor nuevo sobre el estado de un día pasado, para simular hacia adelante.
+
+        Args:
+            day (int): Día a restaurar.
+
+        """
+        return GildedRose(self.state_at(day))
+
+    def replay(self, start: int = 0, stop: int | None = None) -> Iterator[tuple[int, list[Item]]]:
+        """Recorre los días registrados de start a stop (incluido), en orden.
+
+        Se devuelve siempre la misma lista de Item, actualizada en el lugar de
+        un día al siguiente; hay que copiarla si se quiere conservar un día.
+
+        Args:
+            start (int): Primer día.
+            stop (int | None): Último día; por defecto, el último registrado.
+
+        """
+        stop = self._day if stop is None else stop
+        self._check_day(start)
+        self._check_day(stop)
+        items = self.state_at(start)
+        yield start, items
+        for day in range(start + 1, stop + 1):
+            self._apply_delta(items, day)
+            self._age_sell_in(items, 1)
+            self._append_added(items, day)
+            yield day, items
+
+    def _append_added(self, items: list[Item], day: int) -> None:
+        """Agrega a `items` los items incorporados con add_items en `day`, si los hubo."""
+        position = bisect_right(self._checkpoint_days, day) - 1
+        checkpoint = self._checkpoints[position]
+        if self._checkpoint_days[position] == day and len(checkpoint) > len(items):
+            items.extend(checkpoint.to_items()[len(items) :])
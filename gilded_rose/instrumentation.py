@@ -0,0 +1,157 @@
+"""Instrumentación opcional de GildedRose.update_quality.
+
+Se activa con GildedRose.enable_instrumentation. Mientras está desactivada,
+update_quality no ejecuta ninguna llamada adicional por item.
+"""
+
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from gilded_rose.categories import ItemCategory
+from gilded_rose.constants import MAX_QUALITY, MIN_QUALITY, MIN_SELL_IN
+from gilded_rose.models import Item
+
+
+@dataclass
+class CategoryStats:
+    """Métricas de una categoría durante uno o más días."""
+
+    items: int = 0
+    seconds: float = 0.0
+    min_clamps: int = 0
+    max_clamps: int = 0
+    expired: int = 0
+
+    def add(self, other: "CategoryStats") -> None:
+        """Acumula las métricas de `other` en esta instancia."""
+        self.items += other.items
+        self.seconds += other.seconds
+        self.min_clamps += other.min_clamps
+        self.max_clamps += other.max_clamps
+        self.expired += other.expired
+
+
+def _empty_categories() -> dict[ItemCategory, CategoryStats]:
+    return {category: CategoryStats() for category in ItemCategory}
+
+
+@dataclass
+class TickStats:
+    """Métricas por categoría de un día (o acumuladas de varios días).
+
+    Attributes:
+        ticks (int): Cantidad de días incluidos.
+        categories (dict): Métricas de cada categoría.
+
+    """
+
+    ticks: int = 0
+    categories: dict[ItemCategory, CategoryStats] = field(default_factory=_empty_categories)
+
+    @property
+    def total(self) -> CategoryStats:
+        """Métricas sumadas de todas las categorías."""
+        total = CategoryStats()
+        for stats in self.categories.values():
+            total.add(stats)
+        return total
+
+    def add(self, other: "TickStats") -> None:
+        """Acumula las métricas de `other` en esta instancia."""
+        self.ticks += other.ticks
+        for category, stats in other.categories.items():
+            self.categories[category].add(stats)
+
+
+TickCallback = Callable[[TickStats], None]
+
+
+class Instrumentation:
+    """Recolecta métricas de cada día y las publica a los callbacks registrados.
+
+    Métricas por categoría:
+    - items: cantidad de items en el grupo
+    - seconds: tiempo total en el método _update_* de la categoría
+    - min_clamps / max_clamps: veces que se aplicó MIN_QUALITY / MAX_QUALITY
+    - expired: items que vencieron ese día (sell_in pasó de >= 0 a < 0)
+    """
+
+    def __init__(self, callbacks: Iterable[TickCallback] = ()) -> None:
+        """Inicializa la instrumentación.
+
+        Args:
+            callbacks (Iterable[TickCallback]): Funciones a invocar al final de
+                cada día con las métricas de ese día.
+
+        """
+        self.callbacks = list(callbacks)
+        self.totals = TickStats()
+        self.last_tick: TickStats | None = None
+        self._tick = TickStats()
+        self._current = CategoryStats()
+
+    def add_callback(self, callback: TickCallback) -> None:
+        """Registra una función a invocar al final de cada día."""
+        self.callbacks.append(callback)
+
+    def begin_tick(self, group_sizes: dict[ItemCategory, int]) -> None:
+        """Comienza a medir un día.
+
+        Args:
+            group_sizes (dict): Cantidad de items de cada categoría.
+
+        """
+        self._tick = TickStats(ticks=1)
+        for category, size in group_sizes.items():
+            self._tick.categories[category].items = size
+
+    def end_tick(self) -> None:
+        """Cierra el día: acumula los totales y notifica a los callbacks."""
+        tick = self._tick
+        self.totals.add(tick)
+        self.last_tick = tick
+        for callback in self.callbacks:
+            callback(tick)
+
+    @contextmanager
+    def measure(self, category: ItemCategory) -> Iterator[None]:
+        """Mide el tiempo del bloque y atribuye los clamps a `category`."""
+        self._current = self._tick.categories[category]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._current.seconds += time.perf_counter() - start
+
+    def wrap_update(self, update: Callable[[Item], None]) -> Callable[[Item], None]:
+        """Envuelve un método _update_* para contar los items que vencen."""
+
+        def counting_update(item: Item) -> None:
+            was_fresh = item.sell_in >= MIN_SELL_IN
+            update(item)
+            if was_fresh and item.sell_in < MIN_SELL_IN:
+                self._current.expired += 1
+
+        return counting_update
+
+    def wrap_decrease(self, decrease: Callable[[Item, int], None]) -> Callable[[Item, int], None]:
+        """Envuelve _decrease_quality_safe para contar los clamps en MIN_QUALITY."""
+
+        def counting_decrease(item: Item, amount: int) -> None:
+            if item.quality - amount < MIN_QUALITY:
+                self._current.min_clamps += 1
+            decrease(item, amount)
+
+        return counting_decrease
+
+    def wrap_increase(self, increase: Callable[[Item, int], None]) -> Callable[[Item, int], None]:
+        """Envuelve _increase_quality_safe para contar los clamps en MAX_QUALITY."""
+
+        def counting_increase(item: Item, amount: int) -> None:
+            if item.quality + amount > MAX_QUALITY:
+                self._current.max_clamps += 1
+            increase(item, amount)
+
+        return counting_increase
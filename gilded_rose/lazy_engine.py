@@ -0,0 +1,167 @@
+"""Motor por eventos: sólo toca un item el día en que cambia su pendiente.
+
+Entre los días clave (umbrales de los Backstage passes, vencimiento, concierto
+y los límites de calidad) la calidad de cada item cambia de forma lineal; esos
+tramos son los de forecast.Trajectory. LazyGildedRose guarda, por item, el tramo
+vigente y una cola de prioridad con el día global en que termina. Avanzar un
+día sólo procesa los items cuyo tramo termina ese día; sell_in y quality se
+calculan recién al leerlos, a partir del tramo vigente y del día actual.
+
+Los resultados son idénticos a llamar GildedRose.update_quality día por día.
+"""
+
+import heapq
+from collections.abc import Iterable, Iterator, Sequence
+from functools import lru_cache
+
+from gilded_rose.categories import ItemCategory, classify
+from gilded_rose.constants import NORMAL_SELL_IN_DECREMENT
+from gilded_rose.forecast import Segment, Trajectory
+from gilded_rose.models import Item
+from gilded_rose.validated import check_item_types
+
+SEGMENTS_CACHE_SIZE = 1 << 16
+
+
+@lru_cache(maxsize=SEGMENTS_CACHE_SIZE)
+def _segments(category: ItemCategory, sell_in: int, quality: int) -> tuple[Segment, ...]:
+    """Tramos relativos al día de carga; los items con igual estado comparten la tupla."""
+    return Trajectory(category, sell_in, quality).segments
+
+
+class LazyGildedRose:
+    """Inventario que avanza en O(eventos del día) en lugar de O(items)."""
+
+    def __init__(self, items: Iterable[Item] = ()) -> None:
+        """Calcula los tramos de cada item y encola su primer evento.
+
+        Args:
+            items (Iterable[Item]): Items iniciales; no se modifican (ver sync_items).
+
+        """
+        self._day = 0
+        self._events_processed = 0
+        self._names: list[str] = []
+        self._sulfuras: list[bool] = []
+        self._anchors: list[int] = []
+        self._sell_in: list[int] = []
+        self._segments: list[tuple[Segment, ...]] = []
+        self._positions: list[int] = []
+        self._heap: list[tuple[int, int]] = []
+        self.add_items(items)
+
+    @property
+    def day(self) -> int:
+        """Días avanzados desde la creación del motor."""
+        return self._day
+
+    @property
+    def pending_events(self) -> int:
+        """Eventos encolados (a lo sumo uno por item)."""
+        return len(self._heap)
+
+    @property
+    def events_processed(self) -> int:
+        """Eventos procesados desde la creación del motor."""
+        return self._events_processed
+
+    def add_items(self, items: Iterable[Item]) -> None:
+        """Agrega items con su estado actual como estado del día actual.
+
+        Args:
+            items (Iterable[Item]): Items a agregar.
+
+        """
+        items = list(items)
+        check_item_types(items)
+        for item in items:
+            index = len(self._names)
+            category = classify(item.name)
+            segments = _segments(category, item.sell_in, item.quality)
+            self._names.append(item.name)
+            self._sulfuras.append(category is ItemCategory.SULFURAS)
+            self._anchors.append(self._day)
+            self._sell_in.append(item.sell_in)
+            self._segments.append(segments)
+            self._positions.append(0)
+            self._schedule(index)
+
+    def _schedule(self, index: int) -> None:
+        """Encola el fin del tramo vigente de un item, si el tramo termina."""
+        end = self._segments[index][self._positions[index]].end
+        if end is not None:
+            heapq.heappush(self._heap, (self._anchors[index] + end, index))
+
+    def advance(self, days: int) -> int:
+        """Avanza `days` días procesando sólo los eventos vencidos.
+
+        Devuelve la cantidad de eventos procesados.
+
+        Args:
+            days (int): Cantidad de días a avanzar.
+
+        """
+        if days < 0:
+            raise ValueError("Los días a avanzar no pueden ser negativos")
+        self._day += days
+        heap = self._heap
+        processed = 0
+        while heap and heap[0][0] <= self._day:
+            _, index = heapq.heappop(heap)
+            self._positions[index] += 1
+            self._schedule(index)
+            processed += 1
+        self._events_processed += processed
+        return processed
+
+    def tick(self) -> int:
+        """Avanza un día; devuelve la cantidad de eventos procesados."""
+        return self.advance(1)
+
+    def update_quality(self) -> None:
+        """Alias de tick, compatible con GildedRose."""
+        self.tick()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def state(self, index: int) -> tuple[int, int]:
+        """(sell_in, quality) actuales de un item, calculados al leerlos.
+
+        Args:
+            index (int): Posición del item.
+
+        """
+        elapsed = self._day - self._anchors[index]
+        sell_in = self._sell_in[index]
+        if not self._sulfuras[index]:
+            sell_in -= elapsed * NORMAL_SELL_IN_DECREMENT
+        segment = self._segments[index][self._positions[index]]
+        return sell_in, segment.value_at(elapsed)
+
+    def __getitem__(self, index: int) -> Item:
+        """Item nuevo con el estado actual de la posición `index`."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Índice fuera de rango")
+        return Item(self._names[index], *self.state(index))
+
+    def __iter__(self) -> Iterator[Item]:
+        return (self[index] for index in range(len(self)))
+
+    def to_items(self) -> list[Item]:
+        """Exporta el inventario como una lista nueva de Item, en el orden original."""
+        return list(self)
+
+    def sync_items(self, items: Sequence[Item]) -> None:
+        """Copia sell_in y quality actuales a los items desde los que se cargó el motor.
+
+        Args:
+            items (Sequence[Item]): Items en el mismo orden en que se agregaron.
+
+        """
+        if len(items) != len(self):
+            raise ValueError("La cantidad de items no coincide con la del motor")
+        for index, item in enumerate(items):
+            item.sell_in, item.quality = self.state(index)
@@ -0,0 +1,152 @@
+"""Actualización en paralelo sobre memoria compartida (requiere NumPy).
+
+Las columnas sell_in y quality del inventario columnar se alojan en bloques de
+multiprocessing.shared_memory. Cada proceso del pool se conecta una sola vez a
+esos bloques; por cada día sólo viajan tuplas (categoría, inicio, fin), nunca
+los items.
+"""
+
+import os
+import weakref
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from gilded_rose.categories import ItemCategory
+from gilded_rose.columnar import INT_DTYPE, ColumnarInventory, update_rows
+from gilded_rose.models import Item
+
+DEFAULT_CHUNK_SIZE = 1 << 18
+
+# Estado de cada proceso worker, inicializado por _attach_columns.
+_worker_blocks: list[shared_memory.SharedMemory] = []
+_worker_columns: tuple[np.ndarray, np.ndarray] | None = None
+
+
+def _attach_columns(sell_in_name: str, quality_name: str, length: int) -> None:
+    """Inicializador de cada worker: se conecta a las columnas compartidas."""
+    global _worker_columns
+    blocks = [shared_memory.SharedMemory(name=name) for name in (sell_in_name, quality_name)]
+    _worker_blocks[:] = blocks
+    _worker_columns = tuple(
+        np.ndarray((length,), dtype=INT_DTYPE, buffer=block.buf) for block in blocks
+    )
+
+
+def _release_resources(
+    executor: ProcessPoolExecutor, blocks: list[shared_memory.SharedMemory]
+) -> None:
+    """Detiene el pool y elimina los bloques compartidos.
+
+    Se usa como finalizador: no debe referenciar al motor. El nombre del bloque
+    se elimina primero, así /dev/shm queda limpio aunque alguna vista siga abierta.
+    """
+    executor.shutdown()
+    for block in blocks:
+        try:
+            block.unlink()
+        except FileNotFoundError:
+            pass
+        try:
+            block.close()
+        except BufferError:
+            pass
+
+
+def _update_chunk(task: tuple[int, int, int]) -> None:
+    """Actualiza un rango de filas de una misma categoría dentro de un worker."""
+    category, start, stop = task
+    sell_in, quality = _worker_columns
+    update_rows(ItemCategory(category), sell_in[start:stop], quality[start:stop])
+
+
+class ParallelGildedRose:
+    """Inventario que reparte la actualización diaria entre varios procesos.
+
+    Produce los mismos resultados que GildedRose.update_quality. Conviene
+    cerrarlo con close() (o usarlo como context manager) para liberar la memoria
+    compartida y el pool de procesos en un momento conocido; si no, se liberan
+    cuando el motor se recolecta o al terminar el intérprete.
+    """
+
+    def __init__(
+        self,
+        items: Sequence[Item],
+        workers: int | None = None,
+        chunk_size: int | None = None,
+    ) -> None:
+        """Carga los items en memoria compartida y arranca el pool de procesos.
+
+        Args:
+            items (Sequence[Item]): Items a gestionar.
+            workers (int | None): Cantidad de procesos; por defecto os.cpu_count().
+            chunk_size (int | None): Filas por tarea; por defecto DEFAULT_CHUNK_SIZE.
+
+        """
+        if not items:
+            raise ValueError("Los items no pueden ser vacíos")
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.chunk_size = DEFAULT_CHUNK_SIZE if chunk_size is None else chunk_size
+        if self.workers < 1 or self.chunk_size < 1:
+            raise ValueError("workers y chunk_size deben ser positivos")
+
+        self._inventory = ColumnarInventory.from_items(items)
+        length = len(self._inventory)
+        nbytes = length * np.dtype(INT_DTYPE).itemsize
+        self._blocks = [shared_memory.SharedMemory(create=True, size=nbytes) for _ in range(2)]
+        self._inventory.use_buffers(
+            *(np.ndarray((length,), dtype=INT_DTYPE, buffer=block.buf) for block in self._blocks)
+        )
+        self._tasks = self._plan_tasks()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_attach_columns,
+            initargs=(self._blocks[0].name, self._blocks[1].name, length),
+        )
+        self._finalizer = weakref.finalize(
+            self, _release_resources, self._executor, list(self._blocks)
+        )
+
+    def _plan_tasks(self) -> list[tuple[int, int, int]]:
+        """Divide cada categoría en rangos de a lo sumo chunk_size filas."""
+        tasks = []
+        for category, rows in self._inventory.category_slices().items():
+            if category == ItemCategory.SULFURAS:
+                continue
+            for start in range(rows.start, rows.stop, self.chunk_size):
+                tasks.append((int(category), start, min(start + self.chunk_size, rows.stop)))
+        return tasks
+
+    def __len__(self) -> int:
+        return len(self._inventory)
+
+    def __enter__(self) -> "ParallelGildedRose":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def update_quality(self) -> None:
+        """Actualiza todas las filas un día, repartiendo los rangos entre los workers."""
+        for _ in self._executor.map(_update_chunk, self._tasks):
+            pass
+
+    def to_items(self) -> list[Item]:
+        """Exporta el inventario como una lista nueva de Item, en el orden original."""
+        return self._inventory.to_items()
+
+    def sync_items(self, items: Sequence[Item]) -> None:
+        """Copia sell_in y quality a los items desde los que se cargó el inventario."""
+        self._inventory.sync_items(items)
+
+    def close(self) -> None:
+        """Detiene el pool y libera la memoria compartida."""
+        if not self._blocks:
+            return
+        # Las columnas dejan de apuntar al buffer compartido antes de cerrarlo.
+        self._inventory.sell_in = self._inventory.sell_in.copy()
+        self._inventory.quality = self._inventory.quality.copy()
+        self._finalizer()
+        self._blocks = []
@@ -0,0 +1,66 @@
+"""Parámetros de las reglas de actualización como un valor, en lugar de constantes.
+
+RuleParameters reúne los valores de gilded_rose/constants.py que definen las
+reglas de calidad, de modo que puedan evaluarse variantes (p.ej. en
+scenarios.py) sin modificar el módulo de constantes.
+"""
+
+from dataclasses import dataclass, fields, replace
+
+from gilded_rose.constants import (
+    AGED_BRIE_EXPIRED_INCREMENT,
+    AGED_BRIE_INCREMENT,
+    BACKSTAGE_EXPIRED_QUALITY,
+    BACKSTAGE_FAR_INCREMENT,
+    BACKSTAGE_FIRST_THRESHOLD,
+    BACKSTAGE_MEDIUM_INCREMENT,
+    BACKSTAGE_NEAR_INCREMENT,
+    BACKSTAGE_SECOND_THRESHOLD,
+    CONJURED_DAILY_DECREMENT,
+    CONJURED_EXPIRED_DECREMENT,
+    MAX_QUALITY,
+    MIN_QUALITY,
+    NORMAL_DAILY_DECREMENT,
+    NORMAL_EXPIRED_DECREMENT,
+)
+
+
+@dataclass(frozen=True)
+class RuleParameters:
+    """Valores de las reglas de calidad; por defecto, los de constants.py."""
+
+    max_quality: int = MAX_QUALITY
+    min_quality: int = MIN_QUALITY
+    normal_daily_decrement: int = NORMAL_DAILY_DECREMENT
+    normal_expired_decrement: int = NORMAL_EXPIRED_DECREMENT
+    conjured_daily_decrement: int = CONJURED_DAILY_DECREMENT
+    conjured_expired_decrement: int = CONJURED_EXPIRED_DECREMENT
+    aged_brie_increment: int = AGED_BRIE_INCREMENT
+    aged_brie_expired_increment: int = AGED_BRIE_EXPIRED_INCREMENT
+    backstage_first_threshold: int = BACKSTAGE_FIRST_THRESHOLD
+    backstage_second_threshold: int = BACKSTAGE_SECOND_THRESHOLD
+    backstage_far_increment: int = BACKSTAGE_FAR_INCREMENT
+    backstage_medium_increment: int = BACKSTAGE_MEDIUM_INCREMENT
+    backstage_near_increment: int = BACKSTAGE_NEAR_INCREMENT
+    backstage_expired_quality: int = BACKSTAGE_EXPIRED_QUALITY
+
+    def __post_init__(self) -> None:
+        if self.min_quality > self.max_quality:
+            raise ValueError("min_quality no puede ser mayor que max_quality")
+        if self.backstage_second_threshold > self.backstage_first_threshold:
+            raise ValueError("Los umbrales de backstage deben ser decrecientes")
+
+    def with_overrides(self, **overrides: int) -> "RuleParameters":
+        """Copia con algunos valores reemplazados.
+
+        Args:
+            **overrides (int): Valores a reemplazar, por nombre de campo.
+
+        """
+        unknown = set(overrides) - {field.name for field in fields(self)}
+        if unknown:
+            raise ValueError(f"Parámetros desconocidos: {sorted(unknown)}")
+        return replace(self, **overrides)
+
+
+DEFAULT_PARAMETERS = RuleParameters()
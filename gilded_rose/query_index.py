@@ -0,0 +1,212 @@
+"""Índice de consultas por vencimiento y calidad, mantenido entre ticks.
+
+Todos los items salvo Sulfuras pierden exactamente un día de sell_in por tick,
+así que sell_in + día es constante para cada uno: el índice de vencimientos
+guarda esa clave en listas ordenadas (una por categoría) y nunca se reordena;
+las consultas sólo desplazan el rango por el día actual.
+
+El índice de calidad agrupa las posiciones en un diccionario (usado como
+conjunto con orden de inserción) por valor de calidad, más una lista ordenada
+de los valores presentes. La calidad está
+acotada (0..MAX_QUALITY, más la de Sulfuras), así que esa lista tiene a lo sumo
+unas decenas de valores y cada cambio que devuelve
+GildedRose.update_quality_with_changes se aplica en O(1) sin recorrer el
+inventario: un tick cuesta O(cambios).
+
+Las consultas cuestan O(log n + k), con k la cantidad de resultados: cada valor
+de calidad presente en el rango aporta al menos un resultado, así que recorrer
+esos valores no suma más que k pasos.
+"""
+
+from bisect import bisect_left, insort
+
+from gilded_rose.categories import ItemCategory, classify
+from gilded_rose.changes import ItemChange
+from gilded_rose.constants import BACKSTAGE_SECOND_THRESHOLD, MIN_SELL_IN
+from gilded_rose.core import GildedRose
+from gilded_rose.models import Item
+
+# Las posiciones son >= 0, así que (clave, -1) ordena antes que cualquier fila de esa clave.
+_BEFORE = -1
+
+
+class QueryIndex:
+    """Índice de consultas que avanza junto con un GildedRose."""
+
+    def __init__(self, gilded_rose: GildedRose) -> None:
+        """Construye el índice sobre los items actuales del motor.
+
+        Args:
+            gilded_rose (GildedRose): Motor a indexar; no debe usar track_settled
+                ni instrumentación (ver update_quality_with_changes).
+
+        """
+        self._engine = gilded_rose
+        self.rebuild()
+
+    def _check_fresh(self) -> None:
+        """Lanza RuntimeError si el motor cambió de tamaño por fuera del índice."""
+        if len(self._engine.items) != self._size:
+            raise RuntimeError(
+                "El inventario cambió por fuera del índice; usar QueryIndex.add_items, "
+                "QueryIndex.remove_items o llamar a rebuild"
+            )
+
+    @property
+    def day(self) -> int:
+        """Ticks aplicados desde la última reconstrucción."""
+        return self._day
+
+    def rebuild(self) -> None:
+        """Reconstruye el índice desde cero.
+
+        Necesario si los items se modificaron por fuera de tick, add_items o
+        remove_items.
+        """
+        self._day = 0
+        self._size = 0
+        self._expiry: dict[ItemCategory, list[tuple[int, int]]] = {
+            category: [] for category in ItemCategory if category is not ItemCategory.SULFURAS
+        }
+        self._quality: dict[int, dict[int, None]] = {}
+        self._quality_keys: list[int] = []
+        self._index_items(self._engine.items, 0)
+
+    def _index_items(self, items: list[Item], start: int) -> None:
+        """Agrega items cuya primera posición en el motor es `start`."""
+        for index, item in enumerate(items, start):
+            keys = self._expiry.get(classify(item.name))
+            if keys is not None:
+                keys.append((item.sell_in + self._day, index))
+            self._add_quality(item.quality, index)
+        # Las listas ya ordenadas son corridas que el sort de Python fusiona en O(n).
+        for keys in self._expiry.values():
+            keys.sort()
+        self._size += len(items)
+
+    def _add_quality(self, quality: int, index: int) -> None:
+        bucket = self._quality.get(quality)
+        if bucket is None:
+            bucket = self._quality[quality] = {}
+            insort(self._quality_keys, quality)
+        bucket[index] = None
+
+    def _remove_quality(self, quality: int, index: int) -> None:
+        bucket = self._quality[quality]
+        del bucket[index]
+        if not bucket:
+            del self._quality[quality]
+            del self._quality_keys[bisect_left(self._quality_keys, quality)]
+
+    def add_items(self, items: list[Item]) -> None:
+        """Agrega items al motor y al índice.
+
+        Args:
+            items (list): Items a agregar.
+
+        """
+        self._check_fresh()
+        start = len(self._engine.items)
+        self._engine.add_items(items)
+        self._index_items(items, start)
+
+    def remove_items(self, items: list[Item]) -> None:
+        """Quita items del motor y reconstruye el índice, con costo O(n log n).
+
+        Quitar items corre las posiciones de los que quedan, así que el índice
+        no puede corregirse en forma incremental.
+
+        Args:
+            items (list): Items a quitar (ver GildedRose.remove_items).
+
+        """
+        self._engine.remove_items(items)
+        self.rebuild()
+
+    def tick(self) -> list[ItemChange]:
+        """Avanza el motor un día y actualiza el índice con los cambios de calidad.
+
+        Devuelve los cambios de calidad del día.
+        """
+        self._check_fresh()
+        changes = self._engine.update_quality_with_changes(quality_only=True)
+        self._day += 1
+        for change in changes:
+            self._remove_quality(change.old_quality, change.index)
+            self._add_quality(change.new_quality, change.index)
+        return changes
+
+    def _items_at(self, entries: list[tuple[int, int]]) -> list[Item]:
+        self._check_fresh()
+        items = self._engine.items
+        return [items[index] for _, index in entries]
+
+    def _quality_range(self, low: int | None, high: int) -> list[tuple[int, int]]:
+        """Entradas (quality, posición) con low <= quality < high, ordenadas por calidad."""
+        keys = self._quality_keys
+        start = 0 if low is None else bisect_left(keys, low)
+        stop = bisect_left(keys, high)
+        return [
+            (quality, index) for quality in keys[start:stop] for index in self._quality[quality]
+        ]
+
+    def _sell_in_range(self, category: ItemCategory, low: int, high: int) -> list[tuple[int, int]]:
+        """Entradas de una categoría con low <= sell_in < high."""
+        keys = self._expiry[category]
+        start = bisect_left(keys, (low + self._day, _BEFORE))
+        stop = bisect_left(keys, (high + self._day, _BEFORE))
+        return keys[start:stop]
+
+    def expiring_within(self, days: int) -> list[Item]:
+        """Items todavía no vencidos que vencen dentro de `days` ticks.
+
+        Son los de MIN_SELL_IN <= sell_in < MIN_SELL_IN + days. Sulfuras no vence.
+
+        Args:
+            days (int): Horizonte en días.
+
+        """
+        entries = []
+        for category in self._expiry:
+            entries.extend(self._sell_in_range(category, MIN_SELL_IN, MIN_SELL_IN + days))
+        entries.sort()
+        return self._items_at(entries)
+
+    def quality_between(self, low: int, high: int) -> list[Item]:
+        """Items con low <= quality < high, de menor a mayor calidad.
+
+        Entre items de igual calidad el orden no está definido.
+
+        Args:
+            low (int): Calidad mínima (incluida).
+            high (int): Calidad máxima (excluida).
+
+        """
+        return self._items_at(self._quality_range(low, high))
+
+    def quality_below(self, quality: int) -> list[Item]:
+        """Items con calidad menor a `quality`, de menor a mayor.
+
+        Entre items de igual calidad el orden no está definido.
+
+        Args:
+            quality (int): Umbral de calidad (excluido).
+
+        """
+        return self._items_at(self._quality_range(None, quality))
+
+    def backstage_entering_window(
+        self, threshold: int = BACKSTAGE_SECOND_THRESHOLD, days: int = 1
+    ) -> list[Item]:
+        """Backstage passes cuyo sell_in baja de `threshold` dentro de `days` ticks.
+
+        Con los valores por defecto son los pases que mañana entran en la
+        ventana de 5 días, donde la calidad sube de a BACKSTAGE_NEAR_INCREMENT.
+
+        Args:
+            threshold (int): Umbral de sell_in de la ventana.
+            days (int): Horizonte en días.
+
+        """
+        entries = self._sell_in_range(ItemCategory.BACKSTAGE_PASSES, threshold, threshold + days)
+        return self._items_at(entries)
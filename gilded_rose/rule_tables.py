@@ -0,0 +1,216 @@
+"""Compilador de reglas a tablas de transición precalculadas.
+
+Cada categoría se describe con datos (AgingRule) en lugar de un método. El
+compilador evalúa la regla para cada combinación relevante de sell_in y quality
+y guarda la calidad resultante en una tabla plana, de modo que la actualización
+diaria de un item es una búsqueda en la tabla.
+
+Agregar un tipo de item nuevo consiste en agregar una entrada al diccionario de
+reglas y un clasificador que asigne los nombres a esa entrada.
+"""
+
+from collections.abc import Callable, Hashable, Mapping
+from dataclasses import dataclass
+
+from gilded_rose.categories import ItemCategory, classify
+from gilded_rose.constants import (
+    AGED_BRIE_EXPIRED_INCREMENT,
+    AGED_BRIE_INCREMENT,
+    BACKSTAGE_EXPIRED_QUALITY,
+    BACKSTAGE_FAR_INCREMENT,
+    BACKSTAGE_FIRST_THRESHOLD,
+    BACKSTAGE_MEDIUM_INCREMENT,
+    BACKSTAGE_NEAR_INCREMENT,
+    BACKSTAGE_SECOND_THRESHOLD,
+    CONJURED_DAILY_DECREMENT,
+    CONJURED_EXPIRED_DECREMENT,
+    MAX_QUALITY,
+    MIN_QUALITY,
+    MIN_SELL_IN,
+    NORMAL_DAILY_DECREMENT,
+    NORMAL_EXPIRED_DECREMENT,
+    NORMAL_SELL_IN_DECREMENT,
+)
+from gilded_rose.core import GildedRose
+from gilded_rose.models import Item
+
+
+def _adjust(quality: int, delta: int) -> int:
+    """Aplica un delta de calidad acotando en la dirección del cambio."""
+    if delta > 0:
+        return min(MAX_QUALITY, quality + delta)
+    if delta < 0:
+        return max(MIN_QUALITY, quality + delta)
+    return quality
+
+
+@dataclass(frozen=True)
+class AgingRule:
+    """Descripción declarativa de cómo envejece una categoría de items.
+
+    Attributes:
+        daily_delta (int): Cambio diario de calidad si no aplica ningún tramo.
+        expired_delta (int): Cambio adicional cuando el item queda vencido.
+        bands (tuple): Tramos (sell_in mínimo, delta diario), de menor a mayor;
+            se usa el último cuyo mínimo sea <= sell_in.
+        expired_quality (int | None): Si se indica, la calidad pasa a este valor
+            al vencer, en lugar de aplicar expired_delta.
+        sell_in_step (int): Cuánto disminuye sell_in por día (0 = no envejece).
+
+    """
+
+    daily_delta: int
+    expired_delta: int = 0
+    bands: tuple[tuple[int, int], ...] = ()
+    expired_quality: int | None = None
+    sell_in_step: int = NORMAL_SELL_IN_DECREMENT
+
+    @property
+    def is_static(self) -> bool:
+        """True si la regla nunca modifica al item."""
+        return (
+            self.sell_in_step == 0
+            and self.daily_delta == 0
+            and self.expired_delta == 0
+            and self.expired_quality is None
+            and all(delta == 0 for _, delta in self.bands)
+        )
+
+    def daily_delta_for(self, sell_in: int) -> int:
+        """Cambio diario de calidad según los tramos de sell_in."""
+        delta = self.daily_delta
+        for minimum, band_delta in self.bands:
+            if sell_in >= minimum:
+                delta = band_delta
+        return delta
+
+    def breakpoints(self) -> list[int]:
+        """Valores de sell_in a partir de los cuales cambia el comportamiento."""
+        return sorted({minimum for minimum, _ in self.bands} | {MIN_SELL_IN + self.sell_in_step})
+
+    def step(self, sell_in: int, quality: int) -> tuple[int, int]:
+        """Aplica un día de la regla y devuelve (sell_in, quality)."""
+        quality = _adjust(quality, self.daily_delta_for(sell_in))
+        sell_in -= self.sell_in_step
+        if sell_in < MIN_SELL_IN:
+            if self.expired_quality is not None:
+                quality = self.expired_quality
+            else:
+                quality = _adjust(quality, self.expired_delta)
+        return sell_in, quality
+
+
+DEFAULT_RULES: dict[Hashable, AgingRule] = {
+    ItemCategory.NORMAL: AgingRule(-NORMAL_DAILY_DECREMENT, -NORMAL_EXPIRED_DECREMENT),
+    ItemCategory.CONJURED: AgingRule(-CONJURED_DAILY_DECREMENT, -CONJURED_EXPIRED_DECREMENT),
+    ItemCategory.AGED_BRIE: AgingRule(AGED_BRIE_INCREMENT, AGED_BRIE_EXPIRED_INCREMENT),
+    ItemCategory.BACKSTAGE_PASSES: AgingRule(
+        BACKSTAGE_NEAR_INCREMENT,
+        bands=(
+            (BACKSTAGE_SECOND_THRESHOLD, BACKSTAGE_MEDIUM_INCREMENT),
+            (BACKSTAGE_FIRST_THRESHOLD, BACKSTAGE_FAR_INCREMENT),
+        ),
+        expired_quality=BACKSTAGE_EXPIRED_QUALITY,
+    ),
+    ItemCategory.SULFURAS: AgingRule(0, sell_in_step=0),
+}
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """Tabla de transición de una regla.
+
+    La fila es sell_in acotado a [low, high] (fuera de ese rango la regla se
+    comporta igual que en el borde) y la columna es quality - MIN_QUALITY.
+    Las calidades fuera de [MIN_QUALITY, MAX_QUALITY] se resuelven con la regla.
+    """
+
+    rule: AgingRule
+    low: int
+    high: int
+    table: tuple[int, ...]
+
+    @property
+    def width(self) -> int:
+        return MAX_QUALITY - MIN_QUALITY + 1
+
+    def next_quality(self, sell_in: int, quality: int) -> int:
+        """Calidad del día siguiente para un item en (sell_in, quality)."""
+        if not MIN_QUALITY <= quality <= MAX_QUALITY:
+            return self.rule.step(sell_in, quality)[1]
+        row = min(max(sell_in, self.low), self.high) - self.low
+        return self.table[row * self.width + quality - MIN_QUALITY]
+
+
+def compile_rule(rule: AgingRule) -> CompiledRule:
+    """Precalcula la tabla de transición de una regla.
+
+    Args:
+        rule (AgingRule): Regla a compilar.
+
+    """
+    breakpoints = rule.breakpoints()
+    low, high = breakpoints[0] - 1, breakpoints[-1]
+    table = tuple(
+        rule.step(sell_in, quality)[1]
+        for sell_in in range(low, high + 1)
+        for quality in range(MIN_QUALITY, MAX_QUALITY + 1)
+    )
+    return CompiledRule(rule, low, high, table)
+
+
+def compile_rules(rules: Mapping[Hashable, AgingRule]) -> dict[Hashable, CompiledRule]:
+    """Compila todas las reglas de un diccionario categoría -> regla."""
+    return {key: compile_rule(rule) for key, rule in rules.items()}
+
+
+class TableDrivenGildedRose:
+    """Motor equivalente a GildedRose que actualiza cada item con una búsqueda en tabla."""
+
+    def __init__(
+        self,
+        items: list[Item],
+        rules: Mapping[Hashable, AgingRule] | None = None,
+        classifier: Callable[[str], Hashable] = classify,
+    ) -> None:
+        """Compila las reglas y agrupa los items por categoría.
+
+        Args:
+            items (list): Items a gestionar.
+            rules (Mapping | None): Regla de cada categoría; por defecto DEFAULT_RULES.
+            classifier (Callable): Devuelve la categoría de un nombre de item.
+
+        """
+        GildedRose._validate_items(items)
+        self._compiled = compile_rules(DEFAULT_RULES if rules is None else rules)
+        self._classifier = classifier
+        self.items = items
+        self.refresh_index()
+
+    def refresh_index(self) -> None:
+        """Reconstruye los grupos; necesario si se agregan o renombran items."""
+        groups: dict[Hashable, list[Item]] = {key: [] for key in self._compiled}
+        for item in self.items:
+            category = self._classifier(item.name)
+            if category not in groups:
+                raise KeyError(f"No hay regla para la categoría {category!r}")
+            groups[category].append(item)
+        self._groups = groups
+
+    def update_quality(self) -> None:
+        """Actualiza todos los items un día usando las tablas compiladas."""
+        for key, compiled in self._compiled.items():
+            rule = compiled.rule
+            if rule.is_static:
+                continue
+            table, low, high, width = compiled.table, compiled.low, compiled.high, compiled.width
+            step = rule.sell_in_step
+            for item in self._groups[key]:
+                sell_in = item.sell_in
+                quality = item.quality
+                if MIN_QUALITY <= quality <= MAX_QUALITY:
+                    row = (high if sell_in > high else low if sell_in < low else sell_in) - low
+                    item.quality = table[row * width + quality - MIN_QUALITY]
+                else:
+                    item.quality = rule.step(sell_in, quality)[1]
+                item.sell_in = sell_in - step
@@ -0,0 +1,188 @@
+"""Escenarios "qué pasaría si" sobre variantes de los parámetros de las reglas.
+
+run_scenarios evalúa varios RuleParameters sobre un mismo inventario base y
+devuelve sólo agregados por escenario, sin armar la lista de items de cada uno.
+
+El inventario base se empaqueta una sola vez en tres arreglos compactos
+(categoría, sell_in, quality) que los workers reciben en su inicializador. Con
+el contexto "fork" los procesos heredan esos arreglos por copy-on-write y nunca
+los escriben, así que todos los escenarios leen la misma copia. Cada tarea es
+(escenario, rango de filas) y aplica la forma cerrada de closed_form.py, de modo
+que el costo no depende de la cantidad de días.
+"""
+
+import multiprocessing
+import os
+from array import array
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from gilded_rose.categories import ItemCategory, classify
+from gilded_rose.closed_form import ADVANCERS
+from gilded_rose.models import Item
+from gilded_rose.parameters import DEFAULT_PARAMETERS, RuleParameters
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+CATEGORY_TYPECODE = "b"
+INT_TYPECODE = "q"
+
+Base = tuple[array, array, array]
+Partial = tuple[int, int, int, int, dict[ItemCategory, int]]
+
+# Inventario base de cada proceso worker, inicializado por _attach_base.
+_worker_base: Base | None = None
+
+
+@dataclass
+class ScenarioSummary:
+    """Agregados de un escenario luego de los días simulados."""
+
+    name: str
+    parameters: RuleParameters
+    items: int = 0
+    total_quality: int = 0
+    expired: int = 0
+    at_min_quality: int = 0
+    at_max_quality: int = 0
+    quality_by_category: dict[ItemCategory, int] = field(default_factory=dict)
+
+    @property
+    def mean_quality(self) -> float:
+        """Calidad promedio por item."""
+        return self.total_quality / self.items if self.items else 0.0
+
+    def _merge(self, partial: Partial, rows: int) -> None:
+        total, expired, at_min, at_max, by_category = partial
+        self.items += rows
+        self.total_quality += total
+        self.expired += expired
+        self.at_min_quality += at_min
+        self.at_max_quality += at_max
+        for category, quality in by_category.items():
+            self.quality_by_category[category] = self.quality_by_category.get(category, 0) + quality
+
+
+def pack_items(items: Iterable[Item]) -> Base:
+    """Empaqueta los items en columnas (categoría, sell_in, quality).
+
+    Args:
+        items (Iterable[Item]): Inventario base; no se modifica.
+
+    """
+    categories = array(CATEGORY_TYPECODE)
+    sell_in = array(INT_TYPECODE)
+    quality = array(INT_TYPECODE)
+    for item in items:
+        categories.append(classify(item.name))
+        sell_in.append(item.sell_in)
+        quality.append(item.quality)
+    return categories, sell_in, quality
+
+
+def summarize_rows(base: Base, params: RuleParameters, days: int, start: int, stop: int) -> Partial:
+    """Agregados de las filas [start, stop) del inventario base luego de `days` días.
+
+    Args:
+        base (Base): Columnas devueltas por pack_items.
+        params (RuleParameters): Parámetros del escenario.
+        days (int): Días a simular.
+        start (int): Primera fila.
+        stop (int): Fila siguiente a la última.
+
+    """
+    categories, sell_in_column, quality_column = base
+    total = expired = at_min = at_max = 0
+    by_category: dict[ItemCategory, int] = {}
+    for index in range(start, stop):
+        category = categories[index]
+        sell_in, quality = ADVANCERS[category](
+            sell_in_column[index], quality_column[index], days, params
+        )
+        total += quality
+        by_category[category] = by_category.get(category, 0) + quality
+        if sell_in < 0:
+            expired += 1
+        if quality <= params.min_quality:
+            at_min += 1
+        if quality >= params.max_quality:
+            at_max += 1
+    by_category = {ItemCategory(category): value for category, value in by_category.items()}
+    return total, expired, at_min, at_max, by_category
+
+
+def _attach_base(categories: array, sell_in: array, quality: array) -> None:
+    """Inicializador de cada worker: guarda el inventario base compartido."""
+    global _worker_base
+    _worker_base = (categories, sell_in, quality)
+
+
+def _summarize_task(task: tuple[str, RuleParameters, int, int, int]) -> tuple[str, int, Partial]:
+    """Evalúa un rango de filas de un escenario dentro de un worker."""
+    name, params, days, start, stop = task
+    return name, stop - start, summarize_rows(_worker_base, params, days, start, stop)
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    """Contexto "fork" si está disponible (comparte la base por copy-on-write)."""
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def _as_parameters(scenario: RuleParameters | Mapping[str, int]) -> RuleParameters:
+    if isinstance(scenario, RuleParameters):
+        return scenario
+    return DEFAULT_PARAMETERS.with_overrides(**scenario)
+
+
+def run_scenarios(
+    items: Iterable[Item],
+    scenarios: Mapping[str, RuleParameters | Mapping[str, int]],
+    days: int,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+) -> dict[str, ScenarioSummary]:
+    """Evalúa cada escenario sobre el mismo inventario base, en paralelo.
+
+    Args:
+        items (Iterable[Item]): Inventario base; no se modifica.
+        scenarios (Mapping): Nombre de escenario -> RuleParameters, o un mapeo de
+            valores a reemplazar sobre DEFAULT_PARAMETERS (p.ej. {"max_quality": 60}).
+        days (int): Días a simular en todos los escenarios.
+        workers (int | None): Cantidad de procesos; por defecto os.cpu_count().
+            Con 1 se evalúa en el proceso actual.
+        chunk_size (int | None): Filas por tarea; por defecto DEFAULT_CHUNK_SIZE.
+
+    """
+    if days < 0:
+        raise ValueError("La cantidad de días no puede ser negativa")
+    workers = workers or os.cpu_count() or 1
+    chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+    if workers < 1 or chunk_size < 1:
+        raise ValueError("workers y chunk_size deben ser positivos")
+
+    parameters = {name: _as_parameters(scenario) for name, scenario in scenarios.items()}
+    summaries = {name: ScenarioSummary(name, params) for name, params in parameters.items()}
+    base = pack_items(items)
+    length = len(base[0])
+    tasks = [
+        (name, params, days, start, min(start + chunk_size, length))
+        for name, params in parameters.items()
+        for start in range(0, length, chunk_size)
+    ]
+
+    if workers == 1 or len(tasks) <= 1:
+        for name, params, _, start, stop in tasks:
+            summaries[name]._merge(summarize_rows(base, params, days, start, stop), stop - start)
+        return summaries
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(tasks)),
+        mp_context=_pool_context(),
+        initializer=_attach_base,
+        initargs=base,
+    ) as executor:
+        for name, rows, partial in executor.map(_summarize_task, tasks):
+            summaries[name]._merge(partial, rows)
+    return summaries
@@ -0,0 +1,203 @@
+"""Procesamiento en streaming de inventarios en CSV o JSONL.
+
+Los registros se leen de forma perezosa, se avanzan en lotes de tamaño fijo y
+se escriben a medida que se procesan, de modo que la memoria usada depende del
+tamaño de lote y no del tamaño del archivo.
+"""
+
+import csv
+import json
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import TextIO
+
+from gilded_rose.core import GildedRose
+from gilded_rose.models import Item
+
+CSV_FORMAT = "csv"
+JSONL_FORMAT = "jsonl"
+FORMATS = (CSV_FORMAT, JSONL_FORMAT)
+CSV_HEADER = ("name", "sell_in", "quality")
+DEFAULT_BATCH_SIZE = 10_000
+
+
+@dataclass
+class StreamStats:
+    """Métricas de un procesamiento en streaming."""
+
+    rows: int = 0
+    batches: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+    finished_at: float | None = None
+
+    @property
+    def elapsed(self) -> float:
+        """Segundos transcurridos (hasta el final, o hasta ahora si sigue en curso)."""
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return end - self.started_at
+
+    @property
+    def rows_per_second(self) -> float:
+        """Throughput en filas por segundo."""
+        elapsed = self.elapsed
+        return self.rows / elapsed if elapsed > 0 else 0.0
+
+
+def detect_format(path: str | Path) -> str:
+    """Deduce el formato a partir de la extensión del archivo.
+
+    Args:
+        path (str | Path): Ruta del archivo.
+
+    """
+    suffix = Path(path).suffix.lower().lstrip(".")
+    if suffix == "json":
+        suffix = JSONL_FORMAT
+    if suffix not in FORMATS:
+        raise ValueError(f"Formato no soportado: {suffix!r}")
+    return suffix
+
+
+def _parse_jsonl_record(line: str, line_number: int) -> Item:
+    """Convierte una línea JSONL en un Item; los errores indican la línea del archivo."""
+    try:
+        record = json.loads(line)
+        return Item(record["name"], int(record["sell_in"]), int(record["quality"]))
+    except KeyError as error:
+        raise ValueError(
+            f"Registro JSONL inválido en la línea {line_number}: falta el campo {error}"
+        ) from error
+    except (TypeError, ValueError) as error:
+        raise ValueError(f"Registro JSONL inválido en la línea {line_number}: {error}") from error
+
+
+def _check_stream_args(days: int, batch_size: int) -> None:
+    if days < 0:
+        raise ValueError("Los días a avanzar no pueden ser negativos")
+    if batch_size < 1:
+        raise ValueError("El tamaño de lote debe ser positivo")
+
+
+def read_items(stream: TextIO, fmt: str) -> Iterator[Item]:
+    """Lee items de un stream de texto, uno por registro, sin cargar el archivo.
+
+    Args:
+        stream (TextIO): Stream de entrada.
+        fmt (str): CSV_FORMAT o JSONL_FORMAT.
+
+    """
+    if fmt == CSV_FORMAT:
+        reader = csv.reader(stream)
+        header = next(reader, None)
+        if header is not None and tuple(header) != CSV_HEADER:
+            raise ValueError(f"Encabezado CSV inválido: {header}")
+        for row in reader:
+            if not row:
+                continue
+            if len(row) != len(CSV_HEADER):
+                raise ValueError(
+                    f"Fila CSV inválida en la línea {reader.line_num}: "
+                    f"se esperaban {len(CSV_HEADER)} campos y hay {len(row)}"
+                )
+            name, sell_in, quality = row
+            try:
+                item = Item(name, int(sell_in), int(quality))
+            except ValueError as error:
+                raise ValueError(
+                    f"Fila CSV inválida en la línea {reader.line_num}: {error}"
+                ) from error
+            yield item
+    elif fmt == JSONL_FORMAT:
+        for line_number, line in enumerate(stream, 1):
+            if line.strip():
+                yield _parse_jsonl_record(line, line_number)
+    else:
+        raise ValueError(f"Formato no soportado: {fmt!r}")
+
+
+def write_items(items: Iterable[Item], stream: TextIO, fmt: str) -> None:
+    """Escribe items en un stream de texto a medida que se consumen.
+
+    Args:
+        items (Iterable[Item]): Items a escribir.
+        stream (TextIO): Stream de salida.
+        fmt (str): CSV_FORMAT o JSONL_FORMAT.
+
+    """
+    if fmt == CSV_FORMAT:
+        writer = csv.writer(stream, lineterminator="\n")
+        writer.writerow(CSV_HEADER)
+        for item in items:
+            writer.writerow((item.name, item.sell_in, item.quality))
+    elif fmt == JSONL_FORMAT:
+        for item in items:
+            record = {"name": item.name, "sell_in": item.sell_in, "quality": item.quality}
+            stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+    else:
+        raise ValueError(f"Formato no soportado: {fmt!r}")
+
+
+def advance_stream(
+    items: Iterable[Item],
+    days: int,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    stats: StreamStats | None = None,
+    trusted: bool = False,
+) -> Iterator[Item]:
+    """Avanza `days` días cada item de un stream, procesando en lotes.
+
+    Args:
+        items (Iterable[Item]): Items de entrada; se consumen de a un lote.
+        days (int): Días a avanzar (ver GildedRose.advance).
+        batch_size (int): Cantidad máxima de items en memoria.
+        stats (StreamStats | None): Si se indica, se actualiza con el progreso.
+        trusted (bool): Si es True no se valida cada lote (p.ej. items de read_items).
+
+    """
+    _check_stream_args(days, batch_size)
+    iterator = iter(items)
+    while batch := list(islice(iterator, batch_size)):
+        GildedRose(batch, trusted=trusted).advance(days)
+        if stats is not None:
+            stats.rows += len(batch)
+            stats.batches += 1
+        yield from batch
+    if stats is not None:
+        stats.finished_at = time.perf_counter()
+
+
+def advance_file(
+    source: str | Path,
+    target: str | Path,
+    days: int,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    source_format: str | None = None,
+    target_format: str | None = None,
+) -> StreamStats:
+    """Lee un inventario de `source`, lo avanza `days` días y lo escribe en `target`.
+
+    Args:
+        source (str | Path): Archivo de entrada.
+        target (str | Path): Archivo de salida.
+        days (int): Días a avanzar.
+        batch_size (int): Cantidad máxima de items en memoria.
+        source_format (str | None): Formato de entrada; por defecto según la extensión.
+        target_format (str | None): Formato de salida; por defecto según la extensión.
+
+    """
+    # Se valida antes de abrir target, para no truncarlo si los argumentos son inválidos.
+    _check_stream_args(days, batch_size)
+    source_format = source_format or detect_format(source)
+    target_format = target_format or detect_format(target)
+    stats = StreamStats()
+    with (
+        open(source, encoding="utf-8", newline="") as reader,
+        open(target, "w", encoding="utf-8", newline="") as writer,
+    ):
+        records = read_items(reader, source_format)
+        items = advance_stream(records, days, batch_size, stats, trusted=True)
+        write_items(items, writer, target_format)
+    return stats
@@ -0,0 +1,193 @@
+"""Avance en lote de muchos inventarios pequeños (uno por tienda).
+
+En lugar de construir un GildedRose por inventario y día, TenantBatch empaqueta
+los items de todos los inventarios registrados en las columnas compartidas de
+un CompactInventory, los avanza juntos y copia el resultado de vuelta a los
+Item de cada inventario.
+
+Los valores de cada inventario se copian a las columnas al registrarlo; si sus
+Item se modifican por fuera entre ticks, hay que volver a registrarlo. El lote
+guarda su propia tupla de items, así que agregar o quitar items de la lista
+original tampoco lo afecta: para cambiar un inventario hay que registrarlo de
+nuevo.
+"""
+
+import asyncio
+from collections.abc import Hashable, Iterable
+
+from gilded_rose.compact import CompactInventory
+from gilded_rose.models import Item
+from gilded_rose.validated import ValidatedItems, check_item_types
+
+DEFAULT_CHUNK_ROWS = 10_000
+
+
+class TenantBatch:
+    """Conjunto de inventarios que se avanzan con una sola llamada."""
+
+    def __init__(self, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> None:
+        """Crea un lote vacío.
+
+        Args:
+            chunk_rows (int): Filas aproximadas por tramo en tick_all.
+
+        """
+        if chunk_rows < 1:
+            raise ValueError("El tamaño de tramo debe ser positivo")
+        self._chunk_rows = chunk_rows
+        self._tenants: dict[Hashable, tuple[Item, ...]] = {}
+        self._offsets: dict[Hashable, tuple[int, int]] = {}
+        self._store = CompactInventory()
+        self._stale = False
+        self._ticking = False
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+    def __contains__(self, tenant: Hashable) -> bool:
+        return tenant in self._tenants
+
+    @property
+    def tenants(self) -> list[Hashable]:
+        """Identificadores registrados, en orden de registro."""
+        return list(self._tenants)
+
+    @property
+    def row_count(self) -> int:
+        """Cantidad total de items en el lote."""
+        return sum(len(items) for items in self._tenants.values())
+
+    def items(self, tenant: Hashable) -> tuple[Item, ...]:
+        """Items de un inventario, actualizados al último tick.
+
+        Args:
+            tenant (Hashable): Identificador del inventario.
+
+        """
+        return self._tenants[tenant]
+
+    def register(self, tenant: Hashable, items: Iterable[Item]) -> None:
+        """Registra un inventario, o lo reemplaza si el identificador ya existe.
+
+        Los items se validan una sola vez aquí (una ValidatedItems no se vuelve a
+        validar) y se copian a una tupla: los Item se comparten pero la lista no.
+
+        Args:
+            tenant (Hashable): Identificador del inventario.
+            items (Iterable[Item]): Items del inventario.
+
+        """
+        self._check_not_ticking()
+        if not isinstance(items, ValidatedItems):
+            items = list(items)
+            check_item_types(items)
+        items = tuple(items)
+        if tenant in self._tenants:
+            self._stale = True
+            del self._tenants[tenant]
+        self._tenants[tenant] = items
+        if not self._stale:
+            self._pack_tenant(self._store, tenant, items)
+
+    def remove(self, tenant: Hashable) -> list[Item]:
+        """Quita un inventario del lote y devuelve sus items.
+
+        Args:
+            tenant (Hashable): Identificador del inventario.
+
+        """
+        self._check_not_ticking()
+        items = self._tenants.pop(tenant)
+        self._offsets.pop(tenant, None)
+        self._stale = True
+        return list(items)
+
+    def tick(self, days: int = 1) -> None:
+        """Avanza todos los inventarios `days` días.
+
+        Args:
+            days (int): Días a avanzar.
+
+        """
+        if days < 0:
+            raise ValueError("Los días a avanzar no pueden ser negativos")
+        self._check_not_ticking()
+        self._repack()
+        for _ in range(days):
+            self._store.update_quality()
+        self._write_back(self._tenants)
+
+    async def tick_all(self, days: int = 1) -> None:
+        """Como tick, pero cede el control al event loop entre tramos.
+
+        Cada tramo agrupa inventarios completos hasta juntar unas chunk_rows
+        filas. Mientras dura, register y remove lanzan RuntimeError.
+
+        Args:
+            days (int): Días a avanzar.
+
+        """
+        if days < 0:
+            raise ValueError("Los días a avanzar no pueden ser negativos")
+        self._check_not_ticking()
+        self._repack()
+        self._ticking = True
+        try:
+            for chunk in self._chunks():
+                start = self._offsets[chunk[0]][0]
+                stop = self._offsets[chunk[-1]][1]
+                for _ in range(days):
+                    self._store.update_quality(start, stop)
+                self._write_back(chunk)
+                await asyncio.sleep(0)
+        finally:
+            self._ticking = False
+
+    def _check_not_ticking(self) -> None:
+        if self._ticking:
+            raise RuntimeError("No se puede modificar el lote durante un tick")
+
+    def _chunks(self) -> list[list[Hashable]]:
+        """Agrupa los inventarios en tramos consecutivos de unas chunk_rows filas."""
+        chunks: list[list[Hashable]] = []
+        current: list[Hashable] = []
+        rows = 0
+        for tenant, (start, stop) in self._offsets.items():
+            current.append(tenant)
+            rows += stop - start
+            if rows >= self._chunk_rows:
+                chunks.append(current)
+                current, rows = [], 0
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _pack_tenant(
+        self, store: CompactInventory, tenant: Hashable, items: tuple[Item, ...]
+    ) -> None:
+        """Agrega las filas de un inventario al final de las columnas."""
+        start = len(store)
+        for item in items:
+            store.append(item.name, item.sell_in, item.quality)
+        self._offsets[tenant] = (start, len(store))
+
+    def _repack(self) -> None:
+        """Reconstruye las columnas si se quitaron o reemplazaron inventarios."""
+        if not self._stale:
+            return
+        store = CompactInventory()
+        self._offsets = {}
+        for tenant, items in self._tenants.items():
+            self._pack_tenant(store, tenant, items)
+        self._store = store
+        self._stale = False
+
+    def _write_back(self, tenants: Iterable[Hashable]) -> None:
+        """Copia sell_in y quality de las columnas a los Item de cada inventario."""
+        for tenant in tenants:
+            sell_in_column, quality_column = self._store.columns(*self._offsets[tenant])
+            for item, sell_in, quality in zip(
+                self._tenants[tenant], sell_in_column, quality_column, strict=True
+            ):
+                item.sell_in = sell_in
+                item.quality = quality
@@ -0,0 +1,74 @@
+"""Listas de items validadas una única vez, al ingresar."""
+
+from collections.abc import Iterable, Sequence
+from typing import SupportsIndex
+
+from gilded_rose.models import Item
+
+
+def check_item_types(items: Iterable[object]) -> None:
+    """Valida que todos los elementos sean instancias de Item.
+
+    Args:
+        items (Iterable): Elementos a validar.
+
+    """
+    if not all(isinstance(item, Item) for item in items):
+        raise TypeError("Los items deben ser instancias de Item")
+
+
+class ValidatedItems(list):
+    """Lista de Item que valida cada elemento al ingresar.
+
+    GildedRose no vuelve a recorrer una ValidatedItems al construirse, así que
+    varios motores creados sobre la misma lista pagan la validación una sola vez.
+    Sólo se validan los elementos nuevos (append, extend, insert, asignación).
+    """
+
+    def __init__(self, items: Iterable[Item] = ()) -> None:
+        items = list(items)
+        check_item_types(items)
+        super().__init__(items)
+
+    @classmethod
+    def from_columns(
+        cls, names: Sequence[str], sell_in: Sequence[int], quality: Sequence[int]
+    ) -> "ValidatedItems":
+        """Construye los items a partir de columnas, sin validación adicional.
+
+        Args:
+            names (Sequence[str]): Nombre de cada item.
+            sell_in (Sequence[int]): Días de venta de cada item.
+            quality (Sequence[int]): Calidad de cada item.
+
+        """
+        if not len(names) == len(sell_in) == len(quality):
+            raise ValueError("Las columnas deben tener la misma longitud")
+        validated = cls()
+        list.extend(validated, map(Item, names, sell_in, quality))
+        return validated
+
+    def append(self, item: Item) -> None:
+        check_item_types((item,))
+        super().append(item)
+
+    def extend(self, items: Iterable[Item]) -> None:
+        items = list(items)
+        check_item_types(items)
+        super().extend(items)
+
+    def insert(self, index: SupportsIndex, item: Item) -> None:
+        check_item_types((item,))
+        super().insert(index, item)
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            value = list(value)
+            check_item_types(value)
+        else:
+            check_item_types((value,))
+        super().__setitem__(index, value)
+
+    def __iadd__(self, items: Iterable[Item]) -> "ValidatedItems":
+        self.extend(items)
+        return self
@@ -1,31 +1,30 @@
 # Constants
+from collections.abc import Callable
 from typing import Protocol
 
-from item import Item
-
-MAX_QUALITY = 50
-MIN_QUALITY = 0
-AGED_BRIE = "Aged Brie"
-BACKSTAGE_PASSES = "Backstage passes to a TAFKAL80ETC concert"
-SULFURAS = "Sulfuras, Hand of Ragnaros"
-
-# Aged Brie
-AGED_BRIE_INCREMENT = 1
-AGED_BRIE_EXPIRED_INCREMENT = 1
-
-# Backstage passes
-BACKSTAGE_FIRST_THRESHOLD = 11
-BACKSTAGE_SECOND_THRESHOLD = 6
-BACKSTAGE_FAR_INCREMENT = 1  # > 10 días
-BACKSTAGE_MEDIUM_INCREMENT = 2  # 6-10 días
-BACKSTAGE_NEAR_INCREMENT = 3  # 1-5 días
-BACKSTAGE_EXPIRED_QUALITY = 0  # después del concierto
-MIN_SELL_IN = 0
-
-# Normal items
-NORMAL_DAILY_DECREMENT = 1
-NORMAL_DAILY_INCREMENT = 1
-NORMAL_EXPIRED_DECREMENT = 2
+from gilded_rose.constants import (
+    AGED_BRIE,
+    AGED_BRIE_EXPIRED_INCREMENT,
+    AGED_BRIE_INCREMENT,
+    BACKSTAGE_EXPIRED_QUALITY,
+    BACKSTAGE_FAR_INCREMENT,
+    BACKSTAGE_FIRST_THRESHOLD,
+    BACKSTAGE_MEDIUM_INCREMENT,
+    BACKSTAGE_NEAR_INCREMENT,
+    BACKSTAGE_PASSES,
+    BACKSTAGE_SECOND_THRESHOLD,
+    CONJURED_DAILY_DECREMENT,
+    CONJURED_EXPIRED_DECREMENT,
+    CONJURED_PREFIX,
+    MAX_QUALITY,
+    MIN_QUALITY,
+    MIN_SELL_IN,
+    NORMAL_DAILY_DECREMENT,
+    NORMAL_EXPIRED_DECREMENT,
+    NORMAL_SELL_IN_DECREMENT,
+    SULFURAS,
+)
+from gilded_rose.models import Item
 
 
 class ItemUpdaterStrategy(Protocol):
@@ -33,8 +32,7 @@ class ItemUpdaterStrategy(Protocol):
     Estrategia para actualizar la calidad y días de venta de un item.
     """
 
-    def update(self, item: Item) -> None:
-        ...
+    def update(self, item: Item) -> None: ...
 
 
 class SulfurasStrategy:
@@ -49,6 +47,9 @@ class NormalItemStrategy:
     Estrategia para actualizar items normales.
     """
 
+    DAILY_DECREMENT = NORMAL_DAILY_DECREMENT
+    EXPIRED_DECREMENT = NORMAL_EXPIRED_DECREMENT
+
     @staticmethod
     def _increase_quality(item: Item, amount: int) -> None:
         item.quality = min(MAX_QUALITY, item.quality + amount)
@@ -58,11 +59,20 @@ class NormalItemStrategy:
         item.quality = max(MIN_QUALITY, item.quality - amount)
 
     def update(self, item: Item) -> None:
-        self._decrease_quality(item, NORMAL_DAILY_DECREMENT)
-        item.sell_in -= NORMAL_DAILY_DECREMENT
+        self._decrease_quality(item, self.DAILY_DECREMENT)
+        item.sell_in -= NORMAL_SELL_IN_DECREMENT
+
+        if item.sell_in < MIN_SELL_IN:
+            self._decrease_quality(item, self.EXPIRED_DECREMENT)
+
+
+class ConjuredItemStrategy(NormalItemStrategy):
+    """
+    Items conjurados: se degradan al doble de velocidad.
+    """
 
-        if item.sell_in < 0:
-            self._decrease_quality(item, NORMAL_EXPIRED_DECREMENT)
+    DAILY_DECREMENT = CONJURED_DAILY_DECREMENT
+    EXPIRED_DECREMENT = CONJURED_EXPIRED_DECREMENT
 
 
 class AgedBrieStrategy:
@@ -76,7 +86,7 @@ class AgedBrieStrategy:
 
     def update(self, item: Item) -> None:
         self._increase_quality(item, AGED_BRIE_INCREMENT)
-        item.sell_in -= NORMAL_DAILY_DECREMENT
+        item.sell_in -= NORMAL_SELL_IN_DECREMENT
 
         if item.sell_in < MIN_SELL_IN:
             self._increase_quality(item, AGED_BRIE_EXPIRED_INCREMENT)
@@ -85,8 +95,8 @@ class AgedBrieStrategy:
 class BackstagePassStrategy:
     """Backstage passes con reglas especiales."""
 
-    FIRST_THRESHOLD = 11
-    SECOND_THRESHOLD = 6
+    FIRST_THRESHOLD = BACKSTAGE_FIRST_THRESHOLD
+    SECOND_THRESHOLD = BACKSTAGE_SECOND_THRESHOLD
 
     @staticmethod
     def _increase_quality(item: Item, amount: int) -> None:
@@ -102,34 +112,119 @@ class BackstagePassStrategy:
             increment = BACKSTAGE_FAR_INCREMENT
 
         self._increase_quality(item, increment)
-        item.sell_in -= NORMAL_DAILY_DECREMENT
+        item.sell_in -= NORMAL_SELL_IN_DECREMENT
         if item.sell_in < MIN_SELL_IN:
             item.quality = BACKSTAGE_EXPIRED_QUALITY
 
 
+class _PrefixNode:
+    """Nodo del trie de prefijos."""
+
+    __slots__ = ("children", "strategy")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _PrefixNode] = {}
+        self.strategy: ItemUpdaterStrategy | None = None
+
+
+class StrategyRegistry:
+    """
+    Registro de estrategias por nombre exacto o por prefijo.
+
+    Las estrategias son instancias únicas que se comparten entre todos los items.
+    Los prefijos se comparan sin distinguir mayúsculas y se resuelven con un trie
+    (gana el prefijo más largo). El resultado de cada nombre se memoriza en un
+    diccionario acotado, así que los nombres repetidos no recorren el trie.
+    """
+
+    def __init__(self, default: ItemUpdaterStrategy, memo_size: int = 1024) -> None:
+        self.default = default
+        self.memo_size = memo_size
+        self._exact: dict[str, ItemUpdaterStrategy] = {}
+        self._prefixes = _PrefixNode()
+        self._memo: dict[str, ItemUpdaterStrategy] = {}
+
+    def register(self, name: str, strategy: ItemUpdaterStrategy) -> None:
+        """Asocia una estrategia a un nombre exacto."""
+        self._exact[name] = strategy
+        self._memo.clear()
+
+    def register_prefix(self, prefix: str, strategy: ItemUpdaterStrategy) -> None:
+        """Asocia una estrategia a todos los nombres que empiezan con `prefix`."""
+        node = self._prefixes
+        for char in prefix.lower():
+            node = node.children.setdefault(char, _PrefixNode())
+        node.strategy = strategy
+        self._memo.clear()
+
+    def resolve(self, name: str) -> ItemUpdaterStrategy:
+        """Devuelve la estrategia de un nombre: exacta, luego prefijo, luego la default."""
+        strategy = self._memo.get(name)
+        if strategy is not None:
+            return strategy
+
+        strategy = self._exact.get(name)
+        if strategy is None:
+            strategy = self._longest_prefix(name.lower())
+        if len(self._memo) >= self.memo_size:
+            del self._memo[next(iter(self._memo))]
+        self._memo[name] = strategy
+        return strategy
+
+    def _longest_prefix(self, name: str) -> ItemUpdaterStrategy:
+        strategy = self.default
+        node = self._prefixes
+        for char in name:
+            node = node.children.get(char)
+            if node is None:
+                break
+            if node.strategy is not None:
+                strategy = node.strategy
+        return strategy
+
+
+def default_registry() -> StrategyRegistry:
+    """Registro con las reglas estándar de la posada."""
+    registry = StrategyRegistry(NormalItemStrategy())
+    registry.register(SULFURAS, SulfurasStrategy())
+    registry.register(AGED_BRIE, AgedBrieStrategy())
+    registry.register(BACKSTAGE_PASSES, BackstagePassStrategy())
+    registry.register_prefix(CONJURED_PREFIX, ConjuredItemStrategy())
+    return registry
+
+
 # Factory pattern - para crear las estrategias de actualización de items.
 class ItemStrategyFactory:
     """
     Fabrica de estrategias de actualización de items.
     """
 
-    _strategies = {
-        SULFURAS: SulfurasStrategy(),
-        AGED_BRIE: AgedBrieStrategy(),
-        BACKSTAGE_PASSES: BackstagePassStrategy(),
-    }
+    registry = default_registry()
 
     @classmethod
     def get_strategy(cls, item_name: str) -> ItemUpdaterStrategy:
-        return cls._strategies.get(item_name, NormalItemStrategy())
+        return cls.registry.resolve(item_name)
 
 
 # clase nueva que usa el factory pattern
 class GildedRoseRefactored:
-    def __init__(self, items: list[Item]) -> None:
+    def __init__(self, items: list[Item], registry: StrategyRegistry | None = None) -> None:
         self.items = items
+        self.registry = registry or ItemStrategyFactory.registry
+        self.refresh_strategies()
+
+    def refresh_strategies(self) -> None:
+        """
+        Resuelve una sola vez la estrategia de cada item y agrupa los items por estrategia.
+        Debe llamarse si cambia la lista de items o el nombre de alguno.
+        """
+        groups: dict[int, tuple[Callable[[Item], None], list[Item]]] = {}
+        for item in self.items:
+            strategy = self.registry.resolve(item.name)
+            groups.setdefault(id(strategy), (strategy.update, []))[1].append(item)
+        self._groups = list(groups.values())
 
     def update_quality(self) -> None:
-        for item in self.items:
-            strategy = ItemStrategyFactory.get_strategy(item.name)
-            strategy.update(item)
+        for update, items in self._groups:
+            for item in items:
+                update(item)
@@ -0,0 +1,238 @@
+"""Benchmark de los motores de actualización con inventarios sintéticos.
+
+Mide nanosegundos por item por día y memoria pico para cada combinación de
+motor, tamaño de inventario y mezcla de categorías. Los resultados se guardan
+en JSON y pueden compararse contra una línea base guardada: el script termina
+con código 1 si algún caso empeora más que el umbral configurado.
+
+Ejemplo:
+    python -m scripts.benchmark_engines --sizes 10 1000 100000 --output bench.json
+    python -m scripts.benchmark_engines --baseline bench.json --threshold 0.15
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from gilded_rose import GildedRose, Item
+from gilded_rose.compact import CompactInventory
+from gilded_rose.constants import AGED_BRIE, BACKSTAGE_PASSES, SULFURAS
+from gilded_rose.lazy_engine import LazyGildedRose
+from gilded_rose.rule_tables import TableDrivenGildedRose
+from gilded_rose_sp_in_progress import GildedRoseRefactored
+
+# Proporción de cada tipo de item en el inventario.
+MIXES: dict[str, dict[str, float]] = {
+    "balanced": {
+        "normal": 0.40,
+        "sulfuras": 0.05,
+        "aged_brie": 0.15,
+        "backstage": 0.20,
+        "conjured": 0.20,
+    },
+    "mostly_normal": {
+        "normal": 0.85,
+        "sulfuras": 0.01,
+        "aged_brie": 0.05,
+        "backstage": 0.05,
+        "conjured": 0.04,
+    },
+    "legendary_heavy": {
+        "normal": 0.30,
+        "sulfuras": 0.50,
+        "aged_brie": 0.10,
+        "backstage": 0.05,
+        "conjured": 0.05,
+    },
+    "backstage_heavy": {
+        "normal": 0.20,
+        "sulfuras": 0.05,
+        "aged_brie": 0.05,
+        "backstage": 0.60,
+        "conjured": 0.10,
+    },
+}
+
+KIND_NAMES = {
+    "normal": ["+5 Dexterity Vest", "Elixir of the Mongoose", "Healing Potion"],
+    "sulfuras": [SULFURAS],
+    "aged_brie": [AGED_BRIE],
+    "backstage": [BACKSTAGE_PASSES],
+    "conjured": ["Conjured Mana Cake", "Conjured Sword"],
+}
+
+
+def make_inventory(size: int, mix: str, seed: int = 0) -> list[Item]:
+    """Genera un inventario sintético reproducible.
+
+    Args:
+        size (int): Cantidad de items.
+        mix (str): Clave de MIXES con la proporción de cada tipo.
+        seed (int): Semilla del generador.
+
+    """
+    rng = random.Random(seed)
+    kinds = list(MIXES[mix])
+    weights = list(MIXES[mix].values())
+    items = []
+    for kind in rng.choices(kinds, weights=weights, k=size):
+        name = rng.choice(KIND_NAMES[kind])
+        if kind == "sulfuras":
+            items.append(Item(name, rng.randint(-5, 5), 80))
+        else:
+            items.append(Item(name, rng.randint(-10, 30), rng.randint(0, 50)))
+    return items
+
+
+def _columnar_engine(items: list[Item]):
+    from gilded_rose.columnar import ColumnarInventory
+
+    return ColumnarInventory.from_items(items)
+
+
+ENGINES: dict[str, Callable[[list[Item]], object]] = {
+    "gilded_rose": GildedRose,
+    "gilded_rose_settled": lambda items: GildedRose(items, track_settled=True),
+    "refactored": GildedRoseRefactored,
+    "rule_tables": TableDrivenGildedRose,
+    "compact": CompactInventory.from_items,
+    "lazy": LazyGildedRose,
+    "columnar": _columnar_engine,
+}
+
+
+def available_engines() -> list[str]:
+    """Motores que pueden ejecutarse en este entorno (columnar requiere NumPy)."""
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return [name for name in ENGINES if name != "columnar"]
+    return list(ENGINES)
+
+
+def run_case(engine: str, size: int, mix: str, days: int, seed: int = 0) -> dict:
+    """Mide un caso: tiempo por item y día, y memoria pico propia del motor.
+
+    El tiempo se mide sin tracemalloc activo; la memoria en una segunda corrida
+    de un solo día, para no distorsionar el tiempo. La memoria pico no incluye
+    la lista de Item de entrada, que es la misma para todos los motores.
+    """
+    factory = ENGINES[engine]
+
+    updater = factory(make_inventory(size, mix, seed))
+    gc.collect()
+    start = time.perf_counter_ns()
+    for _ in range(days):
+        updater.update_quality()
+    elapsed = time.perf_counter_ns() - start
+    del updater
+
+    items = make_inventory(size, mix, seed)
+    gc.collect()
+    tracemalloc.start()
+    updater = factory(items)
+    updater.update_quality()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "engine": engine,
+        "size": size,
+        "mix": mix,
+        "days": days,
+        "ns_per_item_day": elapsed / (size * days),
+        "peak_memory_bytes": peak,
+    }
+
+
+def case_key(result: dict) -> tuple:
+    return result["engine"], result["size"], result["mix"]
+
+
+def find_regressions(results: list[dict], baseline: list[dict], threshold: float) -> list[dict]:
+    """Casos cuyo ns_per_item_day empeoró más que `threshold` respecto de la línea base.
+
+    Args:
+        results (list[dict]): Resultados actuales.
+        baseline (list[dict]): Resultados guardados.
+        threshold (float): Empeoramiento relativo tolerado (0.2 = 20%).
+
+    """
+    previous = {case_key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get(case_key(result))
+        if before is None:
+            continue
+        ratio = result["ns_per_item_day"] / before["ns_per_item_day"]
+        if ratio > 1 + threshold:
+            regressions.append({**result, "baseline_ns_per_item_day": before["ns_per_item_day"]})
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1_000, 100_000])
+    parser.add_argument("--mixes", nargs="+", choices=MIXES, default=list(MIXES))
+    parser.add_argument("--engines", nargs="+", choices=ENGINES, default=None)
+    parser.add_argument("--days", type=int, default=5, help="días a medir por caso")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="archivo JSON donde guardar los resultados")
+    parser.add_argument("--baseline", help="archivo JSON con resultados previos")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="empeoramiento tolerado (0.2 = 20%%)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    engines = args.engines or available_engines()
+    results = []
+    print("engine, size, mix, ns_per_item_day, peak_memory_bytes")
+    for size in args.sizes:
+        for mix in args.mixes:
+            for engine in engines:
+                result = run_case(engine, size, mix, args.days, args.seed)
+                results.append(result)
+                print(
+                    f"{engine}, {size}, {mix}, {result['ns_per_item_day']:.1f}, "
+                    f"{result['peak_memory_bytes']}"
+                )
+
+    if args.output:
+        report = {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "days": args.days,
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as stream:
+            json.dump(report, stream, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as stream:
+            baseline = json.load(stream)["results"]
+        regressions = find_regressions(results, baseline, args.threshold)
+        for regression in regressions:
+            print(
+                f"REGRESIÓN {regression['engine']} size={regression['size']} "
+                f"mix={regression['mix']}: {regression['baseline_ns_per_item_day']:.1f} -> "
+                f"{regression['ns_per_item_day']:.1f} ns/item/día",
+                file=sys.stderr,
+            )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,413 @@
+"""Arnés diferencial: ejecuta todos los motores en paralelo y compara sus resultados.
+
+Genera inventarios aleatorios con semilla (nombres límite, sell_in negativos,
+calidades en 0/50/80 y fuera de rango), avanza cada motor la misma cantidad de
+días y compara en cada punto de control un digest del estado de cada motor
+contra el de GildedRose. Si un motor difiere, reduce la entrada hasta un
+ejemplo mínimo que sigue fallando y lo informa.
+
+Motores cubiertos: GildedRose (con y sin asentados, y su forma cerrada), la
+versión refactorizada, las reglas en tablas, el almacén compacto, el formato
+binario con mmap, el lote de inventarios (tenants), el motor por eventos, los
+pronósticos (forecast) y, con NumPy, el inventario columnar y el motor paralelo.
+
+Ejemplo:
+    python -m scripts.equivalence_harness --size 100000 --days 100
+    python -m scripts.equivalence_harness --engines refactored compact --stride 7
+"""
+
+import argparse
+import hashlib
+import random
+import sys
+import tempfile
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from gilded_rose import GildedRose, Item
+from gilded_rose.binary_store import MappedInventory, write_items
+from gilded_rose.compact import CompactInventory
+from gilded_rose.constants import AGED_BRIE, BACKSTAGE_PASSES, SULFURAS
+from gilded_rose.forecast import forecast
+from gilded_rose.lazy_engine import LazyGildedRose
+from gilded_rose.rule_tables import TableDrivenGildedRose
+from gilded_rose.tenants import TenantBatch
+from gilded_rose_sp_in_progress import GildedRoseRefactored
+
+REFERENCE = "gilded_rose"
+NUMPY_ENGINES = ("columnar", "parallel")
+TENANT_SIZE = 7
+
+EDGE_NAMES = [
+    "+5 Dexterity Vest",
+    "",
+    AGED_BRIE,
+    "aged brie",
+    AGED_BRIE + " ",
+    BACKSTAGE_PASSES,
+    "Backstage passes",
+    SULFURAS,
+    "Sulfuras",
+    "Conjured Mana Cake",
+    "conjured",
+    "CONJURED shield",
+    "Not Conjured",
+]
+EDGE_SELL_IN = [-30, -1, 0, 1, 2, 5, 6, 7, 10, 11, 12]
+EDGE_QUALITY = [-1, 0, 1, 2, 48, 49, 50, 51, 80]
+
+
+def make_inventory(size: int, seed: int = 0) -> list[Item]:
+    """Inventario aleatorio reproducible con mayoría de valores límite.
+
+    Args:
+        size (int): Cantidad de items.
+        seed (int): Semilla del generador.
+
+    """
+    rng = random.Random(seed)
+    items = []
+    for _ in range(size):
+        name = rng.choice(EDGE_NAMES)
+        sell_in = rng.choice(EDGE_SELL_IN) if rng.random() < 0.6 else rng.randint(-60, 60)
+        if name == SULFURAS and rng.random() < 0.8:
+            quality = 80
+        elif rng.random() < 0.6:
+            quality = rng.choice(EDGE_QUALITY)
+        else:
+            quality = rng.randint(0, 50)
+        items.append(Item(name, sell_in, quality))
+    return items
+
+
+Rows = Callable[[], Iterable[Item]]
+Advance = Callable[[int], None]
+
+
+def _day_by_day(factory: Callable[[list[Item]], object]) -> Callable[[list[Item]], tuple]:
+    """Adaptador para motores que modifican los Item recibidos con update_quality."""
+
+    def build(items: list[Item]) -> tuple[Advance, Rows]:
+        engine = factory(items)
+
+        def advance(days: int) -> None:
+            for _ in range(days):
+                engine.update_quality()
+
+        return advance, lambda: items
+
+    return build
+
+
+def _settled(items: list[Item]) -> tuple[Advance, Rows]:
+    engine = GildedRose(items, track_settled=True)
+
+    def advance(days: int) -> None:
+        for _ in range(days):
+            engine.update_quality()
+
+    return advance, lambda: engine.items
+
+
+def _closed_form(items: list[Item]) -> tuple[Advance, Rows]:
+    return GildedRose(items).advance, lambda: items
+
+
+def _compact(items: list[Item]) -> tuple[Advance, Rows]:
+    inventory = CompactInventory.from_items(items)
+
+    def advance(days: int) -> None:
+        for _ in range(days):
+            inventory.update_quality()
+
+    return advance, lambda: inventory
+
+
+def _lazy(items: list[Item]) -> tuple[Advance, Rows]:
+    engine = LazyGildedRose(items)
+    return engine.advance, lambda: engine
+
+
+def _forecast(items: list[Item]) -> tuple[Advance, Rows]:
+    trajectories = forecast(items)
+    names = [item.name for item in items]
+    elapsed = 0
+
+    def advance(days: int) -> None:
+        nonlocal elapsed
+        elapsed += days
+
+    def rows() -> Iterable[Item]:
+        return (
+            Item(name, trajectory.sell_in_at(elapsed), trajectory.quality_at(elapsed))
+            for name, trajectory in zip(names, trajectories, strict=True)
+        )
+
+    return advance, rows
+
+
+def _tenants(items: list[Item]) -> tuple[Advance, Rows]:
+    batch = TenantBatch()
+    for start in range(0, len(items), TENANT_SIZE):
+        batch.register(start, items[start : start + TENANT_SIZE])
+    return batch.tick, lambda: items
+
+
+def _binary_store(items: list[Item]) -> tuple[Advance, Rows]:
+    # Cada avance escribe el estado a un archivo temporal, lo actualiza con mmap
+    # y lo vuelve a leer, para no dejar archivos abiertos entre llamadas.
+    def advance(days: int) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = f"{directory}/inventory.grib"
+            write_items(items, path)
+            with MappedInventory(path) as inventory:
+                for _ in range(days):
+                    inventory.update_quality()
+                for item, updated in zip(items, inventory.to_items(), strict=True):
+                    item.sell_in, item.quality = updated.sell_in, updated.quality
+
+    return advance, lambda: items
+
+
+def _parallel(items: list[Item]) -> tuple[Advance, Rows]:
+    from gilded_rose.parallel import ParallelGildedRose
+
+    # Cada avance abre y cierra su propio pool para no dejar procesos ni memoria
+    # compartida vivos entre llamadas.
+    def advance(days: int) -> None:
+        with ParallelGildedRose(items, workers=2) as engine:
+            for _ in range(days):
+                engine.update_quality()
+            engine.sync_items(items)
+
+    return advance, lambda: items
+
+
+def _columnar(items: list[Item]) -> tuple[Advance, Rows]:
+    from gilded_rose.columnar import ColumnarInventory
+
+    inventory = ColumnarInventory.from_items(items)
+
+    def advance(days: int) -> None:
+        for _ in range(days):
+            inventory.update_quality()
+
+    return advance, inventory.to_items
+
+
+# Cada motor recibe una copia propia de los items y devuelve (avanzar, filas).
+ENGINES: dict[str, Callable[[list[Item]], tuple[Advance, Rows]]] = {
+    REFERENCE: _day_by_day(GildedRose),
+    "gilded_rose_settled": _settled,
+    "closed_form": _closed_form,
+    "refactored": _day_by_day(GildedRoseRefactored),
+    "rule_tables": _day_by_day(TableDrivenGildedRose),
+    "compact": _compact,
+    "lazy": _lazy,
+    "binary_store": _binary_store,
+    "tenants": _tenants,
+    "forecast": _forecast,
+    "columnar": _columnar,
+    "parallel": _parallel,
+}
+
+
+def available_engines() -> list[str]:
+    """Motores que pueden ejecutarse en este entorno (columnar y parallel requieren NumPy)."""
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return [name for name in ENGINES if name not in NUMPY_ENGINES]
+    return list(ENGINES)
+
+
+def digest(rows: Iterable[Item]) -> str:
+    """Digest del estado, calculado fila por fila sin armar una copia del inventario.
+
+    Args:
+        rows (Iterable[Item]): Filas en el orden original.
+
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    for row in rows:
+        hasher.update(f"{row.name}\x1f{row.sell_in}\x1f{row.quality}\x1e".encode())
+    return hasher.hexdigest()
+
+
+def _copy(items: Iterable[Item]) -> list[Item]:
+    return [Item(item.name, item.sell_in, item.quality) for item in items]
+
+
+def _state(rows: Iterable[Item]) -> list[tuple[str, int, int]]:
+    return [(row.name, row.sell_in, row.quality) for row in rows]
+
+
+def first_mismatch(items: list[Item], engine: str, days: int, stride: int = 1) -> int | None:
+    """Primer día de control en que `engine` difiere de la referencia, o None.
+
+    Args:
+        items (list[Item]): Inventario inicial; no se modifica.
+        engine (str): Motor a comparar.
+        days (int): Días a simular.
+        stride (int): Días entre puntos de control.
+
+    """
+    advance_reference, reference_rows = ENGINES[REFERENCE](_copy(items))
+    advance_engine, engine_rows = ENGINES[engine](_copy(items))
+    day = 0
+    while day < days:
+        step = min(stride, days - day)
+        advance_reference(step)
+        advance_engine(step)
+        day += step
+        if digest(reference_rows()) != digest(engine_rows()):
+            return day
+    return None
+
+
+@dataclass
+class Mismatch:
+    """Ejemplo mínimo en el que un motor difiere de la referencia."""
+
+    engine: str
+    day: int
+    items: list[Item]
+    expected: list[tuple[str, int, int]]
+    actual: list[tuple[str, int, int]]
+
+    def describe(self) -> str:
+        lines = [f"{self.engine} difiere de {REFERENCE} el día {self.day} con:"]
+        lines.extend(f"    {item!r}" for item in self.items)
+        lines.append(f"  esperado: {self.expected}")
+        lines.append(f"  obtenido: {self.actual}")
+        return "\n".join(lines)
+
+
+def _shrink_items(items: list[Item], fails: Callable[[list[Item]], bool]) -> list[Item]:
+    """Quita tramos de items (de mitades a items sueltos) mientras siga fallando."""
+    chunk = max(1, len(items) // 2)
+    while True:
+        start = 0
+        while start < len(items):
+            candidate = items[:start] + items[start + chunk :]
+            if candidate and fails(candidate):
+                items = candidate
+            else:
+                start += chunk
+        if chunk == 1:
+            return items
+        chunk //= 2
+
+
+def _simpler_values(value: int) -> list[int]:
+    """Valores más simples que `value`, del más simple al menos simple."""
+    candidates = [0, value // 2, value - 1 if value > 0 else value + 1]
+    return [candidate for candidate in dict.fromkeys(candidates) if abs(candidate) < abs(value)]
+
+
+def _shrink_values(items: list[Item], fails: Callable[[list[Item]], bool]) -> list[Item]:
+    """Acerca sell_in y quality de cada item a 0 mientras siga fallando."""
+    items = _copy(items)
+    changed = True
+    while changed:
+        changed = False
+        for item in items:
+            for field in ("sell_in", "quality"):
+                for value in _simpler_values(getattr(item, field)):
+                    original = getattr(item, field)
+                    setattr(item, field, value)
+                    if fails(items):
+                        changed = True
+                        break
+                    setattr(item, field, original)
+    return items
+
+
+def shrink(items: list[Item], engine: str, days: int, stride: int = 1) -> Mismatch:
+    """Reduce un inventario que hace fallar a `engine` hasta un ejemplo mínimo.
+
+    Primero se acota la cantidad de días al primer punto de control que falla,
+    luego se quitan items y por último se simplifican sus valores.
+
+    Args:
+        items (list[Item]): Inventario que falla.
+        engine (str): Motor que difiere de la referencia.
+        days (int): Días simulados.
+        stride (int): Días entre puntos de control.
+
+    """
+    day = first_mismatch(items, engine, days, stride)
+    if day is None:
+        raise ValueError(f"{engine} no difiere de {REFERENCE} con este inventario")
+
+    def fails(candidate: list[Item]) -> bool:
+        return first_mismatch(candidate, engine, day, stride) is not None
+
+    items = _shrink_values(_shrink_items(_copy(items), fails), fails)
+    day = first_mismatch(items, engine, day, stride)
+    results = []
+    for name in (REFERENCE, engine):
+        advance, rows = ENGINES[name](_copy(items))
+        advance(day)
+        results.append(_state(rows()))
+    return Mismatch(engine, day, items, *results)
+
+
+def run(
+    size: int, days: int, engines: list[str], seed: int = 0, stride: int = 1
+) -> dict[str, Mismatch | None]:
+    """Ejecuta todos los motores lado a lado y reduce cada discrepancia encontrada.
+
+    Args:
+        size (int): Cantidad de items del inventario.
+        days (int): Días a simular.
+        engines (list[str]): Motores a comparar contra la referencia.
+        seed (int): Semilla del inventario.
+        stride (int): Días entre puntos de control.
+
+    """
+    items = make_inventory(size, seed)
+    engines = [engine for engine in engines if engine != REFERENCE]
+    runners = {name: ENGINES[name](_copy(items)) for name in [REFERENCE, *engines]}
+    failures: dict[str, int] = {}
+    day = 0
+    while day < days:
+        step = min(stride, days - day)
+        day += step
+        for name, (advance, _) in runners.items():
+            if name not in failures:
+                advance(step)
+        expected = digest(runners[REFERENCE][1]())
+        for name in engines:
+            if name not in failures and digest(runners[name][1]()) != expected:
+                failures[name] = day
+    return {
+        name: shrink(items, name, failures[name], stride) if name in failures else None
+        for name in engines
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--size", type=int, default=10_000)
+    parser.add_argument("--days", type=int, default=100)
+    parser.add_argument("--engines", nargs="+", choices=ENGINES, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--stride", type=int, default=1, help="días entre puntos de control")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.stride < 1:
+        raise SystemExit("--stride debe ser positivo")
+    results = run(args.size, args.days, args.engines or available_engines(), args.seed, args.stride)
+    for engine, mismatch in results.items():
+        print(f"{engine}: OK" if mismatch is None else mismatch.describe())
+    return 1 if any(results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""Mantiene un inventario en memoria y atiende pedidos JSON por socket Unix o stdin.
+
+Ejemplo:
+    python -m scripts.inventory_daemon --socket /tmp/gilded_rose.sock --items-file items.csv
+    echo '{"id": 1, "op": "tick", "days": 3}' | python -m scripts.inventory_daemon
+
+Ver gilded_rose/daemon.py para el protocolo.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+from gilded_rose import GildedRose, ValidatedItems
+from gilded_rose.daemon import InventoryDaemon
+from scripts.texttest_fixture import default_items, load_items
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--socket", help="ruta del socket Unix (por defecto stdin/stdout)")
+    parser.add_argument("--items-file", help="inventario inicial en CSV o JSONL")
+    return parser.parse_args(argv)
+
+
+async def serve(args) -> None:
+    items = ValidatedItems(load_items(args.items_file) if args.items_file else default_items())
+    daemon = InventoryDaemon(GildedRose(items, track_settled=True))
+    if args.socket is None:
+        await daemon.serve_stdio()
+        return
+    if os.path.exists(args.socket):
+        os.unlink(args.socket)
+    server = await daemon.start_unix_server(args.socket)
+    print(f"Escuchando en {args.socket}", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None) -> None:
+    try:
+        asyncio.run(serve(parse_args(argv)))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
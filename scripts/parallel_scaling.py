@@ -0,0 +1,61 @@
+"""Mide la curva de escalado de ParallelGildedRose según la cantidad de workers.
+
+Ejemplo:
+    python -m scripts.parallel_scaling --size 10000000 --workers 1 2 4 8 16 32 64
+"""
+
+import argparse
+import random
+import time
+
+from gilded_rose import Item
+from gilded_rose.columnar import ColumnarInventory
+from gilded_rose.constants import AGED_BRIE, BACKSTAGE_PASSES, SULFURAS
+from gilded_rose.parallel import ParallelGildedRose
+
+NAMES = [AGED_BRIE, BACKSTAGE_PASSES, SULFURAS, "Conjured Mana Cake", "+5 Dexterity Vest"]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000, help="cantidad de items")
+    parser.add_argument("--ticks", type=int, default=10, help="días a simular por medición")
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="cantidades de workers"
+    )
+    parser.add_argument("--chunk-size", type=int, default=None, help="filas por tarea")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def make_items(size, seed):
+    rng = random.Random(seed)
+    return [Item(rng.choice(NAMES), rng.randint(-10, 30), rng.randint(0, 50)) for _ in range(size)]
+
+
+def time_ticks(engine, ticks):
+    start = time.perf_counter()
+    for _ in range(ticks):
+        engine.update_quality()
+    return (time.perf_counter() - start) / ticks
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    items = make_items(args.size, args.seed)
+
+    baseline = time_ticks(ColumnarInventory.from_items(items), args.ticks)
+    print("engine, workers, seconds_per_tick, ns_per_item, speedup")
+    print(f"columnar, 1, {baseline:.4f}, {baseline * 1e9 / args.size:.2f}, 1.00")
+    for workers in args.workers:
+        with ParallelGildedRose(items, workers=workers, chunk_size=args.chunk_size) as engine:
+            engine.update_quality()  # calienta el pool antes de medir
+            elapsed = time_ticks(engine, args.ticks)
+        print(
+            f"parallel, {workers}, {elapsed:.4f}, {elapsed * 1e9 / args.size:.2f}, "
+            f"{baseline / elapsed:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
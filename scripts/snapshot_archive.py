@@ -0,0 +1,52 @@
+"""Graba una simulación en un archivo de días comprimido y la reproduce como texto.
+
+Ejemplo:
+    python -m scripts.snapshot_archive record 365 dias.grar --items-file items.csv
+    python -m scripts.snapshot_archive render dias.grar --start 30 --stop 40
+
+render escribe exactamente el mismo texto que scripts/texttest_fixture.py.
+"""
+
+import argparse
+import sys
+
+from gilded_rose.archive import DEFAULT_KEYFRAME_INTERVAL, SnapshotArchive, record_simulation
+from scripts.texttest_fixture import default_items, load_items
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record = commands.add_parser("record", help="simula y graba los días 0..days")
+    record.add_argument("days", type=int, help="último día a grabar")
+    record.add_argument("archive", help="archivo a crear")
+    record.add_argument("--items-file", help="inventario inicial en CSV o JSONL")
+    record.add_argument("--keyframe-interval", type=int, default=DEFAULT_KEYFRAME_INTERVAL)
+
+    render = commands.add_parser("render", help="escribe los días como texto")
+    render.add_argument("archive", help="archivo a leer")
+    render.add_argument("--start", type=int, default=0)
+    render.add_argument("--stop", type=int, default=None)
+    render.add_argument("--output", help="archivo donde escribir el reporte (por defecto stdout)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+    if args.command == "record":
+        items = load_items(args.items_file) if args.items_file else default_items()
+        record_simulation(args.archive, items, args.days, args.keyframe_interval)
+        return
+    with SnapshotArchive(args.archive) as archive:
+        if args.output is None:
+            archive.render(sys.stdout, args.start, args.stop)
+            return
+        with open(args.output, "w", encoding="utf-8", buffering=1 << 20) as out:
+            archive.render(out, args.start, args.stop)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Avanza N días un inventario en CSV/JSONL sin cargarlo completo en memoria."""
+
+import argparse
+import sys
+
+from gilded_rose.streaming import DEFAULT_BATCH_SIZE, FORMATS, advance_file
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("source", help="archivo de entrada (.csv o .jsonl)")
+    parser.add_argument("target", help="archivo de salida (.csv o .jsonl)")
+    parser.add_argument("--days", type=int, default=1, help="días a avanzar")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--source-format", choices=FORMATS)
+    parser.add_argument("--target-format", choices=FORMATS)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    stats = advance_file(
+        args.source,
+        args.target,
+        args.days,
+        batch_size=args.batch_size,
+        source_format=args.source_format,
+        target_format=args.target_format,
+    )
+    print(
+        f"{stats.rows} filas en {stats.elapsed:.3f}s ({stats.rows_per_second:,.0f} filas/s)",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
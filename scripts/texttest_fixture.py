@@ -1,9 +1,33 @@
-from gilded_rose import GildedRose, Item
+import argparse
+import sys
 
+from gilded_rose import GildedRose, Item, ValidatedItems
+from gilded_rose.streaming import detect_format, read_items
 
-def main():
-    print("OMGHAI!")
-    items = [
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Simula el inventario de la posada Gilded Rose.")
+    parser.add_argument("days", nargs="?", type=int, default=1, help="último día a mostrar")
+    parser.add_argument(
+        "--jump",
+        action="store_true",
+        help="avanza directamente al último día y muestra sólo ese día",
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="reutiliza un único motor y escribe cada día de una sola vez",
+    )
+    parser.add_argument("--output", help="archivo donde escribir el reporte (por defecto stdout)")
+    parser.add_argument("--items-file", help="inventario inicial en CSV o JSONL")
+    args = parser.parse_args([str(arg) for arg in argv])
+    if args.jump and args.days < 0:
+        parser.error("--jump requiere una cantidad de días no negativa")
+    return args
+
+
+def default_items():
+    return [
         Item(name="+5 Dexterity Vest", sell_in=10, quality=20),
         Item(name="Aged Brie", sell_in=2, quality=0),
         Item(name="Elixir of the Mongoose", sell_in=5, quality=7),
@@ -15,20 +39,67 @@ def main():
         Item(name="Conjured Mana Cake", sell_in=3, quality=6),  # <-- :O
         Item(name="Conjured Sword", sell_in=10, quality=20),  # <-- :O
     ]
-    days = 2
-    import sys
 
-    if len(sys.argv) > 1:
-        days = int(sys.argv[1]) + 1
+
+def load_items(path):
+    with open(path, encoding="utf-8", newline="") as stream:
+        return list(read_items(stream, detect_format(path)))
+
+
+def print_day(day, items, out):
+    print("-------- day %s --------" % day, file=out)  # noqa: UP031
+    print("name, sellIn, quality", file=out)
+    for item in items:
+        print(item, file=out)
+
+
+def render_day(day, items):
+    """Devuelve el bloque de un día con el mismo texto que print_day."""
+    lines = ["-------- day %s --------" % day, "name, sellIn, quality"]  # noqa: UP031
+    lines.extend(map(str, items))
+    lines.append("")
+    return "\n".join(lines)
+
+
+def write_report(items, days, out):
+    """Reporte rápido: un solo motor y una escritura por día."""
+    gilded_rose = GildedRose(items, track_settled=True)
+    for day in range(days):
+        block = render_day(day, gilded_rose.items)
+        out.write(block + "\n" if day < days - 1 else block)
+        if day < days - 1:
+            gilded_rose.update_quality()
+
+
+def run(args, out):
+    print("OMGHAI!", file=out)
+    # Se valida una sola vez: los motores creados cada día no vuelven a recorrer la lista.
+    items = ValidatedItems(load_items(args.items_file) if args.items_file else default_items())
+
+    if args.jump:
+        GildedRose(items).advance(args.days)
+        print_day(args.days, items, out)
+        return
+
+    days = args.days + 1
+    if args.fast:
+        write_report(items, days, out)
+        return
     for day in range(days):
-        print("-------- day %s --------" % day)  # noqa: UP031
-        print("name, sellIn, quality")
-        for item in items:
-            print(item)
+        print_day(day, items, out)
         if day < days - 1:
-            print("")
+            print("", file=out)
         GildedRose(items).update_quality()
 
 
+def main():
+    args = parse_args(sys.argv[1:])
+    if args.output is None:
+        run(args, sys.stdout)
+        return
+    with open(args.output, "w", encoding="utf-8", buffering=1 << 20) as out:
+        run(args, out)
+
+
 if __name__ == "__main__":
     main()
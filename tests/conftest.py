@@ -1,8 +1,10 @@
+import random
 import sys
 
 import pytest
 
 from gilded_rose import GildedRose, Item
+from gilded_rose.constants import AGED_BRIE, BACKSTAGE_PASSES, SULFURAS
 
 # Ensure project root is in path for mutmut isolation
 sys.path.append("/home/usuario/development/GildedRose-Python-Refactoring")
@@ -10,6 +12,49 @@ sys.path.append("/home/usuario/development/GildedRose-Python-Refactoring")
 
 # conftest.py
 
+ITEM_NAMES = (
+    AGED_BRIE,
+    BACKSTAGE_PASSES,
+    SULFURAS,
+    "Conjured Mana Cake",
+    "Normal Item",
+    "Ñandú",
+)
+
+
+def random_items(
+    seed,
+    size,
+    names=ITEM_NAMES,
+    sell_in=(-15, 25),
+    quality=(0, 50),
+    edge_qualities=(80, -2, 51),
+):
+    """Inventario reproducible con todas las categorías.
+
+    Cada calidad sale de `quality` o, con igual probabilidad cada uno, de
+    `edge_qualities` (la de Sulfuras y valores fuera del rango válido).
+    """
+    rng = random.Random(seed)
+    return [
+        Item(
+            rng.choice(names),
+            rng.randint(*sell_in),
+            rng.choice([*edge_qualities, rng.randint(*quality)]),
+        )
+        for _ in range(size)
+    ]
+
+
+def as_tuples(items):
+    """Items como tuplas (name, sell_in, quality), para comparar inventarios."""
+    return [(item.name, item.sell_in, item.quality) for item in items]
+
+
+def as_reprs(items):
+    """Items como su repr, para comparar inventarios."""
+    return [repr(item) for item in items]
+
 
 @pytest.fixture
 def update_quality():
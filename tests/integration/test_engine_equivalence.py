@@ -0,0 +1,87 @@
+"""Tests de equivalencia entre motores usando el arnés diferencial."""
+
+import pytest
+
+from gilded_rose import GildedRose, Item
+from gilded_rose.constants import AGED_BRIE
+from scripts import equivalence_harness
+from scripts.equivalence_harness import (
+    REFERENCE,
+    available_engines,
+    digest,
+    first_mismatch,
+    main,
+    make_inventory,
+    run,
+    shrink,
+)
+
+
+def _brie_off_by_one(items):
+    """Motor deliberadamente roto: Aged Brie vencido no recibe el incremento extra."""
+    engine = GildedRose(items)
+
+    def advance(days):
+        for _ in range(days):
+            engine.update_quality()
+            for item in items:
+                if item.name == AGED_BRIE and item.sell_in < -3 and 0 < item.quality < 50:
+                    item.quality -= 1
+
+    return advance, lambda: items
+
+
+@pytest.fixture
+def broken_engine(monkeypatch):
+    monkeypatch.setitem(equivalence_harness.ENGINES, "broken", _brie_off_by_one)
+    return "broken"
+
+
+class TestEquivalence:
+    """Todos los motores coinciden con GildedRose en inventarios grandes."""
+
+    @pytest.mark.parametrize("stride", [1, 7])
+    def test_all_engines_match(self, stride):
+        results = run(3_000, 60, available_engines(), seed=stride, stride=stride)
+        assert {"binary_store", "tenants", "forecast", "lazy"} <= set(results)
+        failures = [mismatch.describe() for mismatch in results.values() if mismatch]
+        assert failures == []
+
+    def test_inventory_covers_edges(self):
+        items = make_inventory(2_000, seed=1)
+        assert {item.quality for item in items} >= {0, 50, 80}
+        assert min(item.sell_in for item in items) < 0
+
+    def test_main_exit_code(self, capsys):
+        assert main(["--size", "200", "--days", "20"]) == 0
+        assert "refactored: OK" in capsys.readouterr().out
+
+
+class TestShrinking:
+    """Ante una discrepancia el arnés la reduce a un ejemplo mínimo."""
+
+    def test_detects_and_shrinks(self, broken_engine):
+        results = run(2_000, 30, [REFERENCE, "rule_tables", broken_engine], seed=5)
+
+        assert results["rule_tables"] is None
+        mismatch = results[broken_engine]
+        assert len(mismatch.items) == 1
+        item = mismatch.items[0]
+        assert item.name == AGED_BRIE
+        assert mismatch.expected != mismatch.actual
+        assert first_mismatch(mismatch.items, broken_engine, mismatch.day) == mismatch.day
+        assert broken_engine in mismatch.describe()
+
+    def test_shrink_requires_a_failure(self, broken_engine):
+        with pytest.raises(ValueError):
+            shrink([Item("Normal Item", 5, 5)], broken_engine, 10)
+
+
+class TestDigest:
+    """El digest depende sólo del estado de las filas."""
+
+    def test_digest(self):
+        first = [Item("a", 1, 2), Item("b", 3, 4)]
+        assert digest(first) == digest([Item("a", 1, 2), Item("b", 3, 4)])
+        assert digest(first) != digest([Item("a", 1, 2), Item("b", 3, 5)])
+        assert digest([Item("a", 12, 3)]) != digest([Item("a1", 2, 3)])
@@ -0,0 +1,63 @@
+"""Tests para los modos del texttest fixture."""
+
+import sys
+
+import pytest
+
+from gilded_rose.streaming import CSV_FORMAT, write_items
+from scripts.texttest_fixture import default_items, main
+
+
+def run_fixture(monkeypatch, capsys, *args):
+    monkeypatch.setattr(sys, "argv", ["texttest_fixture.py", *args])
+    main()
+    return capsys.readouterr().out
+
+
+class TestFastReport:
+    """El modo rápido produce exactamente el mismo texto que el modo clásico."""
+
+    @pytest.mark.parametrize("days", ["0", "1", "11", "60"])
+    def test_fast_output_is_identical(self, monkeypatch, capsys, days):
+        expected = run_fixture(monkeypatch, capsys, days)
+        assert run_fixture(monkeypatch, capsys, days, "--fast") == expected
+
+    def test_output_file(self, monkeypatch, capsys, tmp_path):
+        expected = run_fixture(monkeypatch, capsys, "20")
+        target = tmp_path / "reporte.txt"
+
+        run_fixture(monkeypatch, capsys, "20", "--fast", "--output", str(target))
+
+        assert target.read_text(encoding="utf-8") == expected
+
+    def test_items_file(self, monkeypatch, capsys, tmp_path):
+        expected = run_fixture(monkeypatch, capsys, "5")
+        source = tmp_path / "items.csv"
+        with open(source, "w", encoding="utf-8", newline="") as stream:
+            write_items(default_items(), stream, CSV_FORMAT)
+
+        assert run_fixture(monkeypatch, capsys, "5", "--fast", "--items-file", str(source)) == (
+            expected
+        )
+
+
+class TestJump:
+    """--jump muestra sólo el último día."""
+
+    def test_jump_matches_last_day(self, monkeypatch, capsys):
+        full = run_fixture(monkeypatch, capsys, "30")
+        jumped = run_fixture(monkeypatch, capsys, "30", "--jump")
+
+        last_day = full[full.index("-------- day 30 --------") :]
+        assert jumped == "OMGHAI!\n" + last_day
+
+    def test_jump_rejects_negative_days(self, monkeypatch, capsys):
+        with pytest.raises(SystemExit) as exit_info:
+            run_fixture(monkeypatch, capsys, "-3", "--jump")
+
+        assert exit_info.value.code == 2
+        assert "no negativa" in capsys.readouterr().err
+
+    @pytest.mark.parametrize("mode", [[], ["--fast"]])
+    def test_negative_days_print_only_banner(self, monkeypatch, capsys, mode):
+        assert run_fixture(monkeypatch, capsys, "-3", *mode) == "OMGHAI!\n"
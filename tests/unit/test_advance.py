@@ -0,0 +1,61 @@
+"""Tests para GildedRose.advance (avance de varios días en forma cerrada)."""
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from gilded_rose import GildedRose, Item
+from gilded_rose.categories import ItemCategory
+from gilded_rose.closed_form import advance_state
+from gilded_rose.constants import BACKSTAGE_PASSES
+from tests.conftest import ITEM_NAMES
+
+
+def simulate(name, sell_in, quality, days):
+    """Aplica update_quality `days` veces y devuelve el item resultante."""
+    item = Item(name, sell_in, quality)
+    gilded_rose = GildedRose([item])
+    for _ in range(days):
+        gilded_rose.update_quality()
+    return item
+
+
+class TestAdvance:
+    """advance(days) equivale a llamar days veces a update_quality."""
+
+    @given(
+        name=st.sampled_from(ITEM_NAMES),
+        sell_in=st.integers(min_value=-20, max_value=30),
+        quality=st.integers(min_value=-5, max_value=80),
+        days=st.integers(min_value=0, max_value=60),
+    )
+    def test_matches_daily_updates(self, name, sell_in, quality, days):
+        expected = simulate(name, sell_in, quality, days)
+        item = Item(name, sell_in, quality)
+        GildedRose([item]).advance(days)
+
+        assert (item.sell_in, item.quality) == (expected.sell_in, expected.quality)
+
+    def test_backstage_crosses_all_thresholds(self):
+        item = Item(BACKSTAGE_PASSES, 12, 0)
+        GildedRose([item]).advance(11)
+        # 2 días a +1, 5 días a +2, 4 días a +3
+        assert (item.sell_in, item.quality) == (1, 24)
+
+    def test_backstage_drops_after_concert(self):
+        item = Item(BACKSTAGE_PASSES, 3, 10)
+        GildedRose([item]).advance(365)
+        assert (item.sell_in, item.quality) == (-362, 0)
+
+    def test_zero_days_keeps_items(self):
+        item = Item("Normal Item", 5, 7)
+        GildedRose([item]).advance(0)
+        assert (item.sell_in, item.quality) == (5, 7)
+
+    def test_negative_days_raises_error(self):
+        with pytest.raises(ValueError, match="no pueden ser negativos"):
+            GildedRose([Item("Normal Item", 5, 7)]).advance(-1)
+
+    def test_advance_state_by_category(self):
+        assert advance_state(ItemCategory.CONJURED, 1, 10, 3) == (-2, 0)
+        assert advance_state(ItemCategory.SULFURAS, 1, 80, 3) == (1, 80)
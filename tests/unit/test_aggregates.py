@@ -0,0 +1,147 @@
+"""Tests para los agregados incrementales del inventario."""
+
+import pytest
+
+from gilded_rose import GildedRose, Item
+from gilded_rose.aggregates import InventoryAggregates
+from gilded_rose.categories import ItemCategory
+from gilded_rose.constants import AGED_BRIE, BACKSTAGE_PASSES, SULFURAS
+from gilded_rose.query_index import QueryIndex
+from tests.conftest import random_items
+
+
+def recomputed(items):
+    return InventoryAggregates(items).snapshot()
+
+
+class TestInventoryAggregates:
+    """Definición de cada total."""
+
+    def test_totals(self):
+        aggregates = InventoryAggregates(
+            [
+                Item("Normal Item", -1, 3),
+                Item(AGED_BRIE, 4, 50),
+                Item(BACKSTAGE_PASSES, -1, 0),
+                Item(BACKSTAGE_PASSES, 3, 50),
+                Item(SULFURAS, -1, 80),
+            ]
+        )
+
+        assert aggregates.item_count == 5
+        assert aggregates.quality_by_category == {
+            ItemCategory.NORMAL: 3,
+            ItemCategory.AGED_BRIE: 50,
+            ItemCategory.BACKSTAGE_PASSES: 50,
+            ItemCategory.SULFURAS: 80,
+            ItemCategory.CONJURED: 0,
+        }
+        assert aggregates.total_quality == 183
+        assert aggregates.expired == 2
+        assert aggregates.at_max_quality == 2
+        assert aggregates.worthless_backstage_passes == 1
+
+    def test_verify_detects_drift(self):
+        items = [Item("Normal Item", 1, 10)]
+        aggregates = InventoryAggregates(items)
+        items[0].quality = 5
+        with pytest.raises(RuntimeError, match="inconsistentes"):
+            aggregates.verify(items)
+
+
+class TestGildedRoseAggregates:
+    """GildedRose mantiene los agregados en cada operación."""
+
+    @pytest.mark.parametrize("debug", [False, True])
+    def test_update_quality(self, debug):
+        items = random_items(1, 500)
+        gilded_rose = GildedRose(items)
+        aggregates = gilded_rose.enable_aggregates(debug=debug)
+        for _ in range(40):
+            gilded_rose.update_quality()
+            assert aggregates.snapshot() == recomputed(items)
+
+    def test_add_remove_and_advance(self):
+        items = random_items(2, 200)
+        gilded_rose = GildedRose(items)
+        aggregates = gilded_rose.enable_aggregates(debug=True)
+
+        extra = random_items(3, 50)
+        gilded_rose.add_items(extra)
+        gilded_rose.update_quality()
+        gilded_rose.remove_items(extra[::2] + items[:10] + items[:1])
+        gilded_rose.advance(15)
+        gilded_rose.update_quality()
+
+        assert len(items) == 200 + 50 - 25 - 10
+        assert aggregates.snapshot() == recomputed(items)
+
+    @pytest.mark.parametrize("days", [0, 1, 7, 30])
+    def test_advance(self, days):
+        gilded_rose = GildedRose(random_items(12, 300))
+        aggregates = gilded_rose.enable_aggregates()
+        gilded_rose.advance(days)
+        assert aggregates.snapshot() == InventoryAggregates(gilded_rose.items).snapshot()
+
+    def test_external_mutation_needs_refresh(self):
+        items = [Item("Normal Item", 1, 10), Item(AGED_BRIE, 3, 5)]
+        gilded_rose = GildedRose(items)
+        aggregates = gilded_rose.enable_aggregates()
+        items[0].quality = 50
+        assert aggregates.snapshot() != recomputed(items)
+
+        gilded_rose.refresh_index()
+        assert aggregates.snapshot() == recomputed(items)
+
+    def test_items_assignment_resets(self):
+        gilded_rose = GildedRose(random_items(4, 20))
+        aggregates = gilded_rose.enable_aggregates()
+        replacement = random_items(5, 30)
+        gilded_rose.items = replacement
+        assert aggregates.snapshot() == recomputed(replacement)
+
+    def test_with_instrumentation(self):
+        items = random_items(6, 100)
+        gilded_rose = GildedRose(items)
+        gilded_rose.enable_instrumentation()
+        gilded_rose.enable_aggregates(debug=True)
+        for _ in range(10):
+            gilded_rose.update_quality()
+        assert gilded_rose.aggregates.snapshot() == recomputed(items)
+
+    def test_with_change_records(self):
+        items = random_items(7, 100)
+        gilded_rose = GildedRose(items)
+        gilded_rose.enable_aggregates(debug=True)
+        index = QueryIndex(gilded_rose)
+        for _ in range(10):
+            index.tick()
+        assert gilded_rose.aggregates.snapshot() == recomputed(items)
+
+    def test_results_unchanged(self):
+        items = random_items(8, 300)
+        expected = [Item(item.name, item.sell_in, item.quality) for item in items]
+        gilded_rose = GildedRose(items)
+        gilded_rose.enable_aggregates()
+        reference = GildedRose(expected)
+        for _ in range(30):
+            gilded_rose.update_quality()
+            reference.update_quality()
+        assert [repr(item) for item in items] == [repr(item) for item in expected]
+
+    def test_disable(self):
+        gilded_rose = GildedRose(random_items(9, 10))
+        gilded_rose.enable_aggregates()
+        gilded_rose.disable_aggregates()
+        gilded_rose.update_quality()
+        assert gilded_rose.aggregates is None
+
+    def test_rejects_track_settled(self):
+        gilded_rose = GildedRose(random_items(10, 10), track_settled=True)
+        with pytest.raises(ValueError, match="asentados"):
+            gilded_rose.enable_aggregates()
+
+    def test_remove_unknown_item(self):
+        gilded_rose = GildedRose(random_items(11, 10))
+        with pytest.raises(ValueError, match="no pertenecen"):
+            gilded_rose.remove_items([Item("Normal Item", 1, 1)])
@@ -0,0 +1,169 @@
+"""Tests para el archivo comprimido de días."""
+
+import io
+import random
+import sys
+
+import pytest
+
+from gilded_rose import GildedRose, Item
+from gilded_rose.archive import (
+    ArchiveWriter,
+    SnapshotArchive,
+    decode_runs,
+    encode_runs,
+    record_simulation,
+)
+from scripts import snapshot_archive
+from scripts.texttest_fixture import default_items
+from scripts.texttest_fixture import main as fixture_main
+from tests.conftest import random_items
+
+
+def simulate(items, days):
+    """Estados de los días 0..days como listas de tuplas."""
+    items = [Item(item.name, item.sell_in, item.quality) for item in items]
+    gilded_rose = GildedRose(items)
+    states = [[(i.name, i.sell_in, i.quality) for i in items]]
+    for _ in range(days):
+        gilded_rose.update_quality()
+        states.append([(i.name, i.sell_in, i.quality) for i in items])
+    return states
+
+
+def fixture_output(monkeypatch, capsys, days):
+    monkeypatch.setattr(sys, "argv", ["texttest_fixture.py", str(days)])
+    fixture_main()
+    return capsys.readouterr().out
+
+
+class TestRunLengthEncoding:
+    """Las columnas RLE se decodifican a los mismos valores."""
+
+    @pytest.mark.parametrize("values", [[], [0], [-1] * 100, [1, 1, 2, 2, 2, -3, 2**31 - 1]])
+    def test_round_trip(self, values):
+        decoded, offset = decode_runs(encode_runs(values))
+        assert list(decoded) == values
+        assert offset == len(encode_runs(values))
+
+    def test_uniform_column_is_one_run(self):
+        assert len(encode_runs([-1] * 10_000)) == 12
+
+
+class TestRandomAccess:
+    """Cualquier día se reconstruye igual a la simulación."""
+
+    @pytest.mark.parametrize("interval", [1, 5, 64])
+    def test_items_at_every_day(self, tmp_path, interval):
+        items = random_items(1, 200)
+        path = tmp_path / "dias.grar"
+        record_simulation(path, items, 40, keyframe_interval=interval)
+        expected = simulate(items, 40)
+
+        with SnapshotArchive(path) as archive:
+            assert archive.days == 41
+            assert len(archive) == 200
+            for day in random.Random(2).sample(range(41), 41):
+                assert [(i.name, i.sell_in, i.quality) for i in archive.items_at(day)] == (
+                    expected[day]
+                )
+
+    def test_iter_days_range(self, tmp_path):
+        items = random_items(3, 50)
+        path = tmp_path / "dias.grar"
+        record_simulation(path, items, 30, keyframe_interval=7)
+        expected = simulate(items, 30)
+
+        with SnapshotArchive(path) as archive:
+            days = [
+                (day, list(sell_in), list(quality))
+                for day, sell_in, quality in archive.iter_days(9, 23)
+            ]
+
+        assert [day for day, _, _ in days] == list(range(9, 24))
+        for day, sell_in, quality in days:
+            assert sell_in == [row[1] for row in expected[day]]
+            assert quality == [row[2] for row in expected[day]]
+
+    def test_archive_is_much_smaller_than_text(self, tmp_path):
+        items = random_items(4, 2_000)
+        path = tmp_path / "dias.grar"
+        record_simulation(path, items, 100)
+        with SnapshotArchive(path) as archive:
+            text = io.StringIO()
+            archive.render(text)
+            assert archive.nbytes() * 5 < len(text.getvalue().encode())
+
+    def test_day_out_of_range(self, tmp_path):
+        path = tmp_path / "dias.grar"
+        record_simulation(path, random_items(5, 5), 3)
+        with SnapshotArchive(path) as archive:
+            with pytest.raises(ValueError):
+                archive.items_at(4)
+            with pytest.raises(ValueError):
+                list(archive.iter_days(3, 1))
+
+
+class TestRender:
+    """El render reproduce el texto del texttest fixture."""
+
+    @pytest.mark.parametrize("days", [0, 1, 11, 40])
+    def test_matches_fixture_output(self, monkeypatch, capsys, tmp_path, days):
+        path = tmp_path / "dias.grar"
+        record_simulation(path, default_items(), days, keyframe_interval=8)
+        out = io.StringIO()
+        with SnapshotArchive(path) as archive:
+            archive.render(out)
+
+        assert out.getvalue() == fixture_output(monkeypatch, capsys, days)
+
+    def test_script_round_trip(self, monkeypatch, capsys, tmp_path):
+        path = tmp_path / "dias.grar"
+        snapshot_archive.main(["record", "15", str(path)])
+        snapshot_archive.main(["render", str(path)])
+
+        assert capsys.readouterr().out == fixture_output(monkeypatch, capsys, 15)
+
+
+class TestWriter:
+    """Validaciones del escritor y del lector."""
+
+    def test_rejects_changed_names(self, tmp_path):
+        with ArchiveWriter(tmp_path / "dias.grar", [Item("a", 1, 1)]) as writer:
+            with pytest.raises(ValueError, match="mismos nombres"):
+                writer.append([Item("b", 0, 0)])
+
+    def test_rejects_unclosed_or_foreign_files(self, tmp_path):
+        path = tmp_path / "otro.bin"
+        path.write_bytes(b"x" * 64)
+        with pytest.raises(ValueError):
+            SnapshotArchive(path)
+        path.write_bytes(b"")
+        with pytest.raises(ValueError):
+            SnapshotArchive(path)
+
+    def test_append_after_close(self, tmp_path):
+        writer = ArchiveWriter(tmp_path / "dias.grar", [Item("a", 1, 1)])
+        writer.close()
+        writer.close()
+        with pytest.raises(ValueError, match="cerrado"):
+            writer.append([Item("a", 0, 0)])
+
+    @pytest.mark.parametrize(("sell_in", "quality"), [(2**31, 0), (0, -(2**31) - 1)])
+    def test_rejects_values_outside_int32(self, tmp_path, sell_in, quality):
+        with ArchiveWriter(tmp_path / "dias.grar", [Item("a", 1, 1)]) as writer:
+            with pytest.raises(ValueError, match="fuera del rango de int32"):
+                writer.append([Item("a", sell_in, quality)])
+        with pytest.raises(ValueError, match="item 0"):
+            ArchiveWriter(tmp_path / "otro.grar", [Item("a", sell_in, quality)])
+
+    def test_delta_outside_int32_stores_full_day(self, tmp_path):
+        path = tmp_path / "dias.grar"
+        states = [(-(2**31), 2**31 - 1), (2**31 - 1, -(2**31)), (0, 0)]
+        with ArchiveWriter(path, [Item("a", *states[0])]) as writer:
+            for state in states[1:]:
+                writer.append([Item("a", *state)])
+
+        with SnapshotArchive(path) as archive:
+            for day, state in enumerate(states):
+                assert [(i.sell_in, i.quality) for i in archive.items_at(day)] == [state]
@@ -0,0 +1,63 @@
+"""Tests para el benchmark de motores."""
+
+import json
+
+import pytest
+
+from scripts.benchmark_engines import (
+    MIXES,
+    available_engines,
+    find_regressions,
+    main,
+    make_inventory,
+    run_case,
+)
+
+
+def result(engine, ns):
+    return {"engine": engine, "size": 10, "mix": "balanced", "ns_per_item_day": ns}
+
+
+class TestInventory:
+    """Los inventarios sintéticos son reproducibles y respetan la mezcla."""
+
+    def test_is_reproducible(self):
+        first = [repr(item) for item in make_inventory(100, "balanced", seed=3)]
+        second = [repr(item) for item in make_inventory(100, "balanced", seed=3)]
+        assert first == second
+
+    @pytest.mark.parametrize("mix", list(MIXES))
+    def test_mix_proportions_add_up(self, mix):
+        assert sum(MIXES[mix].values()) == pytest.approx(1.0)
+
+
+class TestBenchmark:
+    """Los casos producen métricas y detectan regresiones."""
+
+    @pytest.mark.parametrize("engine", available_engines())
+    def test_run_case_reports_metrics(self, engine):
+        measured = run_case(engine, size=50, mix="legendary_heavy", days=2)
+
+        assert measured["ns_per_item_day"] > 0
+        assert measured["peak_memory_bytes"] >= 0
+
+    def test_find_regressions(self):
+        baseline = [result("a", 100.0), result("b", 100.0)]
+        current = [result("a", 115.0), result("b", 130.0), result("c", 999.0)]
+
+        regressions = find_regressions(current, baseline, threshold=0.2)
+
+        assert [regression["engine"] for regression in regressions] == ["b"]
+        assert regressions[0]["baseline_ns_per_item_day"] == 100.0
+
+    def test_main_fails_on_regression(self, tmp_path, capsys):
+        output = tmp_path / "bench.json"
+        args = ["--sizes", "20", "--mixes", "balanced", "--engines", "gilded_rose"]
+        assert main([*args, "--days", "1", "--output", str(output)]) == 0
+
+        report = json.loads(output.read_text(encoding="utf-8"))
+        report["results"][0]["ns_per_item_day"] /= 1000
+        output.write_text(json.dumps(report), encoding="utf-8")
+
+        assert main([*args, "--days", "1", "--baseline", str(output)]) == 1
+        assert "REGRESIÓN" in capsys.readouterr().err
@@ -0,0 +1,98 @@
+"""Tests para el formato binario y el motor sobre mmap."""
+
+import pytest
+
+from gilded_rose import GildedRose, Item
+from gilded_rose.binary_store import (
+    HEADER_SIZE,
+    MappedInventory,
+    encode_items,
+    read_items,
+    write_items,
+)
+from gilded_rose.constants import SULFURAS
+from tests.conftest import as_reprs, random_items
+
+
+class TestFormat:
+    """La conversión desde y hacia listas de Item no pierde información."""
+
+    def test_round_trip(self, tmp_path):
+        items = random_items(1, 500)
+        path = tmp_path / "inventario.grib"
+        write_items(items, path)
+        assert as_reprs(read_items(path)) == as_reprs(items)
+
+    def test_empty_inventory(self, tmp_path):
+        path = tmp_path / "vacio.grib"
+        write_items([], path)
+        assert read_items(path) == []
+        assert path.stat().st_size == HEADER_SIZE
+
+    def test_layout_size(self):
+        encoded = encode_items([Item("abc", 1, 2), Item("abc", 3, 4)])
+        # encabezado + (4 + 3 bytes de nombre, rellenados a 8) + 3 columnas de 2 int32
+        assert len(encoded) == HEADER_SIZE + 8 + 3 * 2 * 4
+
+    def test_values_out_of_int32_range(self):
+        with pytest.raises(ValueError, match="int32"):
+            encode_items([Item("Normal Item", 2**31, 1)])
+
+    def test_rejects_non_items(self):
+        with pytest.raises(TypeError):
+            encode_items(["no es un item"])
+
+    @pytest.mark.parametrize(
+        "content",
+        [b"", b"XXXX" + bytes(HEADER_SIZE - 4)],
+    )
+    def test_invalid_files(self, tmp_path, content):
+        path = tmp_path / "invalido.grib"
+        path.write_bytes(content)
+        with pytest.raises(ValueError):
+            MappedInventory(path)
+
+    def test_truncated_file(self, tmp_path):
+        path = tmp_path / "truncado.grib"
+        path.write_bytes(encode_items(random_items(2, 10))[:-4])
+        with pytest.raises(ValueError, match="tamaño"):
+            MappedInventory(path)
+
+
+class TestMappedInventory:
+    """El motor aplica las reglas directamente sobre el archivo."""
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_update_in_place_matches_gilded_rose(self, tmp_path, seed):
+        expected = random_items(seed, 300)
+        path = tmp_path / "inventario.grib"
+        write_items(expected, path)
+        for _ in range(30):
+            with MappedInventory(path) as inventory:
+                inventory.update_quality()
+            GildedRose(expected).update_quality()
+
+        assert as_reprs(read_items(path)) == as_reprs(expected)
+
+    def test_accessors(self, tmp_path):
+        path = tmp_path / "inventario.grib"
+        write_items([Item("Normal Item", 3, 7), Item(SULFURAS, 0, 80)], path)
+        with MappedInventory(path) as inventory:
+            assert len(inventory) == 2
+            assert inventory.names == ("Normal Item", SULFURAS)
+            assert repr(inventory[0]) == "Normal Item, 3, 7"
+            inventory.quality[0] = 5
+        assert repr(read_items(path)[0]) == "Normal Item, 3, 5"
+
+    def test_read_only(self, tmp_path):
+        path = tmp_path / "inventario.grib"
+        write_items(random_items(3, 5), path)
+        with MappedInventory(path, writable=False) as inventory, pytest.raises(ValueError):
+            inventory.update_quality()
+
+    def test_close_is_idempotent(self, tmp_path):
+        path = tmp_path / "inventario.grib"
+        write_items(random_items(4, 5), path)
+        inventory = MappedInventory(path)
+        inventory.close()
+        inventory.close()
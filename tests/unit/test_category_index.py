@@ -0,0 +1,67 @@
+"""Tests para el índice de items por categoría."""
+
+import pytest
+
+from gilded_rose import GildedRose, Item
+from gilded_rose.categories import ItemCategory, classify
+from gilded_rose.constants import AGED_BRIE, BACKSTAGE_PASSES, SULFURAS
+
+
+class TestClassify:
+    """La clasificación respeta la precedencia de las reglas."""
+
+    @pytest.mark.parametrize(
+        ("name", "category"),
+        [
+            (SULFURAS, ItemCategory.SULFURAS),
+            (AGED_BRIE, ItemCategory.AGED_BRIE),
+            (BACKSTAGE_PASSES, ItemCategory.BACKSTAGE_PASSES),
+            ("Conjured Mana Cake", ItemCategory.CONJURED),
+            ("CONJURED sword", ItemCategory.CONJURED),
+            ("Elixir of the Mongoose", ItemCategory.NORMAL),
+        ],
+    )
+    def test_categories(self, name, category):
+        assert classify(name) is category
+
+    def test_classification_is_memoized_per_name(self):
+        classify.cache_clear()
+        GildedRose([Item("Normal Item", 5, 5) for _ in range(100)])
+
+        info = classify.cache_info()
+        assert (info.misses, info.hits) == (1, 99)
+
+
+class TestCategoryIndex:
+    """GildedRose mantiene el índice al agregar o renombrar items."""
+
+    def test_add_items_are_updated(self):
+        gilded_rose = GildedRose([Item("Normal Item", 5, 5)])
+        brie = Item(AGED_BRIE, 5, 5)
+        gilded_rose.add_items([brie])
+        gilded_rose.update_quality()
+
+        assert brie in gilded_rose.items
+        assert brie.quality == 6
+
+    def test_add_items_rejects_non_items(self):
+        gilded_rose = GildedRose([Item("Normal Item", 5, 5)])
+        with pytest.raises(TypeError, match="deben ser instancias de Item"):
+            gilded_rose.add_items(["invalid"])
+
+    def test_rename_requires_refresh(self):
+        item = Item("Normal Item", 5, 5)
+        gilded_rose = GildedRose([item])
+        item.name = AGED_BRIE
+        gilded_rose.refresh_index()
+        gilded_rose.update_quality()
+
+        assert item.quality == 6
+
+    def test_assigning_items_rebuilds_index(self):
+        gilded_rose = GildedRose([Item("Normal Item", 5, 5)])
+        brie = Item(AGED_BRIE, 5, 5)
+        gilded_rose.items = [brie]
+        gilded_rose.update_quality()
+
+        assert brie.quality == 6
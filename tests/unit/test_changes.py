@@ -0,0 +1,109 @@
+"""Tests para el registro de cambios de update_quality."""
+
+import pytest
+
+from gilded_rose import GildedRose, Item
+from gilded_rose.changes import ItemChange
+from gilded_rose.constants import AGED_BRIE, BACKSTAGE_PASSES, SULFURAS
+from tests.conftest import random_items
+
+
+class TestChangeRecords:
+    """Cada registro describe el cambio de un item."""
+
+    def test_records(self):
+        items = [
+            Item("Normal Item", 0, 1),  # vence y toca MIN_QUALITY
+            Item(SULFURAS, 0, 80),
+            Item(AGED_BRIE, 5, 50),  # acotado en MAX_QUALITY
+            Item("Normal Item", 5, 10),
+        ]
+        changes = GildedRose(items).update_quality_with_changes()
+
+        assert changes == [
+            ItemChange(0, 0, -1, 1, 0, True, True),
+            ItemChange(2, 5, 4, 50, 50, False, True),
+            ItemChange(3, 5, 4, 10, 9, False, False),
+        ]
+
+    def test_backstage_expiry_is_not_a_clamp(self):
+        changes = GildedRose([Item(BACKSTAGE_PASSES, 0, 30)]).update_quality_with_changes()
+        assert changes == [ItemChange(0, 0, -1, 30, 0, True, False)]
+
+    def test_quality_only(self):
+        items = [Item("Normal Item", -3, 0), Item(AGED_BRIE, 5, 50), Item("Normal Item", 5, 10)]
+        changes = GildedRose(items).update_quality_with_changes(quality_only=True)
+        assert [change.index for change in changes] == [2]
+
+
+class TestEquivalence:
+    """Los items quedan igual que con update_quality y los registros los describen."""
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_matches_update_quality(self, seed):
+        items = random_items(seed, 200)
+        expected = random_items(seed, 200)
+        gilded_rose = GildedRose(items)
+        for _ in range(30):
+            before = [(item.sell_in, item.quality) for item in expected]
+            GildedRose(expected).update_quality()
+            changes = gilded_rose.update_quality_with_changes()
+
+            assert [repr(item) for item in items] == [repr(item) for item in expected]
+            changed = {
+                index
+                for index, item in enumerate(expected)
+                if (item.sell_in, item.quality) != before[index]
+            }
+            assert {change.index for change in changes} == changed
+            for change in changes:
+                assert (change.new_sell_in, change.new_quality) == (
+                    items[change.index].sell_in,
+                    items[change.index].quality,
+                )
+
+    def test_helpers_are_restored(self):
+        gilded_rose = GildedRose(random_items(1, 10))
+        gilded_rose.update_quality_with_changes()
+        assert "_decrease_quality_safe" not in vars(gilded_rose)
+
+    @pytest.mark.parametrize("option", ["track_settled", "instrumentation"])
+    def test_incompatible_options(self, option):
+        gilded_rose = GildedRose(random_items(1, 10), track_settled=option == "track_settled")
+        if option == "instrumentation":
+            gilded_rose.enable_instrumentation()
+        with pytest.raises(ValueError):
+            gilded_rose.update_quality_with_changes()
+
+
+class TestIndexedPositions:
+    """Los registros usan el índice por categoría y las posiciones vigentes."""
+
+    def test_positions_after_add_and_remove(self):
+        items = random_items(5, 60)
+        gilded_rose = GildedRose(items)
+        gilded_rose.add_items(random_items(6, 20))
+        gilded_rose.remove_items(items[::4])
+        before = [(item.sell_in, item.quality) for item in items]
+
+        changes = gilded_rose.update_quality_with_changes()
+
+        assert [change.index for change in changes] == sorted(change.index for change in changes)
+        for change in changes:
+            assert (change.old_sell_in, change.old_quality) == before[change.index]
+            item = items[change.index]
+            assert (change.new_sell_in, change.new_quality) == (item.sell_in, item.quality)
+
+    def test_same_items_as_update_quality_without_refresh(self):
+        items = [Item("Normal Item", 5, 10)]
+        expected = [Item("Normal Item", 5, 10)]
+        gilded_rose = GildedRose(items)
+        reference = GildedRose(expected)
+        items.append(Item("Normal Item", 5, 10))
+        expected.append(Item("Normal Item", 5, 10))
+
+        changes = gilded_rose.update_quality_with_changes()
+        reference.update_quality()
+
+        assert [repr(item) for item in items] == [repr(item) for item in expected]
+        assert [change.index for change in changes] == [0]
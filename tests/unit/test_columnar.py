@@ -0,0 +1,48 @@
+"""Tests para el inventario columnar vectorizado."""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from gilded_rose import GildedRose, Item  # noqa: E402
+from gilded_rose.columnar import ColumnarInventory  # noqa: E402
+from gilded_rose.constants import AGED_BRIE, SULFURAS  # noqa: E402
+from tests.conftest import as_tuples, random_items
+
+
+class TestColumnarInventory:
+    """El inventario columnar reproduce a GildedRose día por día."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_gilded_rose(self, seed):
+        expected = random_items(seed, 500)
+        inventory = ColumnarInventory.from_items(expected)
+        gilded_rose = GildedRose(expected)
+
+        for _ in range(30):
+            gilded_rose.update_quality()
+            inventory.update_quality()
+            assert as_tuples(inventory.to_items()) == as_tuples(expected)
+
+    def test_to_items_keeps_original_order(self):
+        items = [Item("Normal Item", 1, 2), Item(SULFURAS, 0, 80), Item(AGED_BRIE, 3, 4)]
+        assert as_tuples(ColumnarInventory.from_items(items).to_items()) == as_tuples(items)
+
+    def test_sync_items_updates_in_place(self):
+        items = random_items(42, 50)
+        expected = random_items(42, 50)
+        inventory = ColumnarInventory.from_items(items)
+        inventory.update_quality()
+        inventory.sync_items(items)
+        GildedRose(expected).update_quality()
+
+        assert as_tuples(items) == as_tuples(expected)
+
+    def test_sync_items_rejects_other_sizes(self):
+        inventory = ColumnarInventory.from_items(random_items(1, 3))
+        with pytest.raises(ValueError, match="no coincide"):
+            inventory.sync_items(random_items(1, 2))
+
+    def test_columns_must_have_same_length(self):
+        with pytest.raises(ValueError, match="misma longitud"):
+            ColumnarInventory(["a", "b"], [1], [1, 2])
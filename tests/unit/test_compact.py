@@ -0,0 +1,102 @@
+"""Tests para el almacén compacto y sus vistas compatibles con Item."""
+
+import tracemalloc
+
+import pytest
+
+from gilded_rose import GildedRose, Item
+from gilded_rose.compact import CompactInventory, ItemView
+from gilded_rose.constants import AGED_BRIE
+from tests.conftest import as_reprs, random_items
+
+
+class TestItemView:
+    """Las vistas se comportan como Item."""
+
+    def test_view_is_an_item_with_same_repr(self):
+        inventory = CompactInventory.from_items([Item("Normal Item", 3, 7)])
+        view = inventory[0]
+
+        assert isinstance(view, Item)
+        assert isinstance(view, ItemView)
+        assert repr(view) == "Normal Item, 3, 7"
+        assert (view.name, view.sell_in, view.quality) == ("Normal Item", 3, 7)
+
+    def test_writes_go_to_the_store(self):
+        inventory = CompactInventory.from_items([Item("Normal Item", 3, 7)])
+        inventory[0].quality = 4
+        inventory[-1].sell_in = 1
+        inventory[0].name = AGED_BRIE
+
+        assert repr(inventory[0]) == "Aged Brie, 1, 4"
+        assert inventory.names == ("Normal Item", AGED_BRIE)
+
+    def test_index_out_of_range(self):
+        inventory = CompactInventory.from_items([Item("Normal Item", 3, 7)])
+        with pytest.raises(IndexError):
+            inventory[1]
+
+
+class TestCompactInventory:
+    """El almacén guarda columnas compactas y nombres internados."""
+
+    def test_names_are_interned(self):
+        inventory = CompactInventory.from_items(
+            [Item("Normal Item", 1, 1), Item(AGED_BRIE, 1, 1), Item("Normal Item", 2, 2)]
+        )
+        assert inventory.names == ("Normal Item", AGED_BRIE)
+        assert len(inventory) == 3
+
+    def test_round_trip(self):
+        items = random_items(1, 200)
+        assert as_reprs(CompactInventory.from_items(items).to_items()) == as_reprs(items)
+
+    def test_rejects_non_items(self):
+        with pytest.raises(TypeError):
+            CompactInventory.from_items([Item("Normal Item", 1, 1), "no es un item"])
+
+    def test_memory_is_about_twenty_bytes_per_item(self):
+        inventory = CompactInventory.from_items(random_items(2, 1000))
+        assert inventory.nbytes() == 20 * 1000
+
+    def test_store_is_much_smaller_than_item_list(self):
+        source = random_items(3, 10_000)
+
+        def allocated(build):
+            tracemalloc.start()
+            try:
+                built = build()
+                current, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            del built
+            return current
+
+        compact = allocated(lambda: CompactInventory.from_items(source))
+        item_list = allocated(lambda: [Item(i.name, i.sell_in, i.quality) for i in source])
+        assert compact * 4 < item_list
+
+
+class TestUpdates:
+    """Actualizar por vistas o sobre los arreglos da el mismo resultado que GildedRose."""
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_gilded_rose_over_views(self, seed):
+        expected = random_items(seed, 300)
+        inventory = CompactInventory.from_items(expected)
+        gilded_rose = GildedRose(inventory.views())
+        for _ in range(30):
+            gilded_rose.update_quality()
+            GildedRose(expected).update_quality()
+
+        assert as_reprs(inventory) == as_reprs(expected)
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_update_quality_in_place(self, seed):
+        expected = random_items(seed, 300)
+        inventory = CompactInventory.from_items(expected)
+        for _ in range(30):
+            inventory.update_quality()
+            GildedRose(expected).update_quality()
+
+        assert as_reprs(inventory) == as_reprs(expected)
@@ -0,0 +1,225 @@
+"""Tests para el daemon de inventario residente."""
+
+import asyncio
+import json
+
+import pytest
+
+from gilded_rose import GildedRose, Item
+from gilded_rose.constants import AGED_BRIE, BACKSTAGE_PASSES, SULFURAS
+from gilded_rose.daemon import InventoryDaemon, ReadWriteLock
+
+
+def make_items():
+    return [
+        Item("+5 Dexterity Vest", 10, 20),
+        Item(AGED_BRIE, 2, 0),
+        Item(SULFURAS, 0, 80),
+        Item(BACKSTAGE_PASSES, 5, 49),
+        Item("Conjured Mana Cake", 3, 6),
+    ]
+
+
+def make_daemon():
+    return InventoryDaemon(GildedRose(make_items()))
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+class TestCommands:
+    """Cada operación devuelve su resultado y la latencia del pedido."""
+
+    def test_tick_matches_update_quality(self):
+        daemon = make_daemon()
+        response = run(daemon.handle({"id": 7, "op": "tick", "days": 4}))
+
+        expected = make_items()
+        gilded_rose = GildedRose(expected)
+        for _ in range(4):
+            gilded_rose.update_quality()
+        query = run(daemon.handle({"op": "query"}))
+
+        assert response["id"] == 7
+        assert response["ok"] is True
+        assert response["result"] == {"day": 4}
+        assert response["latency_ms"] >= 0
+        assert [(r["name"], r["sell_in"], r["quality"]) for r in query["result"]["items"]] == [
+            (item.name, item.sell_in, item.quality) for item in expected
+        ]
+
+    def test_query_filters_and_pages(self):
+        daemon = make_daemon()
+        run(daemon.handle({"op": "tick", "days": 6}))
+
+        expired = run(daemon.handle({"op": "query", "expired": True}))["result"]
+        brie = run(daemon.handle({"op": "query", "category": "aged_brie"}))["result"]
+        page = run(daemon.handle({"op": "query", "offset": 1, "limit": 2}))["result"]
+
+        assert [r["name"] for r in expired["items"]] == [
+            AGED_BRIE,
+            BACKSTAGE_PASSES,
+            "Conjured Mana Cake",
+        ]
+        assert brie["items"] == [{"index": 1, "name": AGED_BRIE, "sell_in": -4, "quality": 10}]
+        assert page["total"] == 5
+        assert [r["index"] for r in page["items"]] == [1, 2]
+
+    def test_add_and_remove(self):
+        daemon = make_daemon()
+        added = run(
+            daemon.handle(
+                {"op": "add", "items": [{"name": "Elixir", "sell_in": 5, "quality": 7}] * 2}
+            )
+        )
+        by_name = run(daemon.handle({"op": "remove", "name": "Elixir"}))
+        by_index = run(daemon.handle({"op": "remove", "indices": [0, 2]}))
+        names = [r["name"] for r in run(daemon.handle({"op": "query"}))["result"]["items"]]
+
+        assert added["result"] == {"added": 2, "size": 7}
+        assert by_name["result"] == {"removed": 2, "size": 5}
+        assert by_index["result"] == {"removed": 2, "size": 3}
+        assert names == [AGED_BRIE, BACKSTAGE_PASSES, "Conjured Mana Cake"]
+
+    def test_snapshot_writes_file(self, tmp_path):
+        daemon = make_daemon()
+        path = tmp_path / "snapshot.jsonl"
+        run(daemon.handle({"op": "tick", "days": 1}))
+        response = run(daemon.handle({"op": "snapshot", "path": str(path)}))
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert response["result"]["items"] == 5
+        assert records[0] == {"name": "+5 Dexterity Vest", "sell_in": 9, "quality": 19}
+
+    def test_stats_report_latency_per_operation(self):
+        daemon = make_daemon()
+        for _ in range(3):
+            run(daemon.handle({"op": "tick"}))
+        stats = run(daemon.handle({"op": "stats"}))["result"]
+
+        assert stats["day"] == 3
+        assert stats["size"] == 5
+        assert stats["latency"]["tick"]["count"] == 3
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "no es json",
+            "[1, 2]",
+            '{"op": "explode"}',
+            '{"op": ["tick"]}',
+            '{"op": "tick", "days": -1}',
+            '{"op": "tick", "days": true}',
+            '{"op": "tick", "days": 1.5}',
+            '{"op": "query", "offset": -1}',
+            '{"op": "query", "offset": "2"}',
+            '{"op": "query", "limit": -5}',
+            '{"op": "query", "limit": false}',
+            '{"op": "add", "items": [{"name": "x"}]}',
+            '{"op": "add", "items": [{"name": "x", "sell_in": true, "quality": 1}]}',
+            '{"op": "add", "items": [{"name": "x", "sell_in": 1, "quality": 5.9}]}',
+            '{"op": "add", "items": [{"name": "x", "sell_in": "3", "quality": 1}]}',
+            '{"op": "add", "items": [{"name": "x", "sell_in": 1, "quality": -1}]}',
+            '{"op": "add", "items": [{"name": 7, "sell_in": 1, "quality": 1}]}',
+            '{"op": "add", "items": ["x"]}',
+            '{"op": "remove"}',
+            '{"op": "remove", "indices": "abc"}',
+            '{"op": "remove", "indices": [true]}',
+            '{"op": "remove", "indices": [-1]}',
+            '{"op": "remove", "indices": [5]}',
+            '{"op": "remove", "indices": [1.0]}',
+            '{"op": "query", "category": "weapons"}',
+            '{"op": "snapshot", "path": "inventory.txt"}',
+        ],
+    )
+    def test_invalid_requests_return_errors(self, line):
+        daemon = make_daemon()
+        response = run(daemon.handle_line(line))
+        assert response["ok"] is False
+        assert response["error"]
+        assert run(daemon.handle({"op": "stats"}))["result"]["size"] == 5
+
+    def test_unexpected_error_keeps_serving(self):
+        daemon = make_daemon()
+
+        def explode(request):
+            raise RuntimeError("boom")
+
+        daemon._handlers["stats"] = explode
+        lines = []
+
+        async def write_line(line):
+            lines.append(json.loads(line))
+
+        async def scenario():
+            reader = asyncio.StreamReader()
+            reader.feed_data(b'{"op": "stats", "id": 1}\n{"op": "tick", "id": 2}\n')
+            reader.feed_eof()
+            await daemon.serve_stream(reader, write_line)
+
+        run(scenario())
+
+        responses = {response["id"]: response for response in lines}
+        assert responses[1]["ok"] is False
+        assert "boom" in responses[1]["error"]
+        assert responses[2]["ok"] is True
+
+
+class TestConcurrency:
+    """Pipelining sobre un socket Unix con lecturas concurrentes."""
+
+    def test_pipelined_requests_over_unix_socket(self, tmp_path):
+        path = tmp_path / "daemon.sock"
+
+        async def scenario():
+            daemon = make_daemon()
+            server = await daemon.start_unix_server(path)
+            async with server:
+                reader, writer = await asyncio.open_unix_connection(str(path))
+                requests = [
+                    {"id": 1, "op": "tick", "days": 2},
+                    {"id": 2, "op": "query", "name": AGED_BRIE},
+                    {"id": 3, "op": "query", "name": SULFURAS},
+                    {"id": 4, "op": "tick", "days": 1},
+                    {"id": 5, "op": "stats"},
+                ]
+                writer.write(b"".join(json.dumps(r).encode() + b"\n" for r in requests))
+                await writer.drain()
+                writer.write_eof()
+                responses = [json.loads(await reader.readline()) for _ in requests]
+                writer.close()
+                await writer.wait_closed()
+            return {response["id"]: response for response in responses}
+
+        responses = run(scenario())
+
+        assert all(response["ok"] for response in responses.values())
+        assert responses[2]["result"]["items"][0]["quality"] == 2
+        assert responses[5]["result"]["day"] == 3
+
+    def test_readers_share_and_writers_wait_in_order(self):
+        async def scenario():
+            lock = ReadWriteLock()
+            events = []
+
+            async def reader(name):
+                async with lock.reading():
+                    events.append(f"{name}+")
+                    await asyncio.sleep(0.01)
+                    events.append(f"{name}-")
+
+            async def writer(name):
+                async with lock.writing():
+                    events.append(f"{name}+")
+                    await asyncio.sleep(0)
+                    events.append(f"{name}-")
+
+            await asyncio.gather(reader("r1"), reader("r2"), writer("w"), reader("r3"))
+            return events
+
+        events = run(scenario())
+
+        assert events[:2] == ["r1+", "r2+"]
+        assert events.index("w+") > max(events.index("r1-"), events.index("r2-"))
+        assert events.index("r3+") > events.index("w-")
@@ -0,0 +1,75 @@
+"""Tests para el pronóstico de trayectorias de calidad."""
+
+import pytest
+
+from gilded_rose import GildedRose, Item
+from gilded_rose.categories import ItemCategory
+from gilded_rose.constants import BACKSTAGE_PASSES, MAX_QUALITY, MIN_QUALITY
+from gilded_rose.forecast import Segment, Trajectory, forecast
+from tests.conftest import random_items
+
+HORIZON = 60
+
+
+def simulate(item, days):
+    """Serie de (sell_in, quality) de los días 0..days, avanzando día por día."""
+    copy = Item(item.name, item.sell_in, item.quality)
+    series = [(copy.sell_in, copy.quality)]
+    for _ in range(days):
+        GildedRose([copy]).update_quality()
+        series.append((copy.sell_in, copy.quality))
+    return series
+
+
+class TestTrajectory:
+    """Las trayectorias coinciden con la simulación día por día."""
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_matches_simulation(self, seed):
+        items = random_items(seed, 150)
+        for item, trajectory in zip(items, forecast(items), strict=True):
+            series = simulate(item, HORIZON)
+            qualities = [quality for _, quality in series]
+
+            assert [trajectory.quality_at(day) for day in range(HORIZON + 1)] == qualities
+            assert [trajectory.sell_in_at(day) for day in range(HORIZON + 1)] == [
+                sell_in for sell_in, _ in series
+            ]
+            for target in (MIN_QUALITY, MAX_QUALITY):
+                first = qualities.index(target) if target in qualities else None
+                found = trajectory.first_day_at(target)
+                if found is not None and found <= HORIZON:
+                    assert found == first
+                else:
+                    assert first is None
+            assert trajectory.total_value(3, 40) == sum(qualities[3:40])
+
+    def test_segments_are_few_and_lazy(self):
+        trajectory = Trajectory.from_item(Item(BACKSTAGE_PASSES, 15, 10))
+        assert "segments" not in vars(trajectory)
+        assert trajectory.segments == (
+            Segment(0, 5, 10, 1),
+            Segment(5, 10, 15, 2),
+            Segment(10, 16, 25, 3),
+            Segment(16, None, 0, 0),
+        )
+
+    def test_first_day_far_beyond_horizon(self):
+        trajectory = Trajectory.from_item(Item("Normal Item", 1000, 50))
+        assert trajectory.first_day_at(MIN_QUALITY) == 50
+        assert trajectory.quality_at(10**9) == MIN_QUALITY
+
+    def test_sulfuras_is_constant(self):
+        trajectory = Trajectory(ItemCategory.SULFURAS, -1, 80)
+        assert trajectory.segments == (Segment(0, None, 80, 0),)
+        assert trajectory.first_day_at(MIN_QUALITY) is None
+        assert trajectory.sell_in_at(100) == -1
+
+    def test_negative_day(self):
+        with pytest.raises(ValueError):
+            Trajectory.from_item(Item("Normal Item", 1, 1)).quality_at(-1)
+
+    def test_items_are_not_modified(self):
+        items = [Item("Normal Item", 5, 10)]
+        forecast(items)[0].quality_at(30)
+        assert repr(items[0]) == "Normal Item, 5, 10"
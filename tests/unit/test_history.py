@@ -0,0 +1,90 @@
+"""Tests para la historia de días con checkpoints."""
+
+import pytest
+
+from gilded_rose import GildedRose, Item
+from gilded_rose.history import InventoryHistory
+from tests.conftest import as_reprs, random_items
+
+
+def recorded_history(seed, size, days, interval):
+    """Historia de `days` días y la serie esperada, simulada por separado."""
+    items = random_items(seed, size)
+    expected = [as_reprs(items)]
+    history = InventoryHistory(GildedRose(items), checkpoint_interval=interval)
+    for _ in range(days):
+        history.tick()
+        expected.append(as_reprs(items))
+    return history, expected
+
+
+class TestTimeTravel:
+    """Cualquier día pasado se restaura igual a como fue."""
+
+    @pytest.mark.parametrize("interval", [1, 7, 30])
+    def test_state_at_every_day(self, interval):
+        history, expected = recorded_history(1, 200, 45, interval)
+
+        assert history.day == 45
+        for day in range(46):
+            assert as_reprs(history.state_at(day)) == expected[day]
+
+    def test_checkpoints_follow_interval(self):
+        history, _ = recorded_history(2, 10, 25, 10)
+        assert history.checkpoint_days == (0, 10, 20)
+
+    def test_day_out_of_range(self):
+        history, _ = recorded_history(3, 10, 5, 2)
+        with pytest.raises(ValueError):
+            history.state_at(6)
+        with pytest.raises(ValueError):
+            history.state_at(-1)
+
+    def test_invalid_interval(self):
+        with pytest.raises(ValueError):
+            InventoryHistory(GildedRose(random_items(1, 1)), checkpoint_interval=0)
+
+
+class TestReplay:
+    """replay recorre los días en orden y restore permite seguir simulando."""
+
+    def test_replay_range(self):
+        history, expected = recorded_history(4, 100, 40, 9)
+        replayed = [(day, as_reprs(items)) for day, items in history.replay(5, 33)]
+        assert replayed == [(day, expected[day]) for day in range(5, 34)]
+
+    def test_restore_and_simulate_forward(self):
+        history, expected = recorded_history(5, 100, 30, 8)
+        gilded_rose = history.restore(12)
+        for _ in range(18):
+            gilded_rose.update_quality()
+        assert as_reprs(gilded_rose.items) == expected[30]
+
+    def test_add_items_midway(self):
+        items = random_items(6, 20)
+        gilded_rose = GildedRose(items)
+        history = InventoryHistory(gilded_rose, checkpoint_interval=10)
+        expected = [as_reprs(items)]
+        for day in range(1, 25):
+            history.tick()
+            if day == 13:
+                history.add_items(random_items(7, 5))
+            expected.append(as_reprs(gilded_rose.items))
+
+        for day in (12, 13, 14, 24):
+            assert as_reprs(history.state_at(day)) == expected[day]
+        replayed = {day: as_reprs(items) for day, items in history.replay(11, 24)}
+        assert all(replayed[day] == expected[day] for day in range(11, 25))
+
+
+class TestMemory:
+    """La memoria crece con los cambios de calidad, no con items por días."""
+
+    def test_settled_inventory_adds_no_deltas(self):
+        items = [Item("Normal Item", -10, 0) for _ in range(1_000)]
+        history = InventoryHistory(GildedRose(items), checkpoint_interval=1_000)
+        initial = history.nbytes()
+        for _ in range(100):
+            history.tick()
+        assert history.nbytes() == initial
+        assert history.state_at(100)[0].sell_in == -110
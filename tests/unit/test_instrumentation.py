@@ -0,0 +1,80 @@
+"""Tests para la instrumentación de update_quality."""
+
+from gilded_rose import GildedRose, Item
+from gilded_rose.categories import ItemCategory
+from gilded_rose.constants import AGED_BRIE, BACKSTAGE_PASSES, SULFURAS
+from gilded_rose.instrumentation import Instrumentation
+
+
+def sample_items():
+    return [
+        Item("Normal Item", 0, 1),  # vence hoy y toca MIN_QUALITY
+        Item("Normal Item", 5, 10),
+        Item(AGED_BRIE, 3, 50),  # toca MAX_QUALITY
+        Item(BACKSTAGE_PASSES, 0, 20),  # vence hoy
+        Item(SULFURAS, 0, 80),
+        Item("Conjured Mana Cake", 3, 1),  # toca MIN_QUALITY
+    ]
+
+
+class TestInstrumentation:
+    """Las métricas reflejan lo ocurrido en cada día."""
+
+    def test_tick_stats(self):
+        gilded_rose = GildedRose(sample_items())
+        instrumentation = gilded_rose.enable_instrumentation()
+        gilded_rose.update_quality()
+
+        tick = instrumentation.last_tick
+        normal = tick.categories[ItemCategory.NORMAL]
+        assert (normal.items, normal.expired, normal.min_clamps) == (2, 1, 1)
+        assert tick.categories[ItemCategory.AGED_BRIE].max_clamps == 1
+        assert tick.categories[ItemCategory.BACKSTAGE_PASSES].expired == 1
+        assert tick.categories[ItemCategory.CONJURED].min_clamps == 1
+        assert tick.categories[ItemCategory.SULFURAS].items == 1
+        assert tick.total.items == 6
+        assert normal.seconds > 0
+
+    def test_results_are_unchanged(self):
+        expected = sample_items()
+        items = sample_items()
+        gilded_rose = GildedRose(items)
+        gilded_rose.enable_instrumentation()
+        for _ in range(20):
+            gilded_rose.update_quality()
+            GildedRose(expected).update_quality()
+
+        assert [repr(item) for item in items] == [repr(item) for item in expected]
+
+    def test_callbacks_and_totals(self):
+        ticks = []
+        gilded_rose = GildedRose(sample_items())
+        instrumentation = gilded_rose.enable_instrumentation(Instrumentation([ticks.append]))
+        gilded_rose.update_quality()
+        gilded_rose.update_quality()
+
+        assert len(ticks) == 2
+        assert instrumentation.totals.ticks == 2
+        assert instrumentation.totals.total.items == 12
+
+    def test_works_with_settled_tracking(self):
+        gilded_rose = GildedRose(sample_items(), track_settled=True)
+        instrumentation = gilded_rose.enable_instrumentation()
+        gilded_rose.update_quality()
+        gilded_rose.update_quality()
+
+        # Aged Brie en 50 quedó asentado desde el inicio
+        assert instrumentation.last_tick.categories[ItemCategory.AGED_BRIE].items == 0
+        assert [repr(item) for item in gilded_rose.items][2] == "Aged Brie, 1, 50"
+
+    def test_disable_removes_hooks(self):
+        gilded_rose = GildedRose(sample_items())
+        instrumentation = gilded_rose.enable_instrumentation()
+        instrumentation.add_callback(lambda tick: None)
+        gilded_rose.update_quality()
+        gilded_rose.disable_instrumentation()
+        gilded_rose.update_quality()
+
+        assert gilded_rose.instrumentation is None
+        assert instrumentation.totals.ticks == 1
+        assert "_decrease_quality_safe" not in vars(gilded_rose)
@@ -0,0 +1,106 @@
+"""Tests para el motor por eventos."""
+
+import pytest
+
+from gilded_rose import GildedRose, Item
+from gilded_rose.constants import AGED_BRIE, BACKSTAGE_PASSES, SULFURAS
+from gilded_rose.lazy_engine import LazyGildedRose
+from tests.conftest import as_tuples, random_items
+
+
+class TestEquivalence:
+    """El motor por eventos reproduce a GildedRose día por día."""
+
+    def test_every_day_matches_gilded_rose(self):
+        items = random_items(1, 500)
+        engine = LazyGildedRose(items)
+        gilded_rose = GildedRose(items)
+        for _ in range(60):
+            engine.tick()
+            gilded_rose.update_quality()
+            assert as_tuples(engine) == as_tuples(items)
+
+    def test_advance_many_days_at_once(self):
+        items = random_items(2, 300)
+        engine = LazyGildedRose(items)
+        engine.advance(17)
+        engine.advance(0)
+        engine.advance(30)
+        GildedRose(items).advance(47)
+        assert as_tuples(engine.to_items()) == as_tuples(items)
+
+    def test_add_items_midway(self):
+        items = random_items(3, 50)
+        engine = LazyGildedRose(items)
+        gilded_rose = GildedRose(items)
+        for day in range(30):
+            if day == 11:
+                extra = random_items(4, 20)
+                engine.add_items(extra)
+                gilded_rose.add_items(extra)
+            engine.tick()
+            gilded_rose.update_quality()
+        assert as_tuples(engine) == as_tuples(gilded_rose.items)
+
+    def test_sync_items(self):
+        items = random_items(5, 20)
+        expected = [Item(item.name, item.sell_in, item.quality) for item in items]
+        engine = LazyGildedRose(items)
+        engine.advance(9)
+        GildedRose(expected).advance(9)
+
+        engine.sync_items(items)
+
+        assert as_tuples(items) == as_tuples(expected)
+        with pytest.raises(ValueError):
+            engine.sync_items(items[:-1])
+
+
+class TestEvents:
+    """Avanzar un día sólo procesa los eventos de ese día."""
+
+    def test_settled_items_have_no_events(self):
+        items = [Item("Normal Item", -3, 0), Item(SULFURAS, 0, 80), Item(AGED_BRIE, -1, 50)]
+        engine = LazyGildedRose(items)
+
+        assert engine.pending_events == 0
+        assert sum(engine.tick() for _ in range(100)) == 0
+        assert as_tuples(engine) == [
+            ("Normal Item", -103, 0),
+            (SULFURAS, 0, 80),
+            (AGED_BRIE, -101, 50),
+        ]
+
+    def test_backstage_events_at_thresholds(self):
+        engine = LazyGildedRose([Item(BACKSTAGE_PASSES, 12, 10)])
+        event_days = [day for day in range(1, 20) if engine.tick()]
+
+        # Tramos de +2 desde el día 2, de +3 desde el día 7 y 0 tras el concierto.
+        assert event_days == [2, 7, 13]
+        assert engine.events_processed == 3
+        assert engine[0].quality == 0
+
+    def test_events_bounded_by_segments_not_days(self):
+        engine = LazyGildedRose(random_items(6, 1_000))
+        for _ in range(365):
+            engine.tick()
+        assert engine.events_processed < 1_000 * 5
+
+
+class TestAccess:
+    """Lecturas y validación."""
+
+    def test_indexing(self):
+        engine = LazyGildedRose([Item("a", 1, 2), Item("b", 3, 4)])
+        assert repr(engine[-1]) == repr(Item("b", 3, 4))
+        assert len(engine) == 2
+        with pytest.raises(IndexError):
+            engine[2]
+
+    def test_rejects_non_items(self):
+        with pytest.raises(TypeError):
+            LazyGildedRose(["no es un item"])
+
+    def test_rejects_negative_days(self):
+        with pytest.raises(ValueError):
+            LazyGildedRose().advance(-1)
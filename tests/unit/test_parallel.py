@@ -0,0 +1,67 @@
+"""Tests para la actualización en paralelo sobre memoria compartida."""
+
+import gc
+from multiprocessing import shared_memory
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from gilded_rose import GildedRose  # noqa: E402
+from gilded_rose.parallel import ParallelGildedRose  # noqa: E402
+from tests.conftest import as_tuples, random_items
+
+
+class TestParallelGildedRose:
+    """El motor paralelo reproduce a GildedRose."""
+
+    def test_matches_gilded_rose(self):
+        items = random_items(3, 2000)
+        expected = random_items(3, 2000)
+        gilded_rose = GildedRose(expected)
+
+        with ParallelGildedRose(items, workers=2, chunk_size=97) as engine:
+            for _ in range(25):
+                engine.update_quality()
+                gilded_rose.update_quality()
+            engine.sync_items(items)
+            exported = engine.to_items()
+
+        assert as_tuples(items) == as_tuples(expected)
+        assert as_tuples(exported) == as_tuples(expected)
+
+    def test_close_keeps_columns_readable(self):
+        engine = ParallelGildedRose(random_items(1, 10), workers=1)
+        engine.update_quality()
+        engine.close()
+        engine.close()
+
+        assert len(engine.to_items()) == len(engine) == 10
+
+    def test_unclosed_engine_releases_shared_memory(self):
+        engine = ParallelGildedRose(random_items(2, 10), workers=1)
+        names = [block.name for block in engine._blocks]
+        del engine
+        gc.collect()
+
+        for name in names:
+            with pytest.raises(FileNotFoundError):
+                shared_memory.SharedMemory(name=name)
+
+    def test_close_releases_shared_memory(self):
+        with ParallelGildedRose(random_items(3, 10), workers=1) as engine:
+            names = [block.name for block in engine._blocks]
+        for name in names:
+            with pytest.raises(FileNotFoundError):
+                shared_memory.SharedMemory(name=name)
+
+    def test_rejects_empty_items(self):
+        with pytest.raises(ValueError, match="no pueden ser vacíos"):
+            ParallelGildedRose([])
+
+    @pytest.mark.parametrize(
+        "options", [{"chunk_size": -1}, {"chunk_size": 0}, {"workers": 0}, {"workers": -2}]
+    )
+    def test_rejects_invalid_options(self, options):
+        with pytest.raises(ValueError, match="deben ser positivos"):
+            ParallelGildedRose(random_items(1, 10), **options)
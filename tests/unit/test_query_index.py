@@ -0,0 +1,129 @@
+"""Tests para el índice de consultas por vencimiento y calidad."""
+
+import pytest
+
+from gilded_rose import GildedRose, Item
+from gilded_rose.categories import ItemCategory, classify
+from gilded_rose.constants import AGED_BRIE, BACKSTAGE_PASSES, SULFURAS
+from gilded_rose.query_index import QueryIndex
+from tests.conftest import random_items
+
+
+def ids(items):
+    return sorted(id(item) for item in items)
+
+
+def scan_expiring(items, days):
+    return [
+        item
+        for item in items
+        if classify(item.name) is not ItemCategory.SULFURAS and 0 <= item.sell_in < days
+    ]
+
+
+class TestQueries:
+    """Las consultas coinciden con un recorrido completo en cada día."""
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_matches_full_scan(self, seed):
+        items = random_items(seed, 300)
+        index = QueryIndex(GildedRose(items))
+        for _ in range(25):
+            for days in (1, 3, 10):
+                assert ids(index.expiring_within(days)) == ids(scan_expiring(items, days))
+            for quality in (1, 10, 49, 51):
+                expected = [item for item in items if item.quality < quality]
+                assert ids(index.quality_below(quality)) == ids(expected)
+            expected = [item for item in items if 10 <= item.quality < 20]
+            assert ids(index.quality_between(10, 20)) == ids(expected)
+            expected = [
+                item for item in items if item.name == BACKSTAGE_PASSES and item.sell_in == 6
+            ]
+            assert ids(index.backstage_entering_window()) == ids(expected)
+            index.tick()
+
+        assert index.day == 25
+
+    def test_results_are_ordered(self):
+        items = [Item("Normal Item", 2, 30), Item("Normal Item", 0, 10), Item(AGED_BRIE, 1, 20)]
+        index = QueryIndex(GildedRose(items))
+
+        assert [item.sell_in for item in index.expiring_within(5)] == [0, 1, 2]
+        assert [item.quality for item in index.quality_below(50)] == [10, 20, 30]
+
+    def test_equal_quality_items_are_grouped(self):
+        items = [Item("Normal Item", 5, 7) for _ in range(5)] + [Item(AGED_BRIE, 5, 3)]
+        index = QueryIndex(GildedRose(items))
+        index.tick()
+
+        result = index.quality_between(0, 50)
+        assert result[0] is items[5]
+        assert ids(result[1:]) == ids(items[:5])
+
+    def test_sulfuras_never_expires(self):
+        index = QueryIndex(GildedRose([Item(SULFURAS, 0, 80)]))
+        assert index.expiring_within(10) == []
+        assert len(index.quality_below(81)) == 1
+
+
+class TestMaintenance:
+    """El índice se mantiene al agregar items y puede reconstruirse."""
+
+    def test_add_items_after_ticks(self):
+        items = random_items(1, 50)
+        gilded_rose = GildedRose(items)
+        index = QueryIndex(gilded_rose)
+        index.tick()
+        index.tick()
+        index.add_items(random_items(2, 20))
+        for _ in range(5):
+            index.tick()
+
+        all_items = gilded_rose.items
+        assert len(all_items) == 70
+        assert ids(index.expiring_within(4)) == ids(scan_expiring(all_items, 4))
+        assert ids(index.quality_below(25)) == ids(
+            [item for item in all_items if item.quality < 25]
+        )
+
+    def test_rebuild_after_external_changes(self):
+        items = [Item("Normal Item", 10, 30)]
+        index = QueryIndex(GildedRose(items))
+        items[0].sell_in = 1
+        index.rebuild()
+
+        assert index.expiring_within(2) == items
+        assert index.day == 0
+
+    def test_tick_returns_quality_changes(self):
+        index = QueryIndex(GildedRose([Item("Normal Item", 5, 0), Item(AGED_BRIE, 5, 10)]))
+        changes = index.tick()
+        assert [change.index for change in changes] == [1]
+
+    def test_remove_items(self):
+        items = random_items(3, 60)
+        gilded_rose = GildedRose(items)
+        index = QueryIndex(gilded_rose)
+        index.tick()
+        index.remove_items(items[::3])
+        for _ in range(4):
+            index.tick()
+
+        assert len(items) == 40
+        assert ids(index.expiring_within(5)) == ids(scan_expiring(items, 5))
+        assert ids(index.quality_between(5, 30)) == ids(
+            [item for item in items if 5 <= item.quality < 30]
+        )
+
+    def test_detects_removal_outside_index(self):
+        items = random_items(4, 10)
+        gilded_rose = GildedRose(items)
+        index = QueryIndex(gilded_rose)
+        gilded_rose.remove_items(items[:2])
+
+        with pytest.raises(RuntimeError, match="rebuild"):
+            index.tick()
+        with pytest.raises(RuntimeError, match="rebuild"):
+            index.quality_below(51)
+        index.rebuild()
+        assert len(index.quality_below(81)) == 8
@@ -0,0 +1,63 @@
+"""Tests para el compilador de reglas a tablas de transición."""
+
+import pytest
+
+from gilded_rose import GildedRose, Item
+from gilded_rose.categories import ItemCategory, classify
+from gilded_rose.rule_tables import (
+    DEFAULT_RULES,
+    AgingRule,
+    TableDrivenGildedRose,
+    compile_rule,
+)
+from tests.conftest import as_tuples, random_items
+
+
+class TestCompiledRules:
+    """Las tablas reproducen la regla en todo el dominio."""
+
+    @pytest.mark.parametrize("category", list(ItemCategory))
+    def test_table_matches_rule(self, category):
+        rule = DEFAULT_RULES[category]
+        compiled = compile_rule(rule)
+        for sell_in in range(-20, 30):
+            for quality in range(-3, 83):
+                assert compiled.next_quality(sell_in, quality) == rule.step(sell_in, quality)[1]
+
+    def test_backstage_table_bounds(self):
+        compiled = compile_rule(DEFAULT_RULES[ItemCategory.BACKSTAGE_PASSES])
+        assert (compiled.low, compiled.high) == (0, 11)
+        assert len(compiled.table) == 12 * 51
+
+
+class TestTableDrivenGildedRose:
+    """El motor por tablas equivale a GildedRose."""
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_matches_gilded_rose(self, seed):
+        expected = random_items(seed, 300)
+        items = random_items(seed, 300)
+        gilded_rose = GildedRose(expected)
+        engine = TableDrivenGildedRose(items)
+
+        for _ in range(40):
+            gilded_rose.update_quality()
+            engine.update_quality()
+        assert as_tuples(items) == as_tuples(expected)
+
+    def test_new_item_type_is_data(self):
+        rules = {**DEFAULT_RULES, "wine": AgingRule(2, 1)}
+
+        def classifier(name):
+            return "wine" if name.startswith("Wine") else classify(name)
+
+        wine = Item("Wine of Ages", 1, 10)
+        engine = TableDrivenGildedRose([wine, Item("Normal Item", 1, 10)], rules, classifier)
+        engine.update_quality()
+        engine.update_quality()
+
+        assert (wine.sell_in, wine.quality) == (-1, 15)
+
+    def test_unknown_category_raises_error(self):
+        with pytest.raises(KeyError, match="No hay regla"):
+            TableDrivenGildedRose([Item("Normal Item", 1, 1)], {}, classify)
@@ -0,0 +1,145 @@
+"""Tests para los escenarios sobre parámetros de las reglas."""
+
+import pytest
+
+from gilded_rose import GildedRose, Item
+from gilded_rose.categories import ItemCategory, classify
+from gilded_rose.closed_form import advance_state
+from gilded_rose.parameters import DEFAULT_PARAMETERS, RuleParameters
+from gilded_rose.scenarios import run_scenarios
+from tests.conftest import random_items
+
+SCENARIOS = {
+    "base": {},
+    "conjured_x3": {"conjured_daily_decrement": 3, "conjured_expired_decrement": 3},
+    "max_60": {"max_quality": 60},
+    "early_backstage": {"backstage_first_threshold": 15, "backstage_second_threshold": 8},
+}
+
+
+def step(category, sell_in, quality, params):
+    """Un día de las reglas parametrizadas, escrito de forma directa."""
+    if category is ItemCategory.SULFURAS:
+        return sell_in, quality
+    if category is ItemCategory.BACKSTAGE_PASSES:
+        if sell_in < params.backstage_second_threshold:
+            increment = params.backstage_near_increment
+        elif sell_in < params.backstage_first_threshold:
+            increment = params.backstage_medium_increment
+        else:
+            increment = params.backstage_far_increment
+        quality = min(params.max_quality, quality + increment)
+        sell_in -= 1
+        return sell_in, params.backstage_expired_quality if sell_in < 0 else quality
+    sell_in -= 1
+    if category is ItemCategory.AGED_BRIE:
+        increment = params.aged_brie_increment
+        if sell_in < 0:
+            increment += params.aged_brie_expired_increment
+        return sell_in, min(params.max_quality, quality + increment)
+    if category is ItemCategory.CONJURED:
+        daily, expired = params.conjured_daily_decrement, params.conjured_expired_decrement
+    else:
+        daily, expired = params.normal_daily_decrement, params.normal_expired_decrement
+    decrement = daily + (expired if sell_in < 0 else 0)
+    return sell_in, max(params.min_quality, quality - decrement)
+
+
+def reference_summary(items, params, days):
+    states = []
+    for item in items:
+        category = classify(item.name)
+        sell_in, quality = item.sell_in, item.quality
+        for _ in range(days):
+            sell_in, quality = step(category, sell_in, quality, params)
+        states.append((category, sell_in, quality))
+    by_category = {}
+    for category, _, quality in states:
+        by_category[category] = by_category.get(category, 0) + quality
+    return {
+        "items": len(states),
+        "total_quality": sum(quality for _, _, quality in states),
+        "expired": sum(sell_in < 0 for _, sell_in, _ in states),
+        "at_min_quality": sum(quality <= params.min_quality for _, _, quality in states),
+        "at_max_quality": sum(quality >= params.max_quality for _, _, quality in states),
+        "quality_by_category": by_category,
+    }
+
+
+def as_dict(summary):
+    return {
+        "items": summary.items,
+        "total_quality": summary.total_quality,
+        "expired": summary.expired,
+        "at_min_quality": summary.at_min_quality,
+        "at_max_quality": summary.at_max_quality,
+        "quality_by_category": summary.quality_by_category,
+    }
+
+
+class TestParameterizedClosedForm:
+    """La forma cerrada con parámetros coincide con la simulación día a día."""
+
+    @pytest.mark.parametrize("scenario", list(SCENARIOS))
+    def test_matches_step_by_step(self, scenario):
+        params = DEFAULT_PARAMETERS.with_overrides(**SCENARIOS[scenario])
+        for item in random_items(1, 300):
+            category = classify(item.name)
+            sell_in, quality = item.sell_in, item.quality
+            for days in range(1, 25):
+                sell_in, quality = step(category, sell_in, quality, params)
+                assert advance_state(category, item.sell_in, item.quality, days, params) == (
+                    sell_in,
+                    quality,
+                )
+
+
+class TestRunScenarios:
+    """run_scenarios devuelve los agregados de cada escenario."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_matches_reference(self, workers):
+        items = random_items(2, 1_000)
+        summaries = run_scenarios(items, SCENARIOS, days=30, workers=workers, chunk_size=128)
+
+        assert list(summaries) == list(SCENARIOS)
+        for name, overrides in SCENARIOS.items():
+            params = DEFAULT_PARAMETERS.with_overrides(**overrides)
+            assert summaries[name].parameters == params
+            assert as_dict(summaries[name]) == reference_summary(items, params, 30)
+
+    def test_default_scenario_matches_gilded_rose(self):
+        items = random_items(3, 500)
+        summary = run_scenarios(items, {"base": DEFAULT_PARAMETERS}, days=40, workers=1)["base"]
+
+        copies = [Item(item.name, item.sell_in, item.quality) for item in items]
+        gilded_rose = GildedRose(copies)
+        for _ in range(40):
+            gilded_rose.update_quality()
+        assert summary.total_quality == sum(item.quality for item in copies)
+        assert summary.mean_quality == summary.total_quality / 500
+
+    def test_base_inventory_is_not_modified(self):
+        items = random_items(4, 50)
+        before = [repr(item) for item in items]
+        run_scenarios(items, SCENARIOS, days=10, workers=2, chunk_size=7)
+        assert [repr(item) for item in items] == before
+
+    def test_empty_inventory(self):
+        summary = run_scenarios([], {"base": {}}, days=5, workers=1)["base"]
+        assert summary.items == 0
+        assert summary.mean_quality == 0.0
+
+    def test_rejects_unknown_parameter(self):
+        with pytest.raises(ValueError, match="desconocidos"):
+            run_scenarios(random_items(5, 5), {"typo": {"max_qualty": 60}}, days=1)
+
+    def test_rejects_inconsistent_parameters(self):
+        with pytest.raises(ValueError):
+            RuleParameters(min_quality=10, max_quality=5)
+        with pytest.raises(ValueError):
+            DEFAULT_PARAMETERS.with_overrides(backstage_second_threshold=20)
+
+    def test_rejects_negative_days(self):
+        with pytest.raises(ValueError, match="negativa"):
+            run_scenarios(random_items(6, 5), SCENARIOS, days=-1)
@@ -0,0 +1,64 @@
+"""Tests para el seguimiento de items asentados (puntos fijos)."""
+
+import pytest
+
+from gilded_rose import GildedRose, Item
+from gilded_rose.constants import AGED_BRIE, BACKSTAGE_PASSES
+from tests.conftest import as_tuples, random_items
+
+
+class TestSettledTracking:
+    """track_settled=True da los mismos resultados que el recorrido completo."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_plain_engine(self, seed):
+        plain = GildedRose(random_items(seed, 200))
+        tracked = GildedRose(random_items(seed, 200), track_settled=True)
+
+        for day in range(40):
+            plain.update_quality()
+            tracked.update_quality()
+            if day % 7 == 0:
+                assert as_tuples(tracked.items) == as_tuples(plain.items)
+        assert as_tuples(tracked.items) == as_tuples(plain.items)
+
+    def test_settled_items_leave_the_daily_loop(self):
+        items = [
+            Item("Normal Item", -3, 0),
+            Item(AGED_BRIE, 2, 50),
+            Item(BACKSTAGE_PASSES, -1, 0),
+            Item("Conjured Mana Cake", 5, 1),
+        ]
+        gilded_rose = GildedRose(items, track_settled=True)
+        assert gilded_rose.settled_count == 3
+
+        gilded_rose.update_quality()
+        assert gilded_rose.settled_count == 4
+
+    def test_sell_in_is_materialized_on_read(self):
+        item = Item("Normal Item", -3, 0)
+        gilded_rose = GildedRose([item], track_settled=True)
+        for _ in range(10):
+            gilded_rose.update_quality()
+
+        assert item.sell_in == -3  # todavía no se leyó
+        assert gilded_rose.items[0].sell_in == -13
+
+    def test_advance_with_settled_items(self):
+        plain = GildedRose(random_items(7, 100))
+        tracked = GildedRose(random_items(7, 100), track_settled=True)
+        for gilded_rose in (plain, tracked):
+            gilded_rose.update_quality()
+            gilded_rose.advance(20)
+            gilded_rose.update_quality()
+
+        assert as_tuples(tracked.items) == as_tuples(plain.items)
+
+    def test_add_items_while_tracking(self):
+        gilded_rose = GildedRose([Item("Normal Item", 0, 0)], track_settled=True)
+        gilded_rose.update_quality()
+        brie = Item(AGED_BRIE, 0, 50)
+        gilded_rose.add_items([brie])
+        gilded_rose.update_quality()
+
+        assert as_tuples(gilded_rose.items) == [("Normal Item", -2, 0), (AGED_BRIE, -1, 50)]
@@ -0,0 +1,71 @@
+"""Tests para el registro de estrategias de GildedRoseRefactored."""
+
+from gilded_rose.constants import AGED_BRIE, BACKSTAGE_PASSES, SULFURAS
+from gilded_rose.models import Item
+from gilded_rose_sp_in_progress import (
+    AgedBrieStrategy,
+    ConjuredItemStrategy,
+    GildedRoseRefactored,
+    ItemStrategyFactory,
+    NormalItemStrategy,
+    StrategyRegistry,
+    SulfurasStrategy,
+    default_registry,
+)
+
+
+class TestStrategyRegistry:
+    """Resolución por nombre exacto, por prefijo y por defecto."""
+
+    def test_exact_names(self):
+        registry = default_registry()
+        assert isinstance(registry.resolve(SULFURAS), SulfurasStrategy)
+        assert isinstance(registry.resolve(AGED_BRIE), AgedBrieStrategy)
+
+    def test_conjured_prefix_is_case_insensitive(self):
+        registry = default_registry()
+        assert isinstance(registry.resolve("Conjured Mana Cake"), ConjuredItemStrategy)
+        assert isinstance(registry.resolve("CONJURED sword"), ConjuredItemStrategy)
+
+    def test_longest_prefix_wins(self):
+        short, long = NormalItemStrategy(), SulfurasStrategy()
+        registry = StrategyRegistry(NormalItemStrategy())
+        registry.register_prefix("con", short)
+        registry.register_prefix("conjured", long)
+
+        assert registry.resolve("Conjured Cake") is long
+        assert registry.resolve("Cone") is short
+        assert registry.resolve("Other") is registry.default
+
+    def test_strategies_are_singletons(self):
+        first = ItemStrategyFactory.get_strategy("Some Item")
+        second = ItemStrategyFactory.get_strategy("Another Item")
+        assert first is second
+
+    def test_memo_is_bounded(self):
+        registry = StrategyRegistry(NormalItemStrategy(), memo_size=2)
+        for name in ("a", "b", "c"):
+            registry.resolve(name)
+        assert list(registry._memo) == ["b", "c"]
+
+
+class TestGildedRoseRefactored:
+    """GildedRoseRefactored usa las estrategias resueltas una sola vez."""
+
+    def test_conjured_items(self):
+        item = Item("Conjured Mana Cake", 0, 10)
+        GildedRoseRefactored([item]).update_quality()
+        assert (item.sell_in, item.quality) == (-1, 6)
+
+    def test_backstage_and_sulfuras(self):
+        items = [Item(BACKSTAGE_PASSES, 5, 20), Item(SULFURAS, 0, 80)]
+        GildedRoseRefactored(items).update_quality()
+        assert [(item.sell_in, item.quality) for item in items] == [(4, 23), (0, 80)]
+
+    def test_refresh_strategies_after_rename(self):
+        item = Item("Normal Item", 5, 10)
+        gilded_rose = GildedRoseRefactored([item])
+        item.name = AGED_BRIE
+        gilded_rose.refresh_strategies()
+        gilded_rose.update_quality()
+        assert item.quality == 11
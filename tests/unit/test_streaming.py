@@ -0,0 +1,159 @@
+"""Tests para el procesamiento en streaming de inventarios."""
+
+import io
+
+import pytest
+
+from gilded_rose import GildedRose, Item
+from gilded_rose.constants import AGED_BRIE, BACKSTAGE_PASSES, SULFURAS
+from gilded_rose.streaming import (
+    CSV_FORMAT,
+    JSONL_FORMAT,
+    StreamStats,
+    advance_file,
+    advance_stream,
+    detect_format,
+    read_items,
+    write_items,
+)
+from scripts.stream_inventory import main
+from tests.conftest import as_tuples
+
+
+def sample_items():
+    return [
+        Item("+5 Dexterity Vest", 10, 20),
+        Item(AGED_BRIE, 2, 0),
+        Item(SULFURAS, 0, 80),
+        Item(BACKSTAGE_PASSES, 15, 20),
+        Item("Conjured, Mana Cake", 3, 6),
+    ]
+
+
+class TestReadWrite:
+    """Los formatos CSV y JSONL conservan los items sin pérdida."""
+
+    @pytest.mark.parametrize("fmt", [CSV_FORMAT, JSONL_FORMAT])
+    def test_round_trip(self, fmt):
+        buffer = io.StringIO()
+        write_items(sample_items(), buffer, fmt)
+        buffer.seek(0)
+
+        assert as_tuples(read_items(buffer, fmt)) == as_tuples(sample_items())
+
+    def test_invalid_csv_header(self):
+        with pytest.raises(ValueError, match="Encabezado CSV inválido"):
+            list(read_items(io.StringIO("a,b,c\n"), CSV_FORMAT))
+
+    def test_csv_skips_blank_lines(self):
+        stream = io.StringIO("name,sell_in,quality\n\nfoo,1,2\n\n")
+        assert as_tuples(read_items(stream, CSV_FORMAT)) == [("foo", 1, 2)]
+
+    @pytest.mark.parametrize("row", ["foo,1", "foo,1,2,3"])
+    def test_csv_wrong_field_count_reports_line(self, row):
+        stream = io.StringIO(f"name,sell_in,quality\nbar,0,0\n{row}\n")
+        with pytest.raises(ValueError, match="línea 3"):
+            list(read_items(stream, CSV_FORMAT))
+
+    def test_csv_invalid_number_reports_line(self):
+        stream = io.StringIO("name,sell_in,quality\nbar,0,0\nfoo,uno,2\n")
+        with pytest.raises(ValueError, match="línea 3.*uno"):
+            list(read_items(stream, CSV_FORMAT))
+
+    @pytest.mark.parametrize(
+        ("record", "message"),
+        [
+            ('{"name": "foo", "quality": 2}', "falta el campo 'sell_in'"),
+            ('{"name": "foo", "sell_in": "x", "quality": 2}', "invalid literal"),
+            ('{"name": "foo", "sell_in": 1', "Expecting"),
+            ("[1, 2, 3]", "línea 4"),
+        ],
+    )
+    def test_jsonl_errors_report_file_line(self, record, message):
+        valid = '{"name": "bar", "sell_in": 0, "quality": 0}'
+        stream = io.StringIO(f"{valid}\n\n{valid}\n{record}\n")
+        with pytest.raises(ValueError, match="línea 4") as error:
+            list(read_items(stream, JSONL_FORMAT))
+        assert message in str(error.value)
+
+    @pytest.mark.parametrize(
+        ("path", "fmt"),
+        [("x.csv", CSV_FORMAT), ("x.JSONL", JSONL_FORMAT), ("x.json", JSONL_FORMAT)],
+    )
+    def test_detect_format(self, path, fmt):
+        assert detect_format(path) == fmt
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError, match="Formato no soportado"):
+            detect_format("inventario.xml")
+        with pytest.raises(ValueError, match="Formato no soportado"):
+            list(read_items(io.StringIO(""), "xml"))
+        with pytest.raises(ValueError, match="Formato no soportado"):
+            write_items([], io.StringIO(), "xml")
+
+
+class TestAdvanceStream:
+    """advance_stream procesa por lotes y equivale a GildedRose.advance."""
+
+    def test_matches_gilded_rose(self):
+        expected = sample_items()
+        GildedRose(expected).advance(7)
+        stats = StreamStats()
+
+        result = list(advance_stream(sample_items(), 7, batch_size=2, stats=stats))
+
+        assert as_tuples(result) == as_tuples(expected)
+        assert (stats.rows, stats.batches) == (5, 3)
+        assert stats.finished_at is not None
+        assert stats.rows_per_second > 0
+
+    def test_consumes_input_lazily(self):
+        source = iter(sample_items())
+        stream = advance_stream(source, 1, batch_size=2)
+        next(stream)
+
+        assert len(list(source)) == 3
+
+    def test_rejects_invalid_batch_size(self):
+        with pytest.raises(ValueError, match="lote debe ser positivo"):
+            list(advance_stream(sample_items(), 1, batch_size=0))
+
+
+class TestAdvanceFile:
+    """advance_file y el CLI convierten entre archivos."""
+
+    def test_csv_to_jsonl(self, tmp_path):
+        source = tmp_path / "inventario.csv"
+        target = tmp_path / "inventario.jsonl"
+        with open(source, "w", encoding="utf-8", newline="") as stream:
+            write_items(sample_items(), stream, CSV_FORMAT)
+
+        stats = advance_file(source, target, 3, batch_size=2)
+
+        expected = sample_items()
+        GildedRose(expected).advance(3)
+        with open(target, encoding="utf-8") as stream:
+            assert as_tuples(read_items(stream, JSONL_FORMAT)) == as_tuples(expected)
+        assert stats.rows == 5
+
+    def test_invalid_days_keep_target(self, tmp_path):
+        source = tmp_path / "inventario.csv"
+        target = tmp_path / "salida.csv"
+        with open(source, "w", encoding="utf-8", newline="") as stream:
+            write_items(sample_items(), stream, CSV_FORMAT)
+        target.write_text("previo", encoding="utf-8")
+
+        with pytest.raises(ValueError, match="negativos"):
+            advance_file(source, target, -1)
+        assert target.read_text(encoding="utf-8") == "previo"
+
+    def test_cli_reports_throughput(self, tmp_path, capsys):
+        source = tmp_path / "inventario.jsonl"
+        target = tmp_path / "salida.csv"
+        with open(source, "w", encoding="utf-8") as stream:
+            write_items(sample_items(), stream, JSONL_FORMAT)
+
+        main([str(source), str(target), "--days", "2"])
+
+        assert "5 filas" in capsys.readouterr().err
+        assert target.read_text(encoding="utf-8").startswith("name,sell_in,quality\n")
@@ -0,0 +1,149 @@
+"""Tests para el avance en lote de muchos inventarios."""
+
+import asyncio
+
+import pytest
+
+from gilded_rose import GildedRose, Item, ValidatedItems
+from gilded_rose.constants import AGED_BRIE
+from gilded_rose.tenants import TenantBatch
+from tests.conftest import as_reprs, random_items
+
+
+def expected_after(items, days):
+    expected = [Item(item.name, item.sell_in, item.quality) for item in items]
+    for _ in range(days if expected else 0):
+        GildedRose(expected).update_quality()
+    return as_reprs(expected)
+
+
+class TestTick:
+    """tick avanza cada inventario igual que un GildedRose propio."""
+
+    def test_many_tenants(self):
+        shops = {f"shop-{index}": random_items(index, index % 7) for index in range(50)}
+        expected = {shop: expected_after(items, 12) for shop, items in shops.items()}
+        batch = TenantBatch()
+        for shop, items in shops.items():
+            batch.register(shop, items)
+        batch.tick()
+        batch.tick(11)
+
+        for shop, items in shops.items():
+            assert as_reprs(items) == expected[shop]
+            assert as_reprs(batch.items(shop)) == expected[shop]
+
+    def test_negative_days(self):
+        with pytest.raises(ValueError):
+            TenantBatch().tick(-1)
+
+    def test_rejects_non_items(self):
+        with pytest.raises(TypeError):
+            TenantBatch().register("shop", [Item("Normal Item", 1, 1), object()])
+
+    def test_validated_items_are_shared(self):
+        items = ValidatedItems(random_items(1, 3))
+        batch = TenantBatch()
+        batch.register("shop", items)
+        assert all(a is b for a, b in zip(batch.items("shop"), items, strict=True))
+
+    def test_registered_list_changes_do_not_break_tick(self):
+        items = ValidatedItems(random_items(2, 3))
+        expected = expected_after(items, 1)
+        batch = TenantBatch()
+        batch.register("shop", items)
+        items.append(Item("Normal Item", 1, 1))
+        batch.tick()
+
+        assert as_reprs(batch.items("shop")) == expected
+        with pytest.raises(AttributeError):
+            batch.items("shop").append(Item("Normal Item", 1, 1))
+
+
+class TestRegistration:
+    """Los inventarios se agregan, reemplazan y quitan entre ticks."""
+
+    def test_add_and_remove_between_ticks(self):
+        first, second, third = random_items(1, 5), random_items(2, 5), random_items(3, 5)
+        expected_first = expected_after(first, 3)
+        expected_third = expected_after(third, 2)
+        batch = TenantBatch()
+        batch.register("a", first)
+        batch.register("b", second)
+        batch.tick()
+
+        removed = batch.remove("b")
+        snapshot = as_reprs(removed)
+        batch.register("c", third)
+        batch.tick(2)
+
+        assert batch.tenants == ["a", "c"]
+        assert len(batch) == 2 and "b" not in batch
+        assert batch.row_count == 10
+        assert as_reprs(first) == expected_first
+        assert as_reprs(third) == expected_third
+        assert as_reprs(removed) == snapshot
+
+    def test_reregister_replaces(self):
+        batch = TenantBatch()
+        batch.register("a", [Item("Normal Item", 5, 10)])
+        batch.tick()
+        replacement = [Item(AGED_BRIE, 5, 10)]
+        batch.register("a", replacement)
+        batch.tick()
+
+        assert as_reprs(batch.items("a")) == ["Aged Brie, 4, 11"]
+
+
+class TestTickAll:
+    """tick_all da el mismo resultado y cede el control entre tramos."""
+
+    def test_matches_tick_and_yields(self):
+        shops = {index: random_items(index, 10) for index in range(20)}
+        expected = {shop: expected_after(items, 4) for shop, items in shops.items()}
+        batch = TenantBatch(chunk_rows=25)
+        for shop, items in shops.items():
+            batch.register(shop, items)
+        switches = []
+
+        async def other_task():
+            while True:
+                switches.append(1)
+                await asyncio.sleep(0)
+
+        async def main():
+            task = asyncio.create_task(other_task())
+            await batch.tick_all(4)
+            task.cancel()
+
+        asyncio.run(main())
+
+        for shop, items in shops.items():
+            assert as_reprs(items) == expected[shop]
+        assert len(switches) >= 5
+
+    def test_modifying_during_tick_all_fails(self):
+        batch = TenantBatch(chunk_rows=1)
+        batch.register("a", random_items(1, 2))
+        batch.register("b", random_items(2, 2))
+        errors = []
+
+        async def intruder():
+            try:
+                batch.register("c", [])
+            except RuntimeError as error:
+                errors.append(error)
+
+        async def main():
+            task = asyncio.create_task(batch.tick_all())
+            await asyncio.sleep(0)
+            await intruder()
+            await task
+
+        asyncio.run(main())
+        assert len(errors) == 1
+        assert "c" not in batch
+
+    def test_invalid_chunk_rows(self):
+        with pytest.raises(ValueError):
+            TenantBatch(chunk_rows=0)
@@ -1,7 +1,7 @@
 # tests/unit/test_validation.py
 import pytest
 
-from gilded_rose import GildedRose
+from gilded_rose import GildedRose, ValidatedItems
 from gilded_rose.models import Item
 
 
@@ -17,3 +17,79 @@ class TestValidation:
         """Verificar que items no-Item lanzan TypeError."""
         with pytest.raises(TypeError, match="deben ser instancias de Item"):
             GildedRose([Item("Valid", 10, 10), "invalid"])  # String no es Item
+
+
+class TestTrustedConstruction:
+    """Construcción sin volver a validar cada item."""
+
+    def test_trusted_skips_type_checks(self):
+        gilded_rose = GildedRose([Item("Valid", 10, 10)], trusted=True)
+        assert len(gilded_rose.items) == 1
+
+    def test_trusted_still_rejects_empty(self):
+        with pytest.raises(ValueError, match="no pueden ser vacíos"):
+            GildedRose([], trusted=True)
+
+    def test_from_columns(self):
+        gilded_rose = GildedRose.from_columns(["Aged Brie", "Normal"], [5, 5], [10, 10])
+        gilded_rose.update_quality()
+
+        assert [repr(item) for item in gilded_rose.items] == ["Aged Brie, 4, 11", "Normal, 4, 9"]
+        assert isinstance(gilded_rose.items, ValidatedItems)
+
+    def test_from_columns_rejects_mismatched_columns(self):
+        with pytest.raises(ValueError, match="misma longitud"):
+            GildedRose.from_columns(["a"], [1, 2], [1])
+
+
+class TestValidatedItems:
+    """ValidatedItems valida una vez al ingresar y GildedRose no la vuelve a recorrer."""
+
+    def test_rejects_invalid_items_on_ingest(self):
+        with pytest.raises(TypeError, match="deben ser instancias de Item"):
+            ValidatedItems([Item("Valid", 1, 1), "invalid"])
+
+    def test_engines_do_not_rescan(self, monkeypatch):
+        items = ValidatedItems([Item("Valid", 1, 1)])
+
+        def fail(items):
+            raise AssertionError("no debería volver a validar")
+
+        monkeypatch.setattr(GildedRose, "_validate_item_types", staticmethod(fail))
+        GildedRose(items)
+        GildedRose(items).add_items([Item("Other", 1, 1)])
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda items: items.append("invalid"),
+            lambda items: items.extend(["invalid"]),
+            lambda items: items.insert(0, "invalid"),
+            lambda items: items.__setitem__(0, "invalid"),
+            lambda items: items.__setitem__(slice(0, 1), ["invalid"]),
+            lambda items: items.__iadd__(["invalid"]),
+        ],
+    )
+    def test_mutations_are_validated(self, mutate):
+        items = ValidatedItems([Item("Valid", 1, 1)])
+        with pytest.raises(TypeError, match="deben ser instancias de Item"):
+            mutate(items)
+        assert len(items) == 1
+
+    def test_valid_mutations(self):
+        items = ValidatedItems()
+        items.append(Item("a", 1, 1))
+        items.insert(0, Item("b", 1, 1))
+        items[0] = Item("c", 1, 1)
+        items[1:] = [Item("d", 1, 1)]
+        items += [Item("e", 1, 1)]
+
+        assert [item.name for item in items] == ["c", "d", "e"]
+
+    def test_add_items_validates_plain_lists(self):
+        gilded_rose = GildedRose([Item("Valid", 1, 1)])
+        with pytest.raises(TypeError, match="deben ser instancias de Item"):
+            gilded_rose.add_items(["invalid"])
+        gilded_rose = GildedRose(ValidatedItems([Item("Valid", 1, 1)]))
+        with pytest.raises(TypeError, match="deben ser instancias de Item"):
+            gilded_rose.add_items(["invalid"])